@@ -0,0 +1,126 @@
+import ctypes
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Optional
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+
+# 预烘焙资源包: 由 tools/build_bundle.py 离线生成, 运行时整个文件 mmap 进来直接使用
+#   - 图集页面与大图: 已解码的 RGBA32 像素, 用 SDL_CreateSurfaceFrom 直接指向映射内存
+#   - 音效: WAV 已拆成原始 PCM, 用 MIX_LoadRawAudioNoCopy 直接引用映射内存
+#   - 其余音频(ogg 音乐): 原始文件字节, 通过 SDL_IOFromConstMem 交给 SDL_mixer 流式解码
+# 文件布局(小端):
+#   MAGIC(8) | 索引偏移 u64 | 索引长度 u64 | 数据块(16 字节对齐)... | 索引(JSON)
+# 索引:
+#   {"atlas": {"pageSize", "padding", "pages": [{offset, width, height, pitch}], "regions": {名称: [页, x, y, w, h]}},
+#    "images": {名称: {offset, width, height, pitch}},
+#    "sprites": {名称: [w, h]},   # 模版尺寸, 按 GlobalObject.spriteScales 缩小后的结果
+#    "audio": {名称: {offset, size, pcm, format, channels, freq}}}
+# 名称与代码中使用的相对路径一致, 例如 "assets/image/SpaceShip.png"
+
+MAGIC = b"SPBNDL01"
+_HEADER = struct.Struct("<8sQQ")
+_ALIGN = 16
+
+
+class BundleWriter:
+    def __init__(self, path: str):
+        self.file = open(path, "wb")
+        self.file.write(_HEADER.pack(MAGIC, 0, 0))
+
+    def addBlob(self, data: bytes) -> int:
+        # 写入一个数据块, 返回它在文件中的偏移
+        offset = self.file.tell()
+        pad = (-offset) % _ALIGN
+        if pad:
+            self.file.write(b"\0" * pad)
+            offset += pad
+        self.file.write(data)
+        return offset
+
+    def close(self, index: dict) -> None:
+        data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        offset = self.file.tell()
+        self.file.write(data)
+        self.file.seek(0)
+        self.file.write(_HEADER.pack(MAGIC, offset, len(data)))
+        self.file.close()
+
+
+class AssetBundle:
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "rb")
+        # ACCESS_COPY: 写时复制的私有映射, ctypes 才能拿到指针; 只读使用时与只读映射一样不产生拷贝
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, indexOffset, indexSize = _HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an asset bundle")
+        self.index = json.loads(self.map[indexOffset:indexOffset + indexSize].decode("utf-8"))
+        self.buffer = (ctypes.c_char * len(self.map)).from_buffer(self.map)
+        self.base = ctypes.addressof(self.buffer)
+
+    @classmethod
+    def open(cls, path: str) -> Optional["AssetBundle"]:
+        # 资源包不存在时返回 None, 调用方回退到逐个加载 assets/ 下的文件
+        if not Path(path).is_file():
+            return None
+        try:
+            bundle = cls(path)
+        except (OSError, ValueError) as e:
+            log.error("Failed to open asset bundle {}: {}", path, e)
+            return None
+        log.info("Asset bundle {}: {} images, {} audio, {} atlas regions", path, len(bundle.index["images"]),
+                 len(bundle.index["audio"]), len(bundle.index["atlas"]["regions"]))
+        return bundle
+
+    def pointer(self, offset: int) -> ctypes.c_void_p:
+        return ctypes.c_void_p(self.base + offset)
+
+    def createSurface(self, entry: dict):
+        # 直接指向映射内存的 surface, 不拷贝像素; 销毁 surface 不会释放这块内存
+        return sdl.SDL_CreateSurfaceFrom(entry["width"], entry["height"], sdl.SDL_PIXELFORMAT_RGBA32,
+                                         self.pointer(entry["offset"]), entry["pitch"])
+
+    def createTextureFrom(self, renderer: sdl.SDL_Renderer, entry: dict):
+        surface = self.createSurface(entry)
+        if not surface:
+            return None
+        texture = sdl.SDL_CreateTextureFromSurface(renderer, surface)
+        sdl.SDL_DestroySurface(surface)
+        return texture
+
+    def hasAtlas(self) -> bool:
+        return bool(self.index["atlas"]["pages"])
+
+    def hasImage(self, name: str) -> bool:
+        return name in self.index["images"]
+
+    def createTexture(self, renderer: sdl.SDL_Renderer, name: str):
+        return self.createTextureFrom(renderer, self.index["images"][name])
+
+    def hasAudio(self, name: str) -> bool:
+        return name in self.index["audio"]
+
+    def loadAudio(self, mixer: sdl.MIX_Mixer, name: str, predecode: bool = False):
+        entry = self.index["audio"][name]
+        data = self.pointer(entry["offset"])
+        if entry["pcm"]:
+            spec = sdl.SDL_AudioSpec(entry["format"], entry["channels"], entry["freq"])
+            return sdl.MIX_LoadRawAudioNoCopy(mixer, data, entry["size"], ctypes.byref(spec), False)
+        io = sdl.SDL_IOFromConstMem(data, entry["size"])
+        return sdl.MIX_LoadAudio_IO(mixer, io, predecode, True)
+
+    def close(self) -> None:
+        # 必须在引用映射内存的纹理 surface、音频全部释放之后调用
+        self.buffer = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
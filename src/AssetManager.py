@@ -0,0 +1,111 @@
+from typing import Callable, Dict, Optional, Tuple
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+from AssetBundle import AssetBundle
+
+# 资源缓存: 由 Game 持有, 所有场景通过它获取纹理与音频
+# 同一资源只加载一次, 句柄只有 AssetManager 一个所有者, 场景只做引用计数
+#   sound = assets.acquireAudio("assets/sound/eff5.wav")
+#   ...
+#   assets.releaseAudio("assets/sound/eff5.wav")   # 引用归零后释放
+# keepResident=True 的资源引用归零后仍常驻, 场景重启(结束界面按 J、ESC 回标题)时直接复用,
+# 只有 clean() 时才真正销毁
+
+
+class AssetEntry:
+    def __init__(self, handle, kind: str):
+        self.handle = handle
+        self.kind = kind   # "texture" / "audio"
+        self.refs = 0
+        self.pinned = False
+
+
+class AssetManager:
+    def __init__(self, renderer: sdl.SDL_Renderer, mixer: sdl.MIX_Mixer, resolvePath: Callable[[str], str],
+                 bundle: Optional[AssetBundle] = None):
+        self.renderer = renderer
+        self.bundle = bundle  # 预烘焙资源包, 包内有的资源优先从包里取
+        self.mixer = mixer
+        self.resolvePath = resolvePath
+        self.entries: Dict[Tuple[str, str], AssetEntry] = {}  # (类型, 相对路径) -> AssetEntry
+        self.loads = 0   # 实际从磁盘加载的次数
+        self.hits = 0    # 命中缓存的次数
+
+    def acquire(self, kind: str, path: str, loader: Callable[[str], object], keepResident: bool) -> Optional[object]:
+        key = (kind, path)
+        entry = self.entries.get(key)
+        if entry is None:
+            handle = loader(self.resolvePath(path))
+            if not handle:
+                log.error("Failed to load {} {}: {}", kind, path, sdl.SDL_GetError())
+                return None
+            entry = AssetEntry(handle, kind)
+            self.entries[key] = entry
+            self.loads += 1
+        else:
+            self.hits += 1
+        entry.refs += 1
+        entry.pinned = entry.pinned or keepResident
+        return entry.handle
+
+    def release(self, kind: str, path: str) -> None:
+        key = (kind, path)
+        entry = self.entries.get(key)
+        if entry is None or entry.refs <= 0:
+            log.warning("Release of unreferenced {} {}", kind, path)
+            return
+        entry.refs -= 1
+        if entry.refs == 0 and not entry.pinned:
+            self.destroy(entry)
+            del self.entries[key]
+
+    def adopt(self, kind: str, path: str, handle, keepResident: bool = True) -> None:
+        # 接管在别处(预加载线程)创建好的句柄, 之后 acquire 直接命中
+        entry = AssetEntry(handle, kind)
+        if (kind, path) in self.entries:
+            self.destroy(entry)  # 已经同步加载过, 丢弃重复的句柄
+            return
+        entry.pinned = keepResident
+        self.entries[(kind, path)] = entry
+        self.loads += 1
+
+    def acquireTexture(self, path: str, keepResident: bool = False) -> Optional[sdl.SDL_Texture]:
+        if self.bundle is not None and self.bundle.hasImage(path):
+            return self.acquire("texture", path, lambda p: self.bundle.createTexture(self.renderer, path), keepResident)
+        return self.acquire("texture", path, lambda p: sdl.IMG_LoadTexture(self.renderer, p.encode()), keepResident)
+
+    def releaseTexture(self, path: str) -> None:
+        self.release("texture", path)
+
+    def acquireAudio(self, path: str, keepResident: bool = False, predecode: bool = False) -> Optional[sdl.MIX_Audio]:
+        if self.bundle is not None and self.bundle.hasAudio(path):
+            return self.acquire("audio", path, lambda p: self.bundle.loadAudio(self.mixer, path, predecode), keepResident)
+        return self.acquire("audio", path, lambda p: sdl.MIX_LoadAudio(self.mixer, p.encode(), predecode), keepResident)
+
+    def releaseAudio(self, path: str) -> None:
+        self.release("audio", path)
+
+    def pin(self, kind: str, path: str, pinned: bool = True) -> None:
+        entry = self.entries.get((kind, path))
+        if entry is None:
+            return
+        entry.pinned = pinned
+        if not pinned and entry.refs == 0:
+            self.destroy(entry)
+            del self.entries[(kind, path)]
+
+    def destroy(self, entry: AssetEntry) -> None:
+        if entry.kind == "texture":
+            sdl.SDL_DestroyTexture(entry.handle)
+        elif entry.kind == "audio":
+            sdl.MIX_DestroyAudio(entry.handle)
+
+    def stats(self) -> dict:
+        return {"resident": len(self.entries), "loads": self.loads, "hits": self.hits,
+                "referenced": sum(1 for e in self.entries.values() if e.refs > 0)}
+
+    def clean(self) -> None:
+        for entry in self.entries.values():
+            self.destroy(entry)
+        self.entries.clear()
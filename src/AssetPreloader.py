@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+from AssetManager import AssetManager
+from TextureAtlas import TextureAtlas
+
+# 后台预加载: 标题界面期间在线程池里把图片解码为 surface、把音频解码为缓冲,
+# 渲染线程每帧只做一小段工作(拷贝进图集、最后上传纹理), 进入游戏时不再集中解码
+#   preloader = AssetPreloader(atlas, assets, mixer, game.to_abs_path)
+#   preloader.start(["assets/image", "assets/effect"], [("assets/sound/eff5.wav", True)])
+#   preloader.pump(2000000)   # 每帧调用, 参数为本帧允许占用的时间(ns)
+#   preloader.finish()        # 进入游戏前调用, 把没做完的部分同步做完
+# 工作线程里只调用 IMG_Load / MIX_LoadAudio, 纹理一律在渲染线程创建
+
+
+class AssetPreloader:
+    def __init__(self, atlas: TextureAtlas, assets: AssetManager, mixer: sdl.MIX_Mixer,
+                 resolvePath: Callable[[str], str], workers: int = 2):
+        self.atlas = atlas
+        self.assets = assets
+        self.mixer = mixer
+        self.resolvePath = resolvePath
+        self.workers = workers
+        self.executor = None
+        self.imageJobs = []  # (相对路径, future)
+        self.audioJobs = []  # (相对路径, future), 完成并交给 AssetManager 后移除
+        self.audioTotal = 0
+        self.stage = "idle"  # idle -> decode -> blit -> done
+        self.startTime = 0
+
+    def start(self, atlasDirectories: List[str], audio: List[Tuple[str, bool]]) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="preload")
+        self.startTime = sdl.SDL_GetTicksNS()
+        for name, path in self.atlas.scan(atlasDirectories):
+            self.imageJobs.append((name, self.executor.submit(TextureAtlas.loadSurface, path)))
+        for path, predecode in audio:
+            self.audioJobs.append((path, self.executor.submit(self.loadAudio, path, predecode)))
+        self.audioTotal = len(self.audioJobs)
+        self.stage = "decode"
+
+    def loadAudio(self, path: str, predecode: bool):
+        audio = sdl.MIX_LoadAudio(self.mixer, self.resolvePath(path).encode(), predecode)
+        if not audio:
+            log.error("Failed to preload audio {}: {}", path, sdl.SDL_GetError())
+            return None
+        return audio
+
+    @staticmethod
+    def result(future):
+        try:
+            return future.result()
+        except Exception as e:
+            log.error("Preload job failed: {}", e)
+            return None
+
+    def collectAudio(self, wait: bool) -> None:
+        remaining = []
+        for path, future in self.audioJobs:
+            if wait or future.done():
+                audio = self.result(future)
+                if audio:
+                    self.assets.adopt("audio", path, audio)
+            else:
+                remaining.append((path, future))
+        self.audioJobs = remaining
+
+    def pump(self, budgetNs: int) -> None:
+        # 在渲染线程推进预加载, 超出本帧预算就留到下一帧
+        if self.stage in ("idle", "done"):
+            return
+        deadline = sdl.SDL_GetTicksNS() + budgetNs
+        self.collectAudio(False)
+
+        if self.stage == "decode" and all(future.done() for _, future in self.imageJobs):
+            self.atlas.begin([(name, self.result(future)) for name, future in self.imageJobs])
+            self.stage = "blit"
+
+        while self.stage == "blit" and sdl.SDL_GetTicksNS() < deadline:
+            if self.atlas.blitNext(1):
+                self.atlas.upload()
+                self.stage = "upload"
+
+        if self.stage == "upload" and not self.audioJobs:
+            self.complete()
+
+    def finish(self) -> None:
+        # 同步完成剩余工作; 已完成时什么也不做
+        if self.stage in ("idle", "done"):
+            return
+        self.collectAudio(True)
+        if self.stage == "decode":
+            self.atlas.begin([(name, self.result(future)) for name, future in self.imageJobs])
+            self.stage = "blit"
+        if self.stage == "blit":
+            self.atlas.blitNext(len(self.atlas.pending))
+            self.atlas.upload()
+        self.complete()
+
+    def complete(self) -> None:
+        self.stage = "done"
+        self.imageJobs = []
+        self.executor.shutdown(wait=False)
+        self.executor = None
+        log.info("Preload finished in {:.1f} ms", (sdl.SDL_GetTicksNS() - self.startTime) / 1e6)
+
+    def progress(self) -> float:
+        # 0.0 ~ 1.0: 每张图片解码、拷贝各算一步, 每个音频一步, 上传图集一步
+        if self.stage in ("idle", "done"):
+            return 1.0
+        images = len(self.imageJobs)
+        total = images * 2 + self.audioTotal + 1
+        done = self.audioTotal - len(self.audioJobs)
+        if self.stage == "decode":
+            done += sum(1 for _, future in self.imageJobs if future.done())
+        else:
+            done += images + self.atlas.cursor
+        if self.stage == "upload":
+            done += 1
+        return done / total
+
+    def isReady(self) -> bool:
+        # 没有启动(例如资源已从预烘焙资源包载入)也视为就绪
+        return self.stage in ("idle", "done")
+
+    def reportReady(self) -> None:
+        if self.isReady():
+            log.info("Assets were ready before the game started")
+        else:
+            log.info("Assets not ready when the game started: {:.0%} preloaded", self.progress())
+
+    def clean(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        # 还没交出去的结果要自己释放
+        for path, future in self.audioJobs:
+            if not future.cancelled():
+                audio = self.result(future)
+                if audio:
+                    sdl.MIX_DestroyAudio(audio)
+        self.audioJobs = []
+        if self.stage == "decode":
+            for _, future in self.imageJobs:
+                if not future.cancelled():
+                    surface = self.result(future)
+                    if surface:
+                        sdl.SDL_DestroySurface(surface)
+        self.imageJobs = []
+        self.stage = "idle"
@@ -0,0 +1,145 @@
+from typing import Dict, List, Optional
+import sdl3 as sdl
+from sdl3 import SDL_mixer as mix
+
+from Logger import GameLogger as log
+
+audioLog = log.category("audio")
+
+# 音效声部池: N 条 MIX_Track 轮流使用, 新音效不再打断正在播放的其他音效
+#   audio = AudioMixer(mixer, voices=8, gain=0.4)
+#   audio.register("hit", sound, maxVoices=2, priority=0)
+#   audio.play("hit")        # 只是登记, 同一 tick 内同名音效合并为一次
+#   audio.flush()            # 每个 tick 调用一次, 真正发出混音器调用
+#   audio.playLoop(bgmTrack, music)
+# 每个音效有同时发声的上限: 达到上限时重新触发自己最早的那个声部;
+# 没有空闲声部时抢占优先级不高于自己的声部中最早开始的那个, 抢不到就丢弃
+# 每次 flush 的混音器调用次数不超过 声部数 + 2 * 音效种类数, 与本 tick 的事件数量无关
+
+
+class Voice:
+    def __init__(self, track):
+        self.track = track
+        self.name: Optional[str] = None  # 最近一次播放的音效
+        self.priority = 0
+        self.sequence = 0  # 开始播放的先后顺序, 越小越早
+
+
+class SoundConfig:
+    def __init__(self, audio, maxVoices: int, priority: int):
+        self.audio = audio
+        self.maxVoices = maxVoices
+        self.priority = priority
+
+
+class AudioMixer:
+    def __init__(self, mixer: sdl.MIX_Mixer, voices: int = 8, gain: float = 1.0):
+        self.mixer = mixer
+        self.voices: List[Voice] = []
+        for _ in range(voices):
+            track = sdl.MIX_CreateTrack(mixer)
+            if not track:
+                audioLog.error("Failed to create mixer track: {}", sdl.SDL_GetError())
+                break
+            sdl.MIX_SetTrackGain(track, gain)
+            self.voices.append(Voice(track))
+        self.sounds: Dict[str, SoundConfig] = {}
+        self.pending: Dict[str, SoundConfig] = {}  # 本 tick 请求播放的音效, 同名只保留一个
+        self.sequence = 0
+        # 循环播放的属性只创建一次
+        self.loopProps = sdl.SDL_CreateProperties()
+        if not sdl.SDL_SetNumberProperty(self.loopProps, mix.MIX_PROP_PLAY_LOOPS_NUMBER, -1):
+            audioLog.error("Failed to set loop property: {}", sdl.SDL_GetError())
+        # 统计
+        self.requests = 0
+        self.played = 0
+        self.coalesced = 0
+        self.retriggered = 0  # 达到同名上限, 重新触发自己的声部
+        self.stolen = 0  # 抢占了其他音效的声部
+        self.dropped = 0
+
+    def register(self, name: str, audio, maxVoices: int = 2, priority: int = 0) -> None:
+        self.sounds[name] = SoundConfig(audio, maxVoices, priority)
+
+    def unregister(self, name: str) -> None:
+        self.sounds.pop(name, None)
+        self.pending.pop(name, None)
+        for voice in self.voices:
+            if voice.name == name:
+                sdl.MIX_StopTrack(voice.track, 0)
+                voice.name = None
+
+    def play(self, name: str) -> None:
+        config = self.sounds.get(name)
+        if config is None:
+            audioLog.error("Sound {} not found!", name)
+            return
+        self.requests += 1
+        if name in self.pending:
+            self.coalesced += 1
+            return
+        self.pending[name] = config
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        # 声部状态每次 flush 只查询一次; 停止播放的声部视为空闲
+        for voice in self.voices:
+            if voice.name is not None and not sdl.MIX_TrackPlaying(voice.track):
+                voice.name = None
+        # 优先级高的先分配声部
+        for name, config in sorted(self.pending.items(), key=lambda item: -item[1].priority):
+            voice = self.pickVoice(name, config)
+            if voice is None:
+                self.dropped += 1
+                continue
+            if voice.name == name:
+                self.retriggered += 1
+            elif voice.name is not None:
+                self.stolen += 1
+            self.start(voice, name, config)
+        self.pending.clear()
+
+    def pickVoice(self, name: str, config: SoundConfig) -> Optional[Voice]:
+        same = [voice for voice in self.voices if voice.name == name]
+        if len(same) >= config.maxVoices:
+            return min(same, key=lambda voice: voice.sequence)
+        for voice in self.voices:
+            if voice.name is None:
+                return voice
+        candidates = [voice for voice in self.voices if voice.priority <= config.priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda voice: (voice.priority, voice.sequence))
+
+    def start(self, voice: Voice, name: str, config: SoundConfig) -> None:
+        self.sequence += 1
+        voice.name = name
+        voice.priority = config.priority
+        voice.sequence = self.sequence
+        mix.MIX_SetTrackAudio(voice.track, config.audio)
+        if not sdl.MIX_PlayTrack(voice.track, 0):
+            audioLog.error("Failed to play sound {}: {}", name, sdl.SDL_GetError())
+            voice.name = None
+            return
+        self.played += 1
+
+    def playLoop(self, track, audio) -> bool:
+        # 在指定 track 上无限循环播放(背景音乐)
+        mix.MIX_SetTrackAudio(track, audio)
+        return sdl.MIX_PlayTrack(track, self.loopProps)
+
+    def stats(self) -> dict:
+        return {"voices": len(self.voices), "requests": self.requests, "played": self.played,
+                "coalesced": self.coalesced, "retriggered": self.retriggered, "stolen": self.stolen,
+                "dropped": self.dropped}
+
+    def clean(self) -> None:
+        for voice in self.voices:
+            sdl.MIX_DestroyTrack(voice.track)
+        self.voices.clear()
+        self.sounds.clear()
+        self.pending.clear()
+        if self.loopProps:
+            sdl.SDL_DestroyProperties(self.loopProps)
+            self.loopProps = 0
@@ -0,0 +1,45 @@
+import numpy as np
+
+# 碰撞检测: 全部与 SDL_HasRectIntersection 的语义保持一致
+#   - 坐标先截断为整数(与原先构造 SDL_Rect(int(x), int(y), w, h) 相同)
+#   - 宽或高 <= 0 的空矩形不与任何矩形相交
+#   - 边缘相接不算相交
+
+
+def rectIntersects(ax: int, ay: int, aw: int, ah: int, bx: int, by: int, bw: int, bh: int) -> bool:
+    # 逐对的参考实现, tools/bench_collision.py 用它校验批量版本
+    if aw <= 0 or ah <= 0 or bw <= 0 or bh <= 0:
+        return False
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def overlapsRect(xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray,
+                 bx: int, by: int, bw: int, bh: int) -> np.ndarray:
+    # 一组矩形与单个矩形, 返回布尔掩码
+    if bw <= 0 or bh <= 0:
+        return np.zeros(len(xs), bool)
+    ax = xs.astype(np.int32)
+    ay = ys.astype(np.int32)
+    return (ws > 0) & (hs > 0) & (ax < bx + bw) & (bx < ax + ws) & (ay < by + bh) & (by < ay + hs)
+
+
+def overlapPairs(ax: np.ndarray, ay: np.ndarray, aw: np.ndarray, ah: np.ndarray,
+                 bx: np.ndarray, by: np.ndarray, bw: np.ndarray, bh: np.ndarray) -> np.ndarray:
+    # 逐元素检测 A[i] 与 B[i], 用于粗筛(SpatialHash)之后的精确检测
+    ax = ax.astype(np.int32)
+    ay = ay.astype(np.int32)
+    bx = bx.astype(np.int32)
+    by = by.astype(np.int32)
+    return ((aw > 0) & (ah > 0) & (bw > 0) & (bh > 0)
+            & (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah))
+
+
+def firstHitsOfPairs(a: np.ndarray, b: np.ndarray):
+    # a, b 为已确认相交的对, 按 a 升序、同一 a 内 b 升序排列(SpatialHash.queryMany 的输出顺序)
+    # 每个 A 只保留下标最大的 B, 与原先的逐对倒序遍历 + break 等价(tools/bench_collision.py 校验)
+    if a.size == 0:
+        return a, b
+    last = np.empty(a.size, bool)
+    last[:-1] = a[1:] != a[:-1]
+    last[-1] = True
+    return a[last], b[last]
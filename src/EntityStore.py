@@ -0,0 +1,159 @@
+import numpy as np
+
+# 列式(SoA)实体存储: 每个字段是一条连续数组, 有效数据位于 [0, count)
+# 移动/碰撞等逻辑直接对整列做向量化运算, 不再逐对象写 ctypes 属性
+# 同时充当该类实体的对象池: 构造时按 capacity 预热, 之后 acquire 只是复用槽位,
+# 只有超过容量需要扩容时才会分配内存(记为一次 miss)
+#   store = EntityStore(64)
+#   i = store.acquire()                   # 槽位里是旧数据, 调用方负责写入用到的字段
+#   store.posX[i] = 10
+#   s = store.spawnMany(3, posX=xs, posY=20)  # 批量追加, 未给出的字段清零
+#   n = store.count
+#   store.posY[:n] += store.speed[:n] * deltaTime
+# 删除采用墓碑 + 延迟压缩: release 只把槽位标记为 dead(O(1)/个), 本帧内其余逻辑用
+# liveMask() 跳过它们, 每帧结束时调用一次 compact() 统一回收
+#   store.release(np.array([3, 7]))
+#   store.deadThisFrame()                 # -> array([3, 7])
+#   store.compact()
+# 固定步长模拟下, 每个 tick 开始时 snapshot() 记下上一 tick 的位置, 渲染时在两者之间插值
+#   xs, ys = store.interpolate(alpha)     # alpha ∈ [0, 1]
+# 本 tick 新生成的实体没有上一 tick 的位置(prevX 为 NaN), 插值时直接使用当前位置
+
+
+class EntityStore:
+
+    # 字段名 -> dtype; 位置与方向和 SDL_FPoint 一样用 float32, 时间(ns)用 float64
+    FIELDS = {
+        "posX": np.float32,
+        "posY": np.float32,
+        "dirX": np.float32,
+        "dirY": np.float32,
+        "speed": np.float32,
+        "width": np.int32,
+        "height": np.int32,
+        "health": np.int32,
+        "damage": np.int32,
+        "bounce": np.int32,
+        "type": np.int32,
+        "frame": np.float32,
+        "timer": np.float64,
+        "coolDown": np.float64,
+        "dead": np.bool_,  # 墓碑标记
+        "prevX": np.float32,  # 上一 tick 的位置, 用于渲染插值
+        "prevY": np.float32,
+    }
+    # spawnMany 未给出的字段默认值, 其余字段清零
+    DEFAULTS = {"prevX": np.nan, "prevY": np.nan}
+
+    def __init__(self, capacity: int = 64):
+        self.count = 0
+        self.capacity = max(1, int(capacity))
+        for name, dtype in self.FIELDS.items():
+            setattr(self, name, np.zeros(self.capacity, dtype))
+        # 池统计
+        self.highWater = 0  # 同时存活数量的峰值
+        self.misses = 0     # 容量不足导致扩容的次数
+        self.acquired = 0   # 累计取出的槽位数
+        self.released = []  # 本帧内 release 的下标数组, compact 时清空
+
+    def __len__(self) -> int:
+        return self.count
+
+    def acquire(self) -> int:
+        if self.count >= self.capacity:
+            self.misses += 1
+            self.reserve(self.capacity * 2)
+        i = self.count
+        self.dead[i] = False
+        self.prevX[i] = np.nan
+        self.prevY[i] = np.nan
+        self.count += 1
+        self.acquired += 1
+        if self.count > self.highWater:
+            self.highWater = self.count
+        return i
+
+    def release(self, indices: np.ndarray) -> None:
+        # 只打墓碑, 真正回收在 compact 中统一进行; 同一实体重复 release 无副作用
+        if len(indices) == 0:
+            return
+        indices = np.asarray(indices)
+        fresh = indices[~self.dead[indices]]
+        if fresh.size:
+            self.dead[fresh] = True
+            self.released.append(fresh)
+
+    def liveMask(self) -> np.ndarray:
+        return ~self.dead[:self.count]
+
+    def deadThisFrame(self) -> np.ndarray:
+        # 上次 compact 之后被 release 的实体下标(按 release 顺序)
+        if not self.released:
+            return np.zeros(0, np.intp)
+        if len(self.released) == 1:
+            return self.released[0]
+        return np.concatenate(self.released)
+
+    def compact(self) -> None:
+        # 一次性移除全部墓碑, 保持存活实体的相对顺序(碰撞判定依赖下标顺序)
+        if self.released:
+            self.keep(~self.dead[:self.count])
+            self.released.clear()
+
+    def spawnMany(self, n: int, **values) -> slice:
+        # 批量追加 n 个实体, values 中的值可以是标量或长度为 n 的数组
+        if n <= 0:
+            return slice(self.count, self.count)
+        if self.count + n > self.capacity:
+            self.misses += 1
+            self.reserve(max(self.capacity * 2, self.count + n))
+        s = slice(self.count, self.count + n)
+        for name in self.FIELDS:
+            getattr(self, name)[s] = values.get(name, self.DEFAULTS.get(name, 0))
+        self.count += n
+        self.acquired += n
+        if self.count > self.highWater:
+            self.highWater = self.count
+        return s
+
+    def snapshot(self) -> None:
+        n = self.count
+        self.prevX[:n] = self.posX[:n]
+        self.prevY[:n] = self.posY[:n]
+
+    def interpolate(self, alpha: float):
+        # 上一 tick 与当前 tick 之间的渲染位置
+        n = self.count
+        x = self.posX[:n]
+        y = self.posY[:n]
+        px = self.prevX[:n]
+        py = self.prevY[:n]
+        fresh = np.isnan(px)
+        px = np.where(fresh, x, px)
+        py = np.where(fresh, y, py)
+        return px + (x - px) * alpha, py + (y - py) * alpha
+
+    def keep(self, mask: np.ndarray) -> None:
+        # 按掩码压缩: 保留 mask 为 True 的实体, 保持原有顺序
+        n = self.count
+        if mask.all():
+            return
+        m = int(np.count_nonzero(mask))
+        for name in self.FIELDS:
+            column = getattr(self, name)
+            column[:m] = column[:n][mask]
+        self.count = m
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+        for name in self.FIELDS:
+            column = getattr(self, name)
+            grown = np.zeros(capacity, column.dtype)
+            grown[:self.count] = column[:self.count]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def stats(self) -> dict:
+        return {"live": self.count, "highWater": self.highWater, "misses": self.misses,
+                "acquired": self.acquired, "capacity": self.capacity}
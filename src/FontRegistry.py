@@ -0,0 +1,32 @@
+from typing import Callable, Optional
+import sdl3 as sdl
+from sdl3 import SDL_ttf as ttf
+
+from Logger import GameLogger as log
+
+# 字体注册表: 每个 (字体文件, 字号) 只打开一次, 各场景共享同一个 TTF_Font
+# 字号固定, 不再对共享字体调用 TTF_SetFontSize(会清空字体内部的字形缓存)
+#   fonts = FontRegistry(game.to_abs_path)
+#   font = fonts.get("assets/font/VonwaonBitmap-16px.ttf", 32)
+
+
+class FontRegistry:
+    def __init__(self, resolvePath: Callable[[str], str]):
+        self.resolvePath = resolvePath
+        self.fonts = {}  # (字体路径, 字号) -> TTF_Font
+
+    def get(self, path: str, size: int) -> Optional[ttf.TTF_Font]:
+        key = (path, int(size))
+        font = self.fonts.get(key)
+        if font is None:
+            font = ttf.TTF_OpenFont(self.resolvePath(path).encode(), float(key[1]))
+            if font is None:
+                log.error("SDL_ttf could not open font {}! SDL_ttf Error:: {}", path, sdl.SDL_GetError())
+                return None
+            self.fonts[key] = font
+        return font
+
+    def clean(self) -> None:
+        for font in self.fonts.values():
+            ttf.TTF_CloseFont(font)
+        self.fonts.clear()
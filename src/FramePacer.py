@@ -0,0 +1,77 @@
+import numpy as np
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+
+# 帧率控制, 三种模式:
+#   "vsync"    : SDL_SetRenderVSync, 由 SDL_RenderPresent 等待垂直同步
+#   "capped"   : 先粗睡到截止时间前 spinNs, 剩下的用 SDL_GetTicksNS 自旋, 误差在微秒级
+#   "uncapped" : 不等待, 用于性能测试
+# 截止时间按固定间隔往后推(而不是"本帧开始 + 帧时长"), 单帧的误差不会累积
+#   pacer = FramePacer(renderer, "capped", 60)
+#   while running:
+#       ...
+#       dt = pacer.wait()   # 本帧的实际耗时(秒)
+#   pacer.report()          # 输出帧时间 p50/p99
+
+MODES = ("vsync", "capped", "uncapped")
+
+
+class FramePacer:
+    def __init__(self, renderer: sdl.SDL_Renderer, mode: str, fps: int, spinNs: int = 2000000,
+                 historySize: int = 1024):
+        if mode not in MODES:
+            log.warning("Unknown frame pacing mode {}, using capped", mode)
+            mode = "capped"
+        self.renderer = renderer
+        self.mode = mode
+        self.frameNs = int(1e9 / fps)
+        self.spinNs = spinNs
+        self.deadline = 0
+        self.lastFrame = 0
+        # 最近 historySize 帧的帧时间(ns), 环形缓冲
+        self.history = np.zeros(historySize, np.int64)
+        self.frames = 0
+
+    def start(self) -> None:
+        if not sdl.SDL_SetRenderVSync(self.renderer, 1 if self.mode == "vsync" else sdl.SDL_RENDERER_VSYNC_DISABLED):
+            if self.mode == "vsync":
+                log.warning("VSync not supported: {}, using capped", sdl.SDL_GetError())
+                self.mode = "capped"
+        self.lastFrame = sdl.SDL_GetTicksNS()
+        self.deadline = self.lastFrame + self.frameNs
+        log.info("Frame pacing: {}", self.mode)
+
+    def wait(self) -> float:
+        # 在 SDL_RenderPresent 之后调用, 返回上一帧到本帧的时间(秒)
+        if self.mode == "capped":
+            now = sdl.SDL_GetTicksNS()
+            if now > self.deadline + self.frameNs:
+                # 落后超过一帧(卡顿、拖动窗口), 重新对齐, 不追赶
+                self.deadline = now
+            remaining = self.deadline - now - self.spinNs
+            if remaining > 0:
+                sdl.SDL_DelayNS(remaining)
+            while sdl.SDL_GetTicksNS() < self.deadline:
+                pass
+            self.deadline += self.frameNs
+
+        now = sdl.SDL_GetTicksNS()
+        frameTime = now - self.lastFrame
+        self.lastFrame = now
+        self.history[self.frames % len(self.history)] = frameTime
+        self.frames += 1
+        return frameTime / 1e9
+
+    def stats(self) -> dict:
+        # 帧时间分位数(ms); jitter 为 p99 与 p50 之差
+        samples = self.history[:min(self.frames, len(self.history))] / 1e6
+        if len(samples) == 0:
+            return {"frames": 0}
+        p50, p99 = np.percentile(samples, [50, 99])
+        return {"mode": self.mode, "frames": self.frames, "mean": round(float(samples.mean()), 3),
+                "p50": round(float(p50), 3), "p99": round(float(p99), 3),
+                "jitter": round(float(p99 - p50), 3), "stddev": round(float(samples.std()), 3)}
+
+    def report(self) -> None:
+        log.info("Frame time (ms): {}", self.stats())
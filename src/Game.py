@@ -2,13 +2,32 @@ import sdl3 as sdl
 from sdl3 import SDL_ttf as ttf
 from sdl3 import SDL_mixer as mix
 from typing import Optional
-from ctypes import c_float, byref
 from pathlib import Path
 
 from Logger import GameLogger as log
 from Scene import Scene
 from SceneTitle import SceneTitle
-from Object import GlobalObject,Background
+from Object import GlobalObject
+from GlyphAtlas import GlyphAtlas
+from FontRegistry import FontRegistry
+from TextCache import TextCache
+from TextureAtlas import TextureAtlas
+from AssetManager import AssetManager
+from AssetBundle import AssetBundle
+from AssetPreloader import AssetPreloader
+from FramePacer import FramePacer
+from Profiler import Profiler
+from Telemetry import Telemetry, EVENT_FRAME
+from SceneMain import SOUND_PATHS
+from Starfield import Starfield
+from LeaderBoard import LeaderBoard
+from ScoreStore import ScoreStore
+from AudioMixer import AudioMixer
+from Localizer import Localizer, LocalizedText
+
+TEXT_FONT = "assets/font/VonwaonBitmap-16px.ttf"
+PROFILER_FONT = "assets/font/VonwaonBitmap-12px.ttf"
+LANG_DIRECTORY = "assets/lang"
 
 class Game:
     def __init__(self):
@@ -17,8 +36,20 @@ class Game:
         self.windowHeight = self.GlobalSettings.windowHeight
         self.FPS = self.GlobalSettings.FPS
         self.Version = self.GlobalSettings.Version
-        self.frameTime = 0.0   
-        self.deltaTime = 0.0  
+        self.deltaTime = 0.0  # 上一帧的实际耗时(秒), 由 FramePacer 统计
+        self.pacing = self.GlobalSettings.framePacing
+        self.pacer: Optional[FramePacer] = None
+        # 分阶段耗时统计, F3 切换叠加显示
+        self.profiler = Profiler(self.GlobalSettings.profilerCapacity, self.GlobalSettings.profilerEnabled)
+        self.showProfiler = False
+        # 逐事件的二进制遥测, 默认关闭(main.py --telemetry 打开)
+        self.telemetry = Telemetry(self.GlobalSettings.telemetryCapacity, self.GlobalSettings.telemetryEnabled)
+        self.recordPath: Optional[str] = None  # 把每局的输入录到这个文件(按局编号: xxx-001.rec, xxx-002.rec...)
+        self.recordCount = 0  # 本次运行已开始录制的局数
+        self.replayPath: Optional[str] = None  # 开局时回放这个录像文件
+        self.tickTime = 1.0 / self.GlobalSettings.tickRate  # 固定模拟步长(秒)
+        self.accumulator = 0.0  # 尚未模拟的时间(秒)
+        self.renderAlpha = 1.0  # 渲染插值系数: 当前画面处于上一 tick 与当前 tick 之间的位置
         self.finalScore: Optional[int] = 0
         self.currentScene: Optional[Scene] = None
         self.isRunning = True
@@ -29,25 +60,33 @@ class Game:
         self.renderer:Optional[sdl.SDL_Renderer] = None
         self.mixer:Optional[sdl.MIX_Mixer] = None
         self.bgmTrack: Optional[sdl.MIX_Track] = None
-        self.musicTrack: Optional[sdl.MIX_Track] = None
-        self.nearStars = None
-        self.farStars = None
+        self.audio: Optional[AudioMixer] = None  # 音效声部池
+        self.starfield: Optional[Starfield] = None
         self.titleFont: Optional[sdl.TTF_Font] = None
         self.textFont: Optional[sdl.TTF_Font] = None
-        self.leaderBoard = {}
-        self.language = ["en","zh"]
-        self.localizeLib = {}
+        self.fonts: Optional[FontRegistry] = None
+        self.textCache: Optional[TextCache] = None  # 静态文字纹理 LRU
+        self.glyphAtlases = {}   # (字体路径, 字号) -> GlyphAtlas, 用于每帧变化的文字
+        self.spriteAtlas: Optional[TextureAtlas] = None
+        self.assets: Optional[AssetManager] = None
+        self.bundle: Optional[AssetBundle] = None
+        self.preloader: Optional[AssetPreloader] = None
+        self.pathCache = {}  # 相对路径 -> 绝对路径, 避免反复 Path.resolve()
+        self.scores: Optional[ScoreStore] = None  # 历史成绩库, 排行榜是它的前 K 名
+        self.finalRun = (0.0, 0, 0)  # 本局的 时长(秒), 击毁数, 种子
+        self.localization: Optional[Localizer] = None
 
     def init(self):
         # 初始化 logger
         log.set_level("Debug")
         log.set_detailed(False)
+        for category, level in self.GlobalSettings.logLevels.items():
+            log.set_level(level, category)
+        log.set_rate_limit(self.GlobalSettings.logRateBurst, self.GlobalSettings.logRateWindow)
 
         # 初始化本地化
         self.initLocalizer()
 
-        self.frameTime = 1000000000.0 / self.FPS
-
         # 初始化视频子系统
         if not sdl.SDL_Init(sdl.SDL_INIT_VIDEO):
             log.error("SDL_Init failed")
@@ -65,6 +104,13 @@ class Game:
             self.isRunning = False
             log.error("SDL_CreateRenderer failed")     
 
+        # 帧率控制: vsync / capped / uncapped
+        self.pacer = FramePacer(self.getRenderer(), self.pacing, self.FPS, self.GlobalSettings.pacingSpinNs)
+
+        # 遥测写线程
+        self.telemetry.open(self._save_path(self.GlobalSettings.telemetryDirectory),
+                            self.GlobalSettings.telemetryMaxBytes, self.GlobalSettings.telemetryMaxFiles)
+
         # 设置逻辑分辨率 不管屏幕分辨率 不管屏幕大小
         sdl.SDL_SetRenderLogicalPresentation(self.getRenderer(),self.windowWidth,self.windowHeight,
                                              sdl.SDL_LOGICAL_PRESENTATION_INTEGER_SCALE)
@@ -86,48 +132,48 @@ class Game:
             self.isRunning = False
             log.error("SDL_mixer could not initialize! SDL_mixer Error: {}", sdl.SDL_GetError())
 
-        self.musicTrack = sdl.MIX_CreateTrack(self.mixer)
-        if not self.musicTrack:
+        self.audio = AudioMixer(self.mixer, self.GlobalSettings.sfxVoices, 0.4)
+        if not self.audio.voices:
             self.isRunning = False
             log.error("SDL_mixer could not initialize! SDL_mixer Error: {}", sdl.SDL_GetError())
 
         # 设置整体音量
         sdl.MIX_SetMasterGain(self.mixer, 0.2)
         sdl.MIX_SetTrackGain(self.bgmTrack, 0.5)
-        sdl.MIX_SetTrackGain(self.musicTrack, 0.4)
 
         # 初始化SDL_ttf
         if ttf.TTF_Init() == -1:
             self.isRunning = False
             log.error("SDL_ttf could not initialize! SDL_ttf Error: {}", sdl.SDL_GetError())
 
-        # 初始化背景卷轴
-        w = c_float()
-        h = c_float()
-        self.nearStars = Background()
-        self.nearStars.texture = sdl.IMG_LoadTexture(self.getRenderer(),self.to_abs_path("assets/image/Stars-A.png").encode())
-        if self.nearStars.texture is None:
-            self.isRunning = False
-            log.error("SDL_image could not initialize! SDL_image Error:: {}", sdl.SDL_GetError())
+        # 资源缓存, 各场景共享; 有预烘焙资源包时优先从包里取
+        self.bundle = AssetBundle.open(self.to_abs_path(self.GlobalSettings.bundlePath))
+        self.assets = AssetManager(self.getRenderer(), self.getMixer(), self.to_abs_path, self.bundle)
 
-        sdl.SDL_GetTextureSize(self.nearStars.texture, byref(w), byref(h))
-        self.nearStars.width = int(w.value / 2)
-        self.nearStars.height = int(h.value / 2)
-
-        self.farStars = Background()
-        self.farStars.texture = sdl.IMG_LoadTexture(self.getRenderer(),self.to_abs_path("assets/image/Stars-B.png").encode())
-        if self.farStars.texture is None:
+        # 初始化背景卷轴(每层预合成为一张渲染目标)
+        self.starfield = Starfield(self.getRenderer(), self.assets, self.windowWidth, self.windowHeight,
+                                   self.GlobalSettings.backgroundLayers)
+        if len(self.starfield.layers) != len(self.GlobalSettings.backgroundLayers):
             self.isRunning = False
             log.error("SDL_image could not initialize! SDL_image Error:: {}", sdl.SDL_GetError())
 
-        sdl.SDL_GetTextureSize(self.farStars.texture, byref(w), byref(h))
-        self.farStars.width = int(w.value / 2)
-        self.farStars.height = int(h.value / 2)
-        self.farStars.speed = 20
+        # 精灵纹理图集与游戏音效在标题界面期间后台预加载, 各场景共用
+        self.spriteAtlas = TextureAtlas(self.getRenderer(), self.to_abs_path, self.GlobalSettings.atlasPageSize)
+        self.preloader = AssetPreloader(self.spriteAtlas, self.assets, self.getMixer(), self.to_abs_path,
+                                        self.GlobalSettings.preloadWorkers)
+        if self.bundle is not None and self.bundle.hasAtlas():
+            # 资源包里已是解码好的像素与 PCM, 直接载入, 无需后台预加载
+            self.spriteAtlas.loadBundle(self.bundle)
+        else:
+            # 音效预解码为 PCM, 背景音乐仍按流式播放
+            self.preloader.start(self.GlobalSettings.atlasDirectories,
+                                 [(path, not path.startswith("assets/music/")) for path in SOUND_PATHS.values()])
 
         # 载入标题场景字体
-        self.titleFont = ttf.TTF_OpenFont(self.to_abs_path("assets/font/VonwaonBitmap-16px.ttf").encode(), 64)
-        self.textFont = ttf.TTF_OpenFont(self.to_abs_path("assets/font/VonwaonBitmap-16px.ttf").encode(), 32)
+        self.fonts = FontRegistry(self.to_abs_path)
+        self.textCache = TextCache(self.getRenderer(), self.GlobalSettings.textCacheCapacity)
+        self.titleFont = self.fonts.get(TEXT_FONT, 64)
+        self.textFont = self.fonts.get(TEXT_FONT, 32)
         if self.titleFont is None or self.textFont is None:
             self.isRunning = False
             log.error("SDL_ttf could not initialize! SDL_ttf Error:: {}", sdl.SDL_GetError())        
@@ -135,6 +181,7 @@ class Game:
         self.currentScene = SceneTitle(self)
         self.currentScene.init()
 
+        self.scores = ScoreStore(self._save_path(self.GlobalSettings.scoreDbPath), 8)
         self.loadData()
 
     def clean(self):
@@ -142,59 +189,100 @@ class Game:
             self.currentScene.clean()
             self.currentScene = None
 
-        if self.nearStars is not None:
-            sdl.SDL_DestroyTexture(self.nearStars.texture)
-            self.nearStars = None
-        if self.farStars is not None:
-            sdl.SDL_DestroyTexture(self.farStars.texture)
-            self.farStars = None
-
-        if self.titleFont is not None:
-            ttf.TTF_CloseFont(self.titleFont)
-
-        if self.textFont is not None:
-            ttf.TTF_CloseFont(self.textFont)
+        # 背景贴图归 AssetManager 所有, 渲染目标归 Starfield
+        if self.starfield is not None:
+            self.starfield.clean()
+            self.starfield = None
+        # 先等预加载线程退出, 再释放资源
+        if self.preloader is not None:
+            self.preloader.clean()
+            self.preloader = None
+
+        if self.assets is not None:
+            log.info("Assets: {}", self.assets.stats())
+            self.assets.clean()
+            self.assets = None
+
+        if self.spriteAtlas is not None:
+            self.spriteAtlas.clean()
+            self.spriteAtlas = None
+
+        for atlas in self.glyphAtlases.values():
+            atlas.clean()
+        self.glyphAtlases.clear()
+
+        if self.textCache is not None:
+            log.info("Text cache: {}", self.textCache.stats())
+            self.textCache.clean()
+            self.textCache = None
+
+        if self.fonts is not None:
+            self.fonts.clean()
+            self.fonts = None
+        self.titleFont = None
+        self.textFont = None
 
         sdl.MIX_DestroyTrack(self.bgmTrack)
-        sdl.MIX_DestroyTrack(self.musicTrack)
+        if self.audio is not None:
+            log.info("Audio: {}", self.audio.stats())
+            self.audio.clean()
+            self.audio = None
         sdl.MIX_DestroyMixer(self.mixer)
         sdl.MIX_Quit()
 
+        # 音频可能直接引用资源包的映射内存, 混音器销毁后才能解除映射
+        if self.bundle is not None:
+            self.bundle.close()
+            self.bundle = None
+
         sdl.TTF_Quit()
 
         sdl.SDL_DestroyRenderer(self.renderer)
         sdl.SDL_DestroyWindow(self.window)
         sdl.SDL_Quit()
+        # 被限流的日志条数
+        log.flush_suppressed()
 
     def run(self):
+        self.pacer.start()
+        lastFrame = sdl.SDL_GetTicksNS()
+        prof = self.profiler
         while self.isRunning:
             frameStart = sdl.SDL_GetTicksNS()
             event = sdl.SDL_Event()
+            prof.begin("event")
             self.handleEvent(event)
-            self.update(self.deltaTime)
-            self.render()
-            frameEnd = sdl.SDL_GetTicksNS()
-            diff = frameEnd - frameStart  # nanoseconds
-            if diff < self.frameTime:
-                # 需要睡眠剩余时间以控制帧率，计算为毫秒并使用 SDL_Delay
-                sleep_ns = int(self.frameTime - diff)
-                sleep_ms = int(sleep_ns / 1000000)
-                if sleep_ms > 0:
-                    sdl.SDL_Delay(sleep_ms)     
-                # 使用目标帧时间作为 delta（秒）
-                self.deltaTime = self.frameTime / 1.0e9
-            else:
-                # 使用实际耗时（秒）
-                self.deltaTime = diff / 1.0e9
-
-            # 保护性约束：防止 deltaTime 为 0 或异常巨大
-            if self.deltaTime <= 0:
-                self.deltaTime = 1.0 / self.FPS
-            max_dt = 0.5
-            if self.deltaTime > max_dt:
-                self.deltaTime = max_dt
+            prof.end("event")
+
+            # 固定步长: 按实际经过的时间累积, 每帧模拟 0..N 个 tick, 与渲染帧率无关
+            self.accumulator += min((frameStart - lastFrame) / 1.0e9, self.GlobalSettings.maxFrameTime)
+            lastFrame = frameStart
+            ticks = 0
+            prof.begin("update")
+            while self.accumulator >= self.tickTime and ticks < self.GlobalSettings.maxTicksPerFrame:
+                self.update(self.tickTime)
+                self.accumulator -= self.tickTime
+                ticks += 1
+            prof.end("update")
+            if ticks == self.GlobalSettings.maxTicksPerFrame:
+                # 追不上时丢弃积压, 避免越积越多
+                self.accumulator = min(self.accumulator, self.tickTime)
+            self.renderAlpha = self.accumulator / self.tickTime
 
+            self.render()
+            prof.begin("wait")
+            self.deltaTime = self.pacer.wait()
+            prof.end("wait")
+            if prof.enabled:
+                prof.count("ticks", ticks)
+                prof.count("frame", self.deltaTime * 1000)
+                prof.endFrame()
+            self.telemetry.record(EVENT_FRAME, 0.0, 0.0, self.deltaTime * 1000, ticks, 0)
             # log.debug("FPS: {} ", 1 / self.deltaTime)
+        self.pacer.report()
+        self.telemetry.close()
+        if prof.frames > 0 and self.GlobalSettings.profilerExportPath:
+            prof.export(str(self._save_path(self.GlobalSettings.profilerExportPath)))
         self.saveData()
 
     def handleEvent(self,event : sdl.SDL_Event):
@@ -208,6 +296,13 @@ class Game:
                         sdl.SDL_SetWindowFullscreen(self.window, sdl.SDL_WINDOW_FULLSCREEN)
                     else:
                         sdl.SDL_SetWindowFullscreen(self.window, 0)
+                if event.key.scancode == sdl.SDL_SCANCODE_F3:
+                    # 打开叠加显示的同时开始记录, 之后一直记录到退出
+                    self.showProfiler = not self.showProfiler
+                    self.profiler.enabled = self.profiler.enabled or self.showProfiler
+            if event.type in (sdl.SDL_EVENT_RENDER_TARGETS_RESET, sdl.SDL_EVENT_RENDER_DEVICE_RESET):
+                # 渲染目标的内容丢失, 重新合成背景
+                self.starfield.rebuild()
             self.currentScene.handle_event(event)
 
     def update(self, deltaTime : float):
@@ -218,10 +313,37 @@ class Game:
         self.currentScene.update(deltaTime)
 
     def render(self):
+        prof = self.profiler
+        prof.begin("render")
         sdl.SDL_RenderClear(self.renderer)
         self.renderBackground()    
         self.currentScene.render()
+        if self.showProfiler:
+            self.renderProfiler()
+        prof.end("render")
+        prof.begin("present")
         sdl.SDL_RenderPresent(self.renderer)
+        prof.end("present")
+
+    def renderProfiler(self):
+        # 左下角显示最近 60 帧的平均耗时(ms)与最新的计数
+        atlas = self.getGlyphAtlas(PROFILER_FONT, 12)
+        if atlas is None:
+            return
+        lines = [f"{name:<22}{value:>8.0f}" if name in self.profiler.counters else f"{name:<22}{value:>8.3f}"
+                 for name, value in self.profiler.summary().items()]
+        if not lines:
+            return
+        lineHeight = atlas.lineHeight
+        x = 8
+        y = self.getWindowHeight() - 8 - lineHeight * len(lines)
+        sdl.SDL_SetRenderDrawBlendMode(self.getRenderer(), sdl.SDL_BLENDMODE_BLEND)
+        sdl.SDL_SetRenderDrawColor(self.getRenderer(), 0, 0, 0, 160)
+        sdl.SDL_RenderFillRect(self.getRenderer(), sdl.SDL_FRect(x - 4, y - 4, 240, lineHeight * len(lines) + 8))
+        for line in lines:
+            atlas.draw(line, x, y, flush=False)
+            y += lineHeight
+        atlas.flush()
 
     def changeScene(self, scene):
         if self.currentScene is scene:
@@ -250,17 +372,40 @@ class Game:
     def getBGMTrack(self):
         return self.bgmTrack
 
-    def getMusicTrack(self):
-        return self.musicTrack
+    def getAudio(self) -> AudioMixer:
+        return self.audio
+
+    def getAssets(self) -> AssetManager:
+        return self.assets
+
+    def getPreloader(self) -> AssetPreloader:
+        return self.preloader
+
+    def getSpriteAtlas(self) -> TextureAtlas:
+        return self.spriteAtlas
+
+    def getGlyphAtlas(self, path: str, size: int) -> Optional[GlyphAtlas]:
+        key = (path, int(size))
+        atlas = self.glyphAtlases.get(key)
+        if atlas is None:
+            font = self.fonts.get(path, size)
+            if font is None:
+                return None
+            atlas = GlyphAtlas(self.getRenderer(), font)
+            self.glyphAtlases[key] = atlas
+        return atlas
 
     def setFinalScore(self, score: int):
         self.finalScore = score
 
+    def setFinalRun(self, duration: float, kills: int, seed: int):
+        self.finalRun = (duration, kills, seed)
+
     def getFinalScore(self) -> int:
         return self.finalScore
 
-    def getLeaderBoard(self):
-        return self.leaderBoard
+    def getLeaderBoard(self) -> LeaderBoard:
+        return self.scores.board
 
     def togglePause(self):
         self.isPause = not self.isPause
@@ -269,67 +414,53 @@ class Game:
         return self.currentLanguage
 
     def switchLanguage(self):
-        try:
-            i = self.language.index(self.currentLanguage)
-            self.currentLanguage = self.language[(i + 1) % len(self.language)]
-        except ValueError:
-            return
+        self.currentLanguage = self.localization.next()
 
-    def backgroundUpdate(self, deltaTime : float):
-        self.nearStars.offset += self.nearStars.speed * deltaTime
-        if self.nearStars.offset >= 0:  
-            self.nearStars.offset -= self.nearStars.height
+    def getRenderAlpha(self) -> float:
+        # 暂停时模拟不推进, 直接显示当前状态
+        return 1.0 if self.isPause else self.renderAlpha
 
-        self.farStars.offset += self.farStars.speed * deltaTime
-        if self.farStars.offset >= 0:
-            self.farStars.offset -= self.farStars.height
+    def backgroundUpdate(self, deltaTime : float):
+        self.starfield.update(deltaTime)
 
     def renderBackground(self):
-        # 渲染远处的星星
-        for posY in range(int(self.farStars.offset), self.getWindowHeight(), int(self.farStars.height)):
-            for posX in range(0, self.getWindowWidth(), int(self.farStars.width)):
-                dstRect = sdl.SDL_FRect(posX, posY, self.farStars.width, self.farStars.height)
-                sdl.SDL_RenderTexture(self.getRenderer(), self.farStars.texture, None, dstRect)
-
-        # 渲染近处的星星
-        for posY in range(int(self.nearStars.offset), self.getWindowHeight(), int(self.nearStars.height)):
-            for posX in range(0, self.getWindowWidth(), int(self.nearStars.width)):
-                dstRect = sdl.SDL_FRect(posX, posY, self.nearStars.width, self.nearStars.height)
-                sdl.SDL_RenderTexture(self.getRenderer(), self.nearStars.texture, None, dstRect)      
-
-    def renderTextCentered(self, text:str, posY:float, isTitle: bool):
-        color = sdl.SDL_Color(255, 255, 255, 255)
-        surface = None
-        if isTitle:
-            surface = ttf.TTF_RenderText_Solid(self.titleFont, text.encode("utf-8"), len(text.encode("utf-8")), color)
-        else:
-            surface = ttf.TTF_RenderText_Solid(self.textFont, text.encode("utf-8"), len(text.encode("utf-8")), color)
-
-        surfaceRect = sdl.SDL_Rect()
-        sdl.SDL_GetSurfaceClipRect(surface, surfaceRect)
-        texture = sdl.SDL_CreateTextureFromSurface(self.getRenderer(), surface)
-        y = int((self.getWindowHeight() - surfaceRect.h) * posY)
-        scoreRect = sdl.SDL_FRect(self.getWindowWidth() / 2 - surfaceRect.w / 2, y, surfaceRect.w,surfaceRect.h)
-        sdl.SDL_RenderTexture(self.getRenderer(), texture, None, scoreRect)
-        sdl.SDL_DestroySurface(surface)
-        sdl.SDL_DestroyTexture(texture)
-        return sdl.SDL_Point(int(scoreRect.x) + int(scoreRect.w), y)
-
-    def renderTextPos(self, text: str, posX: int, posY: int, isLeft: bool):  
-        color = sdl.SDL_Color(255, 255, 255, 255)
-        surface = ttf.TTF_RenderText_Solid(self.textFont, text.encode("utf-8"), len(text.encode("utf-8")), color)
-        texture = sdl.SDL_CreateTextureFromSurface(self.getRenderer(), surface)
-        surfaceRect = sdl.SDL_Rect()
-        sdl.SDL_GetSurfaceClipRect(surface, surfaceRect)   
-        finalRect = sdl.SDL_FRect()
-        if isLeft:           
-            finalRect = sdl.SDL_FRect(posX, posY, surfaceRect.w, surfaceRect.h)
+        # 在两个 tick 之间按插值系数继续滚动; 从远到近每层一到两次贴图
+        advance = 0.0 if self.isPause else self.tickTime * self.renderAlpha
+        self.starfield.render(advance)
+
+    def measureText(self, text: str, size: int, dynamic: bool = False):
+        # dynamic=True 的文字(分数、正在输入的名字)走字形图集, 其余整行缓存为纹理
+        if dynamic:
+            return self.getGlyphAtlas(TEXT_FONT, size).measure(text)
+        entry = self.textCache.get(self.fonts.get(TEXT_FONT, size), (TEXT_FONT, int(size)), text)
+        if entry is None:
+            return 0, 0
+        return entry[1], entry[2]
+
+    def drawText(self, text: str, size: int, x: float, y: float, dynamic: bool = False):
+        if dynamic:
+            self.getGlyphAtlas(TEXT_FONT, size).draw(text, x, y)
+            return
+        entry = self.textCache.get(self.fonts.get(TEXT_FONT, size), (TEXT_FONT, int(size)), text)
+        if entry is None:
+            return
+        texture, w, h = entry
+        sdl.SDL_RenderTexture(self.getRenderer(), texture, None, sdl.SDL_FRect(x, y, w, h))
+
+    def renderTextCentered(self, text:str, posY:float, isTitle: bool, dynamic: bool = False):
+        size = 64 if isTitle else 32
+        w, h = self.measureText(text, size, dynamic)
+        y = int((self.getWindowHeight() - h) * posY)
+        x = self.getWindowWidth() / 2 - w / 2
+        self.drawText(text, size, x, y, dynamic)
+        return sdl.SDL_Point(int(x) + w, y)
+
+    def renderTextPos(self, text: str, posX: int, posY: int, isLeft: bool, dynamic: bool = False):  
+        if isLeft:
+            self.drawText(text, 32, posX, posY, dynamic)
         else:
-            finalRect = sdl.SDL_FRect(self.getWindowWidth() - posX - surfaceRect.w, posY, surfaceRect.w, surfaceRect.h)
-
-        sdl.SDL_RenderTexture(self.getRenderer(), texture, None, finalRect)
-        sdl.SDL_DestroySurface(surface)
-        sdl.SDL_DestroyTexture(texture)
+            w, _ = self.measureText(text, 32, dynamic)
+            self.drawText(text, 32, self.getWindowWidth() - posX - w, posY, dynamic)
 
     def renderTextAtPercent(self, text: str, fontSize: float, posX: float, posY: float, isLeft: bool, isTitle: bool = False):
         """
@@ -337,15 +468,8 @@ class Game:
         isLeft=True  → 以左侧为基准; x = W*posX
         isLeft=False → 以右侧为基准;x = W*(1-posX) - text_w
         """
-        color = sdl.SDL_Color(255, 255, 255, 255)
-        b = text.encode("utf-8")
-        Orisize = ttf.TTF_GetFontSize(self.textFont)
-        ttf.TTF_SetFontSize(self.textFont, fontSize * Orisize)
-
-        surface = (ttf.TTF_RenderText_Solid(self.titleFont if isTitle else self.textFont, b, len(b), color))
-        surfaceRect = sdl.SDL_Rect()
-        sdl.SDL_GetSurfaceClipRect(surface, surfaceRect)
-        texture = sdl.SDL_CreateTextureFromSurface(self.getRenderer(), surface)
+        # fontSize 是相对正文字号(32)的倍数, 从注册表取固定字号的字体, 标题字体不受影响
+        size = 64 if isTitle else int(fontSize * 32)
 
         W = float(self.getWindowWidth())
         H = float(self.getWindowHeight())
@@ -355,64 +479,37 @@ class Game:
         if isLeft:
             x = W * float(posX)
         else:
-            x = W * (1.0 - float(posX)) - float(surfaceRect.w)
+            w, _ = self.measureText(text, size)
+            x = W * (1.0 - float(posX)) - float(w)
 
-        dst = sdl.SDL_FRect(float(int(x)), float(int(y)),
-                            float(surfaceRect.w), float(surfaceRect.h))
-        sdl.SDL_RenderTexture(self.getRenderer(), texture, None, dst)
-
-        sdl.SDL_DestroySurface(surface)
-        sdl.SDL_DestroyTexture(texture)
-        ttf.TTF_SetFontSize(self.textFont, Orisize)
+        self.drawText(text, size, float(int(x)), float(int(y)))
 
     def insertLeaderBoard(self, score: int, name: str):
-        self.leaderBoard[score] = name
-        if len(self.leaderBoard) > 8:
-            self.leaderBoard.pop()
+        # 写库在后台线程进行, 排行榜缓存立即更新
+        duration, kills, seed = self.finalRun
+        self.scores.addRun(score, name, duration, kills, seed)
 
     def saveData(self):
-        path = self._save_path("save.dat")
-        try:
-            with path.open("w", encoding="utf-8", newline="\n") as f:
-                for score, name in sorted(self.leaderBoard.items()):
-                    f.write(f"{score} {name}\n")
-        except OSError as e:
-            log.error("[saveData] Failed to open save file: {}", e)
+        # 等排队中的成绩写完再关闭数据库
+        self.scores.close()
 
     def loadData(self):
-        path = self._save_path("save.dat")  
-        if not path.exists():
-            log.info("[loadData] Failed to open save file")
-            return
-
-        self.leaderBoard.clear()
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(maxsplit=1)
-                    if len(parts) != 2:
-                        continue
-                    score_str, name = parts
-                    try:
-                        score = int(score_str)
-                    except ValueError:
-                        continue
-
-                    if score not in self.leaderBoard:
-                        self.leaderBoard[score] = name
-        except OSError as e:
-            log.error("[loadData] Failed to read save file: {}",e)
+        # 第一次运行时把旧版 save.dat 导入数据库
+        self.scores.open(self._save_path("save.dat"))
 
     def to_abs_path(self, rel_path: str) -> str:
         # 把相对路径转为绝对路径(基于当前源码文件所在目录)
         # 若传入本就是绝对路径，则直接返回标准化后的绝对路径
+        cached = self.pathCache.get(rel_path)
+        if cached is not None:
+            return cached
+
         import sys
         p = Path(rel_path)
         if p.is_absolute():
-            return str(p.resolve())
+            result = str(p.resolve())
+            self.pathCache[rel_path] = result
+            return result
 
         # 冻结态(PyInstaller)
         if getattr(sys, "frozen", False):
@@ -421,7 +518,9 @@ class Game:
             # 开发态：Game.py 在 src/<pkg>/ 里，资源在项目根的 assets/
             base = Path(__file__).resolve().parent.parent
 
-        return str((base / p).resolve())
+        result = str((base / p).resolve())
+        self.pathCache[rel_path] = result
+        return result
 
     def _app_dir(self):
         # 返回 EXE 所在目录 开发态则返回项目根(src 的上一层)
@@ -439,29 +538,12 @@ class Game:
         return p
 
     def initLocalizer(self):
-        self.localizeLib.clear()
-        self.localizeLib["gameName"] = {"zh":"太空战机","en":"Space Plane"}
-        self.localizeLib["titleStart"] = {"zh": "按 空格 键开始游戏","en":"Press SPACE key to Start Game"}
-        self.localizeLib["titleChangeLang"] = {"zh": "按 TAB 键切换语言","en":"Press TAB key to change Language"}
-        self.localizeLib["endScore"] = {"zh": "你的得分是: ", "en": "Your Score is: "}
-        self.localizeLib["gameOver"] = {"zh": "游戏结束", "en": "Game Over"}
-        self.localizeLib["inputName"] = {"zh": "请输入你的名字", "en": "Please enter your name,"}
-        self.localizeLib["ensureName"] = {"zh": "并按回车键确认:", "en": "and press the Enter key to confirm: "}
-        self.localizeLib["scoreList"] = {"zh": "得分榜", "en": "Score List"}
-        self.localizeLib["restartGame"] = {"zh": "按 J 键重新开始游戏", "en": "Press the J key to restart game"}
-        self.localizeLib["score"] = {"zh": "得分: ", "en": "Score: "}
-        self.localizeLib["pause"] = {"zh": "已暂停", "en": "Pause"}
-        self.localizeLib["pauseMove"] = {"zh": "移动: WASD", "en": "Move: WASD"}
-        self.localizeLib["pauseAttack"] = {"zh": "射击: J", "en": "Shoot: J"}
-        self.localizeLib["pauseShield"] = {"zh": "使用护盾: K", "en": "Use Shield: K"}
-        self.localizeLib["pauseInvincible"] = {"zh": "使用无敌: L", "en": "Invincible: L"}
-        self.localizeLib["pausePause"] = {"zh": "暂停: P", "en": "Pause: P"}
-        self.localizeLib["version"] = {"zh": "版本: ", "en": "Version: "}
-        self.localizeLib["fullScreen"] = {"zh": "全屏: F11", "en": "Fullscreen: F11"}
-
-    def localizer(self, key:str) -> str:
-        enter = self.localizeLib.get(key)
-        if not enter:
-            return key
-
-        return self.localizeLib[key][self.currentLanguage]
+        # 只载入当前语言, 其余语言切换时再载入
+        self.localization = Localizer(Path(self.to_abs_path(LANG_DIRECTORY)), self.currentLanguage)
+
+    def localizer(self, key:str) -> LocalizedText:
+        return self.localization.get(key)
+
+    def localizeFormat(self, key: str, value) -> LocalizedText:
+        # "得分: " + 分数 这类拼接结果有缓存, 值不变时不再生成新字符串
+        return self.localization.format(key, value)
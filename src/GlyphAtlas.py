@@ -0,0 +1,147 @@
+from typing import Optional, Tuple
+import numpy as np
+import sdl3 as sdl
+from sdl3 import SDL_ttf as ttf
+
+from Logger import GameLogger as log
+from SpriteBatch import SpriteBatch
+
+renderLog = log.category("render")
+
+# 字形图集: 每个 (字体文件, 字号) 烘焙一张纹理, 绘制字符串时每个字形是图集里的一个四边形,
+# 不再每帧 TTF_RenderText + SDL_CreateTextureFromSurface
+# 初始化时预烘焙可打印 ASCII, 中文等其余字符在第一次出现时追加到图集
+#   atlas = GlyphAtlas(renderer, font)
+#   w, h = atlas.measure("Score: 100")
+#   atlas.draw("Score: 100", x, y)                 # 一整行一次 SDL_RenderGeometry
+#   atlas.draw(line, x, y, flush=False)            # 多行文字攒在一起,
+#   atlas.flush()                                  # 最后一次画完
+
+
+class GlyphAtlas:
+
+    PADDING = 1  # 字形之间留空, 防止采样串色
+
+    def __init__(self, renderer: sdl.SDL_Renderer, font: ttf.TTF_Font, width: int = 512, height: int = 256):
+        self.renderer = renderer
+        self.font = font
+        self.width = width
+        self.height = height
+        self.lineHeight = ttf.TTF_GetFontHeight(font)
+        self.glyphs = {}  # 字符 -> (x, y, w, h)
+        self.penX = 0
+        self.penY = 0
+        self.rowHeight = 0
+        self.dirty = True
+        self.texture: Optional[sdl.SDL_Texture] = None
+        self.batch = SpriteBatch(renderer, 64)
+        self.surface = self.createSurface(width, height)
+        for code in range(32, 127):
+            self.addGlyph(chr(code))
+
+    def createSurface(self, width: int, height: int):
+        surface = sdl.SDL_CreateSurface(width, height, sdl.SDL_PIXELFORMAT_RGBA32)
+        if not surface:
+            renderLog.error("Failed to create glyph atlas surface: {}", sdl.SDL_GetError())
+            return None
+        sdl.SDL_FillSurfaceRect(surface, None, 0)  # 全透明
+        return surface
+
+    def grow(self) -> bool:
+        # 图集写满时高度翻倍, 旧内容原样拷贝过去
+        surface = self.createSurface(self.width, self.height * 2)
+        if surface is None:
+            return False
+        sdl.SDL_SetSurfaceBlendMode(self.surface, sdl.SDL_BLENDMODE_NONE)
+        sdl.SDL_BlitSurface(self.surface, None, surface, None)
+        sdl.SDL_DestroySurface(self.surface)
+        self.surface = surface
+        self.height *= 2
+        self.dirty = True
+        return True
+
+    def addGlyph(self, ch: str) -> bool:
+        if self.surface is None:
+            return False
+        glyph = ttf.TTF_RenderGlyph_Solid(self.font, ord(ch), sdl.SDL_Color(255, 255, 255, 255))
+        if not glyph:
+            renderLog.error("Failed to render glyph {!r}: {}", ch, sdl.SDL_GetError())
+            return False
+        w = glyph.contents.w
+        h = glyph.contents.h
+        if self.penX + w > self.width:
+            self.penX = 0
+            self.penY += self.rowHeight + self.PADDING
+            self.rowHeight = 0
+        while self.penY + h > self.height:
+            if not self.grow():
+                sdl.SDL_DestroySurface(glyph)
+                return False
+        sdl.SDL_BlitSurface(glyph, None, self.surface, sdl.SDL_Rect(self.penX, self.penY, w, h))
+        sdl.SDL_DestroySurface(glyph)
+        self.glyphs[ch] = (self.penX, self.penY, w, h)
+        self.penX += w + self.PADDING
+        self.rowHeight = max(self.rowHeight, h)
+        self.dirty = True
+        return True
+
+    def ensure(self, text: str) -> None:
+        for ch in text:
+            if ch not in self.glyphs:
+                self.addGlyph(ch)
+
+    def upload(self) -> None:
+        # 有新字形时重新上传整张图集, 稳定后每帧只是复用同一张纹理
+        if not self.dirty:
+            return
+        if self.texture is not None:
+            # 还没画出去的字形引用的是旧纹理; 新纹理尺寸不同, 清掉缓存的尺寸
+            self.batch.flush()
+            self.batch.textureSizes.clear()
+            sdl.SDL_DestroyTexture(self.texture)
+        self.texture = sdl.SDL_CreateTextureFromSurface(self.renderer, self.surface)
+        if self.texture is None:
+            renderLog.error("Failed to upload glyph atlas: {}", sdl.SDL_GetError())
+            return
+        sdl.SDL_SetTextureBlendMode(self.texture, sdl.SDL_BLENDMODE_BLEND)
+        sdl.SDL_SetTextureScaleMode(self.texture, sdl.SDL_SCALEMODE_NEAREST)
+        self.dirty = False
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        self.ensure(text)
+        w = 0
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is not None:
+                w += glyph[2]
+        return w, self.lineHeight
+
+    def draw(self, text: str, x: float, y: float, color: sdl.SDL_Color = None, flush: bool = True) -> int:
+        # 在 (x, y) 处绘制一行文字, 返回绘制宽度; flush=False 时留在批次里, 由 flush() 一起提交
+        self.ensure(text)
+        self.upload()
+        if self.texture is None:
+            return 0
+        glyphs = [self.glyphs[ch] for ch in text if ch in self.glyphs]
+        if not glyphs:
+            return 0
+        src = np.array(glyphs, np.float32)
+        widths = src[:, 2]
+        xs = x + np.cumsum(widths) - widths
+        rgba = (1.0, 1.0, 1.0, 1.0) if color is None else (color.r / 255, color.g / 255, color.b / 255, color.a / 255)
+        self.batch.draw(self.texture, xs, y, widths, src[:, 3], src=src.T, color=rgba)
+        if flush:
+            self.batch.flush()
+        return int(widths.sum())
+
+    def flush(self) -> None:
+        self.batch.flush()
+
+    def clean(self) -> None:
+        self.batch.count = 0
+        if self.texture is not None:
+            sdl.SDL_DestroyTexture(self.texture)
+            self.texture = None
+        if self.surface is not None:
+            sdl.SDL_DestroySurface(self.surface)
+            self.surface = None
@@ -0,0 +1,144 @@
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from Logger import GameLogger as log
+from Simulation import SimInput
+
+# 输入录制与回放: 模拟层只依赖种子、每个 tick 的输入和 tick 时长, 三者录下来就能完整复现一局
+#   recorder = InputRecorder.open(path, sim.seed, game)   # 每局一个文件: session-001.rec, session-002.rec...
+#   recorder.write(inputs, deltaTime)     # 每次 sim.step 之前
+#   recorder.close()
+#   replay = InputReplay.open(path)
+#   sim = Simulation(settings, replay.seed)
+#   deltaTime = replay.read(inputs)       # 填写 inputs, 返回录制时的 tick 时长; 放完返回 None
+# 文件布局(小端):
+#   MAGIC(8) | 种子 u64 | 每个 tick 一条记录...
+# 记录: u16 按键位图, 最高位置位时后面紧跟一个 f64 的 tick 时长(与上一条不同时才写)
+# 固定步长下每个 tick 只占 2 字节; tick 时长按 f64 原样保存, 回放时与录制时逐位相同
+
+MAGIC = b"SPINPUT1"
+_HEADER = struct.Struct("<8sQ")
+_MASK = struct.Struct("<H")
+_DELTA = struct.Struct("<d")
+_HAS_DELTA = 0x8000
+
+# 位图中的按键顺序: W A S D J K L P
+KEYS = ("up", "left", "down", "right", "shoot", "useShield", "useInvincible")
+PAUSE_BIT = 1 << len(KEYS)
+
+
+def numberedPath(path: str, index: int) -> Path:
+    # 同一次运行里的第 index 局(从 1 开始)
+    p = Path(path)
+    return p.with_name(f"{p.stem}-{index:03d}{p.suffix}")
+
+
+def packInput(inputs: SimInput, paused: bool = False) -> int:
+    mask = 0
+    for bit, name in enumerate(KEYS):
+        if getattr(inputs, name):
+            mask |= 1 << bit
+    if paused:
+        mask |= PAUSE_BIT
+    return mask
+
+
+def unpackInput(mask: int, inputs: SimInput) -> None:
+    for bit, name in enumerate(KEYS):
+        setattr(inputs, name, bool(mask & (1 << bit)))
+
+
+class InputRecorder:
+    def __init__(self, path: Path, seed: int):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(_HEADER.pack(MAGIC, seed & 0xFFFFFFFFFFFFFFFF))
+        self.lastDelta = None
+        self.ticks = 0
+
+    @classmethod
+    def open(cls, path: str, seed: int, index: int) -> Optional["InputRecorder"]:
+        # 文件打不开时只记日志, 这一局照常进行但不录制
+        target = numberedPath(path, index)
+        try:
+            return cls(target, seed)
+        except OSError as e:
+            log.error("Failed to open input recording {}: {}", target, e)
+            return None
+
+    def write(self, inputs: SimInput, deltaTime: float, paused: bool = False) -> None:
+        # paused: 上一个 tick 之后按过 P, 只作记录, 暂停期间模拟本来就不推进
+        if self.file is None:
+            return
+        mask = packInput(inputs, paused)
+        try:
+            if deltaTime != self.lastDelta:
+                self.file.write(_MASK.pack(mask | _HAS_DELTA))
+                self.file.write(_DELTA.pack(deltaTime))
+                self.lastDelta = deltaTime
+            else:
+                self.file.write(_MASK.pack(mask))
+        except OSError as e:
+            # 写失败后停止录制, 已写入的部分仍可回放
+            log.error("Failed to write input recording {}: {}", self.path, e)
+            self.close()
+            return
+        self.ticks += 1
+
+    def close(self) -> None:
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError as e:
+                log.error("Failed to close input recording {}: {}", self.path, e)
+            self.file = None
+            log.info("Recorded {} ticks to {}", self.ticks, self.path)
+
+
+class InputReplay:
+    def __init__(self, seed: int, records: List[Tuple[int, float]]):
+        self.seed = seed
+        self.records = records  # (按键位图, tick 时长)
+        self.cursor = 0
+
+    @classmethod
+    def load(cls, data: bytes) -> "InputReplay":
+        magic, seed = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not an input recording")
+        records = []
+        offset = _HEADER.size
+        delta = 0.0
+        while offset < len(data):
+            (mask,) = _MASK.unpack_from(data, offset)
+            offset += _MASK.size
+            if mask & _HAS_DELTA:
+                (delta,) = _DELTA.unpack_from(data, offset)
+                offset += _DELTA.size
+            records.append((mask & ~_HAS_DELTA, delta))
+        return cls(seed, records)
+
+    @classmethod
+    def open(cls, path: str) -> Optional["InputReplay"]:
+        try:
+            replay = cls.load(Path(path).read_bytes())
+        except (OSError, ValueError, struct.error) as e:
+            log.error("Failed to load input recording {}: {}", path, e)
+            return None
+        log.info("Replaying {} ticks from {}, seed {}", len(replay.records), path, replay.seed)
+        return replay
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def isFinished(self) -> bool:
+        return self.cursor >= len(self.records)
+
+    def read(self, inputs: SimInput) -> Optional[float]:
+        if self.isFinished():
+            return None
+        mask, deltaTime = self.records[self.cursor]
+        self.cursor += 1
+        unpackInput(mask, inputs)
+        return deltaTime
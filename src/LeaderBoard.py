@@ -0,0 +1,53 @@
+import bisect
+from typing import Iterator, List, Optional, Tuple
+
+# 排行榜: 按分数从高到低保留前 capacity 名, 同分按先后顺序并列保留
+#   board = LeaderBoard(8)
+#   rank = board.insert(120, "abc")    # 返回名次(从 0 开始), 没进榜返回 None
+#   for score, name in board: ...
+# 完整的历史成绩存在 ScoreStore(SQLite) 中, 这里只是前 K 名的内存缓存
+
+
+class LeaderBoard:
+    def __init__(self, capacity: int = 8):
+        self.capacity = capacity
+        self.keys: List[Tuple[int, int]] = []  # (-分数, 序号), 升序即分数从高到低、同分先到的在前
+        self.names: List[str] = []
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        for (negScore, _), name in zip(self.keys, self.names):
+            yield -negScore, name
+
+    def insert(self, score: int, name: str) -> Optional[int]:
+        key = (-score, self.sequence)
+        i = bisect.bisect_right(self.keys, key)
+        if i >= self.capacity:
+            return None
+        self.sequence += 1
+        self.keys.insert(i, key)
+        self.names.insert(i, name)
+        if len(self.keys) > self.capacity:
+            self.keys.pop()
+            self.names.pop()
+        return i
+
+    def clear(self) -> None:
+        self.keys.clear()
+        self.names.clear()
+        self.sequence = 0
+
+    def loadLines(self, lines) -> None:
+        # 旧版 save.dat: 每行 "分数 名字", 格式不对的行跳过
+        for line in lines:
+            parts = line.strip().split(maxsplit=1)
+            if len(parts) != 2:
+                continue
+            try:
+                score = int(parts[0])
+            except ValueError:
+                continue
+            self.insert(score, parts[1])
@@ -0,0 +1,85 @@
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List
+
+from Logger import GameLogger as log
+
+# 本地化: 每种语言一个 JSON 文件(assets/lang/<语言>.json, 内容为 {键: 文本})
+# 启动时只列出文件名并载入当前语言, 其余语言第一次切换到时才载入, 语言再多也不增加启动开销
+#   loc = Localizer(Path("assets/lang"), "zh")
+#   loc.get("pause")              # -> LocalizedText
+#   loc.format("score", 120)      # "得分: " + "120", 结果缓存, 分数不变时每帧拿到同一个对象
+#   loc.next()                    # 切换到下一种语言
+# 文本在载入时就编码好 UTF-8, TTF_RenderText_* 直接使用, 渲染时不再 encode
+
+
+class LocalizedText(str):
+    # 本身就是 str(可以拼接、作为缓存键), 另外带着 UTF-8 字节与字节长度
+    def __new__(cls, text: str):
+        obj = super().__new__(cls, text)
+        obj.encoded = text.encode("utf-8")
+        obj.size = len(obj.encoded)
+        return obj
+
+
+class Localizer:
+    def __init__(self, directory: Path, language: str, formatCapacity: int = 256):
+        self.directory = Path(directory)
+        self.languages: List[str] = sorted(p.stem for p in self.directory.glob("*.json"))
+        self.catalogs: Dict[str, Dict[str, LocalizedText]] = {}  # 已载入的语言
+        self.formatCapacity = formatCapacity
+        self.formatted = OrderedDict()  # (语言, 键, 值) -> LocalizedText, LRU
+        self.language = language
+        self.current = self.load(language)
+
+    def load(self, language: str) -> Dict[str, LocalizedText]:
+        catalog = self.catalogs.get(language)
+        if catalog is not None:
+            return catalog
+        path = self.directory / f"{language}.json"
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError) as e:
+            log.error("Failed to load language {}: {}", path, e)
+            raw = {}
+        catalog = {key: LocalizedText(text) for key, text in raw.items()}
+        self.catalogs[language] = catalog
+        log.info("Loaded language {} ({} strings)", language, len(catalog))
+        return catalog
+
+    def setLanguage(self, language: str) -> None:
+        self.language = language
+        self.current = self.load(language)
+
+    def next(self) -> str:
+        if not self.languages:
+            return self.language
+        if self.language in self.languages:
+            i = self.languages.index(self.language)
+            self.setLanguage(self.languages[(i + 1) % len(self.languages)])
+        else:
+            self.setLanguage(self.languages[0])
+        return self.language
+
+    def get(self, key: str) -> LocalizedText:
+        text = self.current.get(key)
+        if text is None:
+            # 缺失的键原样显示, 顺便缓存起来
+            text = LocalizedText(key)
+            self.current[key] = text
+        return text
+
+    def format(self, key: str, value) -> LocalizedText:
+        # 带变量的文字: 本地化前缀 + 值
+        cacheKey = (self.language, key, value)
+        text = self.formatted.get(cacheKey)
+        if text is not None:
+            self.formatted.move_to_end(cacheKey)
+            return text
+        text = LocalizedText(self.get(key) + str(value))
+        self.formatted[cacheKey] = text
+        if len(self.formatted) > self.formatCapacity:
+            self.formatted.popitem(last=False)
+        return text
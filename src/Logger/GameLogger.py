@@ -1,6 +1,7 @@
 from loguru import logger
 import sys
-from typing import Optional
+import time
+from typing import Dict, Optional
 
 #轻量封装: 支持自定义格式、一键调整全局日志等级
 #from Logger.GameLogger import GameLogger
@@ -9,10 +10,46 @@ from typing import Optional
 #log = GameLogger(level="TRACE", to_file=None, detailed=False)
 #log.set_level("TRACE")                         # 全局放开
 #log.info("hello {}", "world")                  # 直接快捷方法
+#audio = log.category("audio")                  # 分类日志, 各自的等级
+#log.set_level("WARNING", category="audio")
+#audio.error("play failed: {}", err)
+#if log.is_enabled("DEBUG"): log.debug("{}", expensive())
+#等级判断在进入 loguru 之前完成, 关闭的等级不会格式化参数, 也不会创建 opt() 对象
+#同一调用位置在 rate_window 秒内最多输出 rate_burst 条, 其余只计数,
+#下一次输出(或 flush_suppressed)时附上 "repeated N times"
+
+
+class _CallSite:
+    __slots__ = ("window_start", "count", "suppressed")
+
+    def __init__(self, now: float):
+        self.window_start = now
+        self.count = 1
+        self.suppressed = 0
+
+
+class CategoryLogger:
+    # 分类日志(render / audio / sim / io ...), 等级单独设置, 未设置时跟随全局等级
+    def __init__(self, owner: "GameLogger", name: str):
+        self._owner = owner
+        self.name = name
+        self.level_no: Optional[int] = None
+
+    def is_enabled(self, level: str) -> bool:
+        return self._owner.is_enabled(level, self.name)
+
+    def trace(self, msg, *args, **kwargs): self._owner._log(5, "TRACE", msg, args, kwargs, self, 2)
+    def debug(self, msg, *args, **kwargs): self._owner._log(10, "DEBUG", msg, args, kwargs, self, 2)
+    def info(self, msg, *args, **kwargs): self._owner._log(20, "INFO", msg, args, kwargs, self, 2)
+    def success(self, msg, *args, **kwargs): self._owner._log(25, "SUCCESS", msg, args, kwargs, self, 2)
+    def warning(self, msg, *args, **kwargs): self._owner._log(30, "WARNING", msg, args, kwargs, self, 2)
+    def error(self, msg, *args, **kwargs): self._owner._log(40, "ERROR", msg, args, kwargs, self, 2)
+    def critical(self, msg, *args, **kwargs): self._owner._log(50, "CRITICAL", msg, args, kwargs, self, 2)
+
 
 class GameLogger:
 
-    _LEVELS = {"TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"}
+    _LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
 
     def __init__(self,
                  level: str = "TRACE",
@@ -20,7 +57,9 @@ class GameLogger:
                  rotation: str = "1 week",
                  retention: str = "4 weeks",
                  compression: str = "gz",
-                 detailed: bool = True):
+                 detailed: bool = True,
+                 rate_burst: int = 10,
+                 rate_window: float = 1.0):
         
         # —— 细节模式 —— 
         self._format_detailed = (
@@ -46,6 +85,13 @@ class GameLogger:
         self._compression    = compression
         self._detailed       = bool(detailed)
         self._current_level  = self._normalize_level(level)
+        self._level_no       = self._LEVELS[self._current_level]
+
+        # 分类与限流
+        self._categories: Dict[str, CategoryLogger] = {}
+        self._sites: Dict[tuple, _CallSite] = {}
+        self.rate_burst      = rate_burst
+        self.rate_window     = rate_window
 
         # 先清空默认 sink
         logger.remove()
@@ -58,21 +104,78 @@ class GameLogger:
     # —— 入口 —— 
     def log(self, level: str, msg: str, *args, **kwargs):
         level_up = self._normalize_level(level)
-        logger.log(level_up, msg, *args, **kwargs)
+        self._log(self._LEVELS[level_up], level_up, msg, args, kwargs, None, 2)
         
-    # —— 一键修改全局日志等级(同时作用于控制台与文件) ——
-    def set_level(self, level: str):
-        self._current_level = self._normalize_level(level)
-        self._rebuild_sinks() 
+    # —— 一键修改全局日志等级(同时作用于控制台与文件); 给出 category 时只改该分类 ——
+    def set_level(self, level: str, category: Optional[str] = None):
+        level_up = self._normalize_level(level)
+        if category is not None:
+            self.category(category).level_no = self._LEVELS[level_up]
+            return
+        self._current_level = level_up
+        self._level_no = self._LEVELS[level_up]
+
+    def category(self, name: str) -> CategoryLogger:
+        cat = self._categories.get(name)
+        if cat is None:
+            cat = CategoryLogger(self, name)
+            self._categories[name] = cat
+        return cat
+
+    def is_enabled(self, level: str, category: Optional[str] = None) -> bool:
+        no = self._LEVELS[self._normalize_level(level)]
+        cat = self._categories.get(category) if category is not None else None
+        return no >= (cat.level_no if cat is not None and cat.level_no is not None else self._level_no)
+
+    def set_rate_limit(self, burst: int, window: float):
+        self.rate_burst = burst
+        self.rate_window = window
 
     # —— 直接按等级方法名调用 —— 
-    def trace(self, msg, *args, **kwargs): logger.opt(depth=2).trace(msg, *args, **kwargs)
-    def debug(self, msg, *args, **kwargs): logger.opt(depth=2).debug(msg, *args, **kwargs)
-    def info(self, msg, *args, **kwargs):  logger.opt(depth=2).info(msg, *args, **kwargs)
-    def success(self, msg, *args, **kwargs):  logger.opt(depth=2).success(msg, *args, **kwargs) 
-    def warning(self, msg, *args, **kwargs):  logger.opt(depth=2).warning(msg, *args, **kwargs)
-    def error(self, msg, *args, **kwargs): logger.opt(depth=2).error(msg, *args, **kwargs)
-    def critical(self, msg, *args, **kwargs): logger.opt(depth=2).critical(msg, *args, **kwargs)
+    def trace(self, msg, *args, **kwargs): self._log(5, "TRACE", msg, args, kwargs, None, 3)
+    def debug(self, msg, *args, **kwargs): self._log(10, "DEBUG", msg, args, kwargs, None, 3)
+    def info(self, msg, *args, **kwargs):  self._log(20, "INFO", msg, args, kwargs, None, 3)
+    def success(self, msg, *args, **kwargs):  self._log(25, "SUCCESS", msg, args, kwargs, None, 3)
+    def warning(self, msg, *args, **kwargs):  self._log(30, "WARNING", msg, args, kwargs, None, 3)
+    def error(self, msg, *args, **kwargs): self._log(40, "ERROR", msg, args, kwargs, None, 3)
+    def critical(self, msg, *args, **kwargs): self._log(50, "CRITICAL", msg, args, kwargs, None, 3)
+
+    # —— 内部：等级判断 -> 限流 -> 交给 loguru ——
+    # depth 为调用方相对 _log 的层数: 代理函数 -> 等级方法 -> _log 为 3, CategoryLogger / log() 为 2
+    # (直接调用 GameLogger 实例的等级方法时少一层, 调用位置会显示为上一层)
+    def _log(self, no: int, level: str, msg, args, kwargs, category: Optional[CategoryLogger], depth: int):
+        limit = self._level_no if category is None or category.level_no is None else category.level_no
+        if no < limit:
+            return
+        frame = sys._getframe(depth)
+        key = (frame.f_code, frame.f_lineno)
+        now = time.monotonic()
+        site = self._sites.get(key)
+        suppressed = 0
+        if site is None:
+            self._sites[key] = _CallSite(now)
+        elif now - site.window_start >= self.rate_window:
+            suppressed = site.suppressed
+            site.window_start = now
+            site.count = 1
+            site.suppressed = 0
+        elif site.count < self.rate_burst:
+            site.count += 1
+        else:
+            site.suppressed += 1
+            return
+        if category is not None:
+            msg = f"[{category.name}] {msg}"
+        if suppressed:
+            msg = f"{msg} (repeated {suppressed} times)"
+        logger.opt(depth=depth).log(level, msg, *args, **kwargs)
+
+    def flush_suppressed(self):
+        # 退出前调用: 报告还没来得及附在下一条日志上的被限流条数
+        for (code, line), site in self._sites.items():
+            if site.suppressed:
+                logger.log("WARNING", "{}:{} suppressed {} repeated messages", code.co_filename, line, site.suppressed)
+                site.suppressed = 0
 
  # —— 动态切换详/简样式 —— 
     def set_detailed(self, detailed: bool):
@@ -90,9 +193,10 @@ class GameLogger:
         fmt = self._format_detailed if self._detailed else self._format_brief
 
         # 控制台
+        # sink 接收所有等级, 实际的等级过滤在 _log 中完成(分类可以比全局更详细)
         self._console_sink_id = logger.add(
             sys.stdout,
-            level=self._current_level,
+            level="TRACE",
             format=fmt,
             colorize=True,
             enqueue=True,
@@ -105,7 +209,7 @@ class GameLogger:
         if self._file_path:
             self._file_sink_id = logger.add(
                 self._file_path,
-                level=self._current_level,
+                level="TRACE",
                 format=fmt,
                 encoding="utf-8",
                 rotation=self._rotation,
@@ -139,5 +243,9 @@ def success(*a, **k):     get_logger().success(*a, **k)
 def warning(*a, **k):     get_logger().warning(*a, **k)
 def error(*a, **k):     get_logger().error(*a, **k)
 def critical(*a, **k):     get_logger().critical(*a, **k)
-def set_level(lv):     get_logger().set_level(lv)
+def set_level(lv, category=None):     get_logger().set_level(lv, category)
 def set_detailed(b):   get_logger().set_detailed(b)
+def category(name):    return get_logger().category(name)
+def is_enabled(lv, category=None):   return get_logger().is_enabled(lv, category)
+def set_rate_limit(burst, window):   get_logger().set_rate_limit(burst, window)
+def flush_suppressed():   get_logger().flush_suppressed()
@@ -10,11 +10,64 @@ class GlobalObject:
         self.windowHeight = 800
         self.FPS = 60
         self.Version = "0.2.0"
+        self.framePacing = "capped"  # vsync: 垂直同步; capped: 按 FPS 精确限帧; uncapped: 不限帧(性能测试)
+        self.pacingSpinNs = 1500000  # capped 模式在截止时间前多久停止睡眠改为自旋(ns)
+        self.profilerEnabled = False  # 启动即记录分阶段耗时; 否则按 F3 打开叠加显示时才开始
+        self.profilerCapacity = 600  # 环形缓冲保留的帧数
+        self.profilerExportPath = "profile.csv"  # 退出时导出到存档目录, .json 后缀导出 JSON, 置空则不导出
+        # 视差背景图层, 从远到近; scale 为贴图缩放, speed 为滚动速度(像素/秒)
+        self.backgroundLayers = [
+            {"image": "assets/image/Stars-B.png", "speed": 20, "scale": 0.5},
+            {"image": "assets/image/Stars-A.png", "speed": 100, "scale": 0.5},
+        ]
+        # 各分类日志的等级(render / audio / sim / io), 未列出的分类跟随全局等级
+        self.logLevels = {"render": "INFO", "audio": "INFO", "sim": "INFO", "io": "INFO"}
+        self.logRateBurst = 10  # 同一调用位置每个窗口内最多输出的条数, 其余只计数
+        self.logRateWindow = 1.0  # 限流窗口(秒)
+        self.telemetryEnabled = False  # 记录逐事件遥测(生成/射击/命中/掉落/受伤/帧耗时)
+        self.telemetryDirectory = "telemetry"  # 遥测文件目录, 位于存档目录
+        self.telemetryCapacity = 65536  # 环形缓冲的记录条数, 写线程跟不上时丢弃新记录
+        self.telemetryMaxBytes = 16 << 20  # 单个文件上限, 超出换新文件
+        self.telemetryMaxFiles = 16  # 目录中最多保留的文件数, 超出删除最旧的
+        self.tickRate = 60  # 模拟频率(Hz), 与渲染帧率相互独立
+        self.maxTicksPerFrame = 5  # 每个渲染帧最多补几个 tick, 超出的积压直接丢弃
+        self.maxFrameTime = 0.25  # 单帧计入模拟的最长时间(秒), 防止卡顿后一次补太多
         self.SpawnEnemyStep = 60
         self.DropItemRate = 0.4  # 物品掉落概率
         self.LifeItemRate = 0.5  # 生命道具掉落概率
         self.shieldItemRate = 0.3  # 护盾道具掉落概率
         self.timeItemRate = 0.2  # 无敌道具掉落概率
+        self.bundlePath = "assets.bundle"  # 预烘焙资源包(tools/build_bundle.py 生成), 不存在时逐个加载 assets/
+        self.atlasDirectories = ["assets/image", "assets/effect"]  # 启动时打包进纹理图集的目录
+        # 精灵贴图缩小的倍数, 模版尺寸 = 图片尺寸 / 倍数; 资源包里存的是算好的模版尺寸
+        self.spriteScales = {
+            "assets/image/SpaceShip.png": 5,
+            "assets/image/bullet.png": 2,
+            "assets/image/insect-1.png": 4,
+            "assets/image/insect-2.png": 4,
+            "assets/image/bullet-1.png": 2,
+            "assets/effect/explosion.png": 1,
+            "assets/image/bonus_life.png": 4,
+            "assets/image/bonus_shield.png": 4,
+            "assets/image/bonus_time.png": 4,
+            "assets/image/shield.png": 2,
+        }
+        self.atlasPageSize = 1024  # 图集页面边长; 边长超过一半的图片(背景)不打包
+        self.preloadWorkers = 2  # 后台解码资源的线程数
+        self.preloadSliceNs = 2000000  # 标题界面每帧用于预加载收尾(拷贝图集/上传纹理)的时间预算
+        self.scoreDbPath = "scores.db"  # 历史成绩库(SQLite), 位于存档目录
+        self.sfxVoices = 8  # 音效同时发声的声部(MIX_Track)数量
+        self.textCacheCapacity = 64  # 静态文字纹理缓存的条目上限
+        self.collisionCellSize = 64  # 碰撞网格(SpatialHash)格子边长, 像素
+        self.collisionGridMinCount = 32  # 实体数低于该值时不建网格, 直接逐个检测
+        # 各类实体池的预热容量, 超出后按倍数扩容
+        self.poolCapacity = {
+            "projectilesPlayer": 64,
+            "enemies": 64,
+            "projectilesEnemy": 256,
+            "explosions": 32,
+            "items": 32,
+        }
 
 
 class Player:
@@ -47,18 +100,6 @@ class ProjectilePlayer:
         self.speed = 600
         self.damage = 1
 
-    @classmethod
-    def from_ProjectilePlayer(cls, src: "ProjectilePlayer") -> "ProjectilePlayer":
-        e = cls()
-        e.texture = src.texture
-        e.position = (sdl.SDL_FPoint(src.position.x, src.position.y)
-                      if src.position is not None else None)
-        e.width = src.width
-        e.height = src.height
-        e.speed = src.speed
-        e.damage = src.damage
-        return e
-
 class Enemy:
     def __init__(self):
         self.texture:Optional[sdl.SDL_Texture] = None
@@ -69,20 +110,7 @@ class Enemy:
         self.speed = 300
         self.coolDown = 1.0 * 1e9  # 转为ns
         self.lastShootTime = 0
-
-    @classmethod
-    def from_Enemy(cls, src: "Enemy") -> "Enemy":
-        e = cls()
-        e.texture = src.texture
-        e.position = (sdl.SDL_FPoint(src.position.x, src.position.y)
-                      if src.position is not None else None)
-        e.width = src.width
-        e.height = src.height
-        e.currentHealth = src.currentHealth
-        e.speed = src.speed
-        e.coolDown = src.coolDown
-        e.lastShootTime = src.lastShootTime
-        return e
+        self.type = 0  # 敌机模板下标
 
 
 class ProjectileEnemy:
@@ -95,18 +123,6 @@ class ProjectileEnemy:
         self.speed = 300
         self.damage = 1
 
-    @classmethod
-    def from_ProjectileEnemy(cls, src: "ProjectileEnemy") -> "ProjectileEnemy":
-        e = cls()
-        e.texture = src.texture
-        e.position = (sdl.SDL_FPoint(src.position.x, src.position.y)
-                      if src.position is not None else None)
-        e.width = src.width
-        e.height = src.height
-        e.speed = src.speed
-        e.damage = src.damage
-        return e
-
 
 class Background:
     def __init__(self):
@@ -116,6 +132,10 @@ class Background:
         self.height = 0
         self.offset = 0
         self.speed = 100
+        self.path = ""
+        self.scale = 1.0
+        self.target: Optional[sdl.SDL_Texture] = None  # 预合成的整屏平铺, 由 Starfield 管理
+        self.targetHeight = 0
 
 class Explosion:
     def __init__(self):
@@ -128,20 +148,6 @@ class Explosion:
         self.startTime = 0
         self.FPS = 10
 
-    @classmethod
-    def from_Explosion(cls, src: "Explosion") -> "Explosion":
-        e = cls()
-        e.texture = src.texture
-        e.position = (sdl.SDL_FPoint(src.position.x, src.position.y)
-                      if src.position is not None else None)
-        e.width = src.width
-        e.height = src.height
-        e.currentFrame = src.currentFrame
-        e.totalFrame = src.totalFrame
-        e.startTime = src.startTime
-        e.FPS = src.FPS
-        return e
-
 
 class ItemType(Enum):
     Life = auto()
@@ -159,21 +165,6 @@ class Item:
         self.bounceCount = 3
         self.type: Optional[ItemType] = ItemType.Life
 
-    @classmethod
-    def from_Item(cls, src: "Item") -> "Item":
-        e = cls()
-        e.texture = src.texture
-        e.position = (sdl.SDL_FPoint(src.position.x, src.position.y)
-                      if src.position is not None else None)
-        e.direction = (sdl.SDL_FPoint(src.direction.x, src.direction.y)
-                      if src.direction is not None else None)
-        e.width = src.width
-        e.height = src.height
-        e.speed = src.speed
-        e.bounceCount = src.bounceCount
-        e.type = src.type
-        return e
-
 class Shield:
     def __init__(self):
         self.texture: Optional[sdl.SDL_Texture] = None
@@ -0,0 +1,110 @@
+import csv
+import json
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List
+
+import numpy as np
+
+from Logger import GameLogger as log
+
+# 分阶段帧耗时统计: 每帧一行, 存进固定大小的环形缓冲(numpy), 不分配新对象
+#   profiler.begin("update")
+#   ...
+#   profiler.end("update")          # 同一帧内多次调用会累加(一帧可能模拟多个 tick)
+#   profiler.count("enemies", n)    # 计数类数据, 记录本帧最后一次的值
+#   profiler.endFrame()
+# 关闭时每个调用只做一次 enabled 判断, 开销可忽略
+# 不依赖 SDL, 模拟层与 tools/ 下的脚本也可以使用
+
+
+class Profiler:
+
+    MAX_COLUMNS = 64
+
+    def __init__(self, capacity: int = 600, enabled: bool = False):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.columns: Dict[str, int] = {}  # 名称 -> 列号, 按第一次出现的顺序
+        self.names: List[str] = []
+        self.counters = set()  # 计数类的列, 其余为耗时(ms)
+        self.data = np.zeros((capacity, self.MAX_COLUMNS), np.float64)
+        self.current = np.zeros(self.MAX_COLUMNS, np.float64)
+        self.starts: Dict[str, int] = {}
+        self.frames = 0
+
+    def column(self, name: str) -> int:
+        col = self.columns.get(name)
+        if col is None:
+            if len(self.names) >= self.MAX_COLUMNS:
+                log.warning("Profiler column limit reached, dropping {}", name)
+                return -1
+            col = len(self.names)
+            self.columns[name] = col
+            self.names.append(name)
+        return col
+
+    def begin(self, name: str) -> None:
+        if self.enabled:
+            self.starts[name] = perf_counter_ns()
+
+    def end(self, name: str) -> None:
+        if self.enabled:
+            start = self.starts.pop(name, None)
+            if start is not None:
+                col = self.column(name)
+                if col >= 0:
+                    self.current[col] += (perf_counter_ns() - start) / 1e6
+
+    def count(self, name: str, value: float) -> None:
+        if self.enabled:
+            col = self.column(name)
+            if col >= 0:
+                self.counters.add(name)
+                self.current[col] = value
+
+    def endFrame(self) -> None:
+        if not self.enabled:
+            return
+        self.data[self.frames % self.capacity] = self.current
+        self.current.fill(0.0)
+        self.starts.clear()
+        self.frames += 1
+
+    def rows(self) -> np.ndarray:
+        # 按时间顺序返回缓冲区中的帧, 只含已用到的列
+        n = min(self.frames, self.capacity)
+        if self.frames <= self.capacity:
+            rows = self.data[:n]
+        else:
+            start = self.frames % self.capacity
+            rows = np.concatenate((self.data[start:], self.data[:start]))
+        return rows[:, :len(self.names)]
+
+    def summary(self, window: int = 60) -> Dict[str, float]:
+        # 最近 window 帧: 耗时取平均, 计数取最新值
+        rows = self.rows()[-window:]
+        if len(rows) == 0:
+            return {}
+        means = rows.mean(axis=0)
+        return {name: float(rows[-1, i] if name in self.counters else means[i]) for i, name in enumerate(self.names)}
+
+    def export(self, path: str) -> None:
+        # 后缀为 .json 时导出 JSON, 否则导出 CSV
+        rows = self.rows()
+        first = self.frames - len(rows)
+        try:
+            if Path(path).suffix.lower() == ".json":
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({"columns": self.names, "counters": sorted(self.counters), "firstFrame": first,
+                               "rows": np.round(rows, 4).tolist()}, f)
+            else:
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["frame"] + self.names)
+                    for i, row in enumerate(rows):
+                        writer.writerow([first + i] + [f"{v:.4f}" for v in row])
+        except OSError as e:
+            log.error("Failed to export profile {}: {}", path, e)
+            return
+        log.info("Profile of {} frames written to {}", len(rows), path)
@@ -64,7 +64,7 @@ class SceneEnd(Scene):
 
     def renderPhase1(self) -> None:
         score = self.game.getFinalScore()
-        scoreText = self.game.localizer("endScore") + str(score)
+        scoreText = self.game.localizeFormat("endScore", score)
         gameOver = self.game.localizer("gameOver")
         instrutionText = self.game.localizer("inputName")
         instrutionText1 = self.game.localizer("ensureName")
@@ -75,7 +75,7 @@ class SceneEnd(Scene):
 
         if len(self.name) != 0:
             textname = "".join(self.name)
-            p = self.game.renderTextCentered(textname, 0.8, False)
+            p = self.game.renderTextCentered(textname, 0.8, False, True)  # 输入中的名字每次按键都会变
             if self.blinkTimer < 0.5:
                 self.game.renderTextPos("_", p.x, p.y, True)
         else:
@@ -86,9 +86,9 @@ class SceneEnd(Scene):
         self.game.renderTextCentered(self.game.localizer("scoreList"), 0.05, True) # 得分榜
         posY = 0.2 * self.game.getWindowHeight()
         i = 1
-        leaderBoard = self.game.getLeaderBoard()
-        for item in leaderBoard:
-            name = str(i) + ". " + leaderBoard[item]
+        # 已按分数从高到低排好, 同分按先后
+        for item, entryName in self.game.getLeaderBoard():
+            name = str(i) + ". " + entryName
             score = str(item)
             self.game.renderTextPos(name, 100, posY, True)
             self.game.renderTextPos(score, 100, posY, False)
@@ -1,50 +1,86 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 import sdl3 as sdl
-from sdl3 import SDL_image as img
-from sdl3 import SDL_mixer as mix
-from sdl3 import SDL_ttf as ttf
-from ctypes import c_float, byref
-import random
-import secrets  # 用于获取高质量随机种子
-import math
+
+import numpy as np
 
 from Logger import GameLogger as log
 from Scene import Scene
 from SceneEnd import SceneEnd
-from Object import Player, ProjectilePlayer, Enemy, ProjectileEnemy, Explosion, ItemType, Item, Shield
+from Object import ItemType
+from Simulation import Simulation, SimInput, SimEvent
+from SpriteBatch import SpriteBatch
+from InputRecorder import InputRecorder, InputReplay
+from TextureAtlas import AtlasRegion
 
 if TYPE_CHECKING:
     # 避免循环导入
     from Game import Game
 
+audioLog = log.category("audio")
+
+SOUND_PATHS = {
+    "bgm": "assets/music/03_Racing_Through_Asteroids_Loop.ogg",
+    "player_shoot": "assets/sound/laser_shoot4.wav",
+    "enemy_shoot": "assets/sound/xs_laser.wav",
+    "player_explode": "assets/sound/explosion1.wav",
+    "enemy_explode": "assets/sound/explosion3.wav",
+    "hit": "assets/sound/eff11.wav",
+    "get_item": "assets/sound/eff5.wav",
+}
+
+# 音效: (同时发声上限, 优先级); 声部不够时优先级高的抢占低的
+SOUND_VOICES = {
+    "player_shoot": (2, 2),
+    "enemy_shoot": (3, 0),
+    "player_explode": (1, 3),
+    "enemy_explode": (3, 1),
+    "hit": (2, 1),
+    "get_item": (1, 2),
+}
+
 class SceneMain(Scene):
-    def __init__(self, game: Game) -> None:
+    def __init__(self, game: Game, seed: Optional[int] = None) -> None:
         super().__init__(game)
-        seed = secrets.randbits(64)
-        self.rng = random.Random(seed)
+        # 回放时种子取自录像文件, 同样的输入才能得到同样的一局
+        self.replay: Optional[InputReplay] = None
+        self.recorder: Optional[InputRecorder] = None
+        self.pausePressed = False  # 上一个 tick 之后按过 P, 写进录像
+        if game.replayPath:
+            self.replay = InputReplay.open(game.replayPath)
+            if self.replay is not None:
+                seed = self.replay.seed
+        self.sim = Simulation(game.GlobalSettings, seed)
+        self.sim.profiler = game.profiler
+        self.sim.telemetry = game.telemetry
+        self.inputs = SimInput()
+        self.inputDriver = None  # 设置后由它填写 SimInput 而不是读键盘, 用于基准测试等脚本驱动
         self.uiHealth = None
-        self.scoreFont = None
-        self.score:Optional[int] = 0
-        self.player = Player()  
-        self.isDead = False    
+        self.scoreAtlas = None
         self.timerEnd = 0.0
-        self.projectilePlayerTemplate = ProjectilePlayer()
-        self.projectileEnemyTemplate = ProjectileEnemy()
-        self.enemyTemplates = []
-        self.explosionTemplate = Explosion()
-        self.itemLifeTemplate = Item()
-        self.itemShieldTemplate = Item()
-        self.itemTimeTemplate = Item()
-        self.ShieldTemplate = Shield()
-        self.projectilesPlayer = []
-        self.enemies = []
-        self.projectilesEnemy = []
-        self.explosions = []
-        self.items = []
+        # 精灵都是 Game 纹理图集中的子矩形(AtlasRegion)
+        self.playerSprite = None
+        self.projectilePlayerSprite = None
+        self.projectileEnemySprite = None
+        self.enemySprites = []
+        self.explosionSprite = None
+        self.itemSprites = {}
+        self.shieldSprite = None
+        self.batch: Optional[SpriteBatch] = None
+        self.alpha = 1.0  # 本帧的渲染插值系数
         self.sounds = {}
+        self.eventSounds = {
+            SimEvent.PlayerShoot: "player_shoot",
+            SimEvent.EnemyShoot: "enemy_shoot",
+            SimEvent.Hit: "hit",
+            SimEvent.EnemyExplode: "enemy_explode",
+            SimEvent.PlayerExplode: "player_explode",
+            SimEvent.GetItem: "get_item",
+        }
 
     def init(self) -> None:
+        # 预加载还没完成的部分在这里同步做完(之后的重新开始直接跳过)
+        self.game.getPreloader().finish()
 
         # 读取音频文件
         self.initMusic()
@@ -53,113 +89,106 @@ class SceneMain(Scene):
         self.playSoundByName("bgm")
 
         # 初始化UI
-        self.uiHealth = img.IMG_LoadTexture(self.game.getRenderer(),
-            self.game.to_abs_path("assets/image/Health_UI_Black.png").encode())
+        self.uiHealth = self.game.getSpriteAtlas().get("assets/image/Health_UI_Black.png")
+
+        self.batch = SpriteBatch(self.game.getRenderer())
 
         # 载入字体
-        self.scoreFont = ttf.TTF_OpenFont(self.game.to_abs_path("assets/font/VonwaonBitmap-12px.ttf").encode(), 24)
-
-        self.player.texture = img.IMG_LoadTexture(self.game.getRenderer(), self.game.to_abs_path("assets/image/SpaceShip.png").encode())
-
-        if self.player.texture is None:
-            log.error("Failed to load player texture: {}",sdl.SDL_GetError())
-
-        w = c_float()
-        h = c_float()
-        ok = sdl.SDL_GetTextureSize(self.player.texture, byref(w), byref(h))
-        if not ok:
-            log.error("Failed to get player texture size: {}", sdl.SDL_GetError())
-
-        self.player.width = int(int(w.value) / 5)
-        self.player.height = int(int(h.value) / 5)
-
-        self.player.position.x = self.game.getWindowWidth() / 2 - self.player.width / 2
-        self.player.position.y = self.game.getWindowHeight() - self.player.height
-
-        # 初始化模版
-        self.projectilePlayerTemplate.texture = img.IMG_LoadTexture(self.game.getRenderer(), 
-                                                                    self.game.to_abs_path("assets/image/bullet.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.projectilePlayerTemplate.texture, byref(w), byref(h))
-        self.projectilePlayerTemplate.width = int(int(w.value) / 2)
-        self.projectilePlayerTemplate.height = int(int(h.value) / 2)
-
-        enemyTemplate = Enemy()
-        enemyTemplate.texture = img.IMG_LoadTexture(self.game.getRenderer(), 
-                                                         self.game.to_abs_path("assets/image/insect-1.png").encode())
-        ok = sdl.SDL_GetTextureSize(enemyTemplate.texture, byref(w), byref(h))
-        enemyTemplate.width = int(int(w.value) / 4)
-        enemyTemplate.height = int(int(h.value) / 4)
-
-        self.enemyTemplates.append(enemyTemplate)
-
-        enemyTemplate = Enemy()
-        enemyTemplate.texture = img.IMG_LoadTexture(self.game.getRenderer(), 
-                                                         self.game.to_abs_path("assets/image/insect-2.png").encode())
-        ok = sdl.SDL_GetTextureSize(enemyTemplate.texture, byref(w), byref(h))
-        enemyTemplate.width = int(int(w.value) / 4)
-        enemyTemplate.height = int(int(h.value) / 4)
-
-        self.enemyTemplates.append(enemyTemplate)
-
-        self.projectileEnemyTemplate.texture = img.IMG_LoadTexture(self.game.getRenderer(), self.game.to_abs_path("assets/image/bullet-1.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.projectileEnemyTemplate.texture, byref(w), byref(h))
-        self.projectileEnemyTemplate.width = int(int(w.value) / 2)
-        self.projectileEnemyTemplate.height = int(int(h.value) / 2)
-
-        self.explosionTemplate.texture = img.IMG_LoadTexture(self.game.getRenderer(),
-            self.game.to_abs_path("assets/effect/explosion.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.explosionTemplate.texture, byref(w), byref(h))
-        self.explosionTemplate.width = int(w.value)
-        self.explosionTemplate.height = int(h.value)
-        self.explosionTemplate.totalFrame = (self.explosionTemplate.width / self.explosionTemplate.height)
-        self.explosionTemplate.height = int(self.explosionTemplate.height * 2)
-        self.explosionTemplate.width = self.explosionTemplate.height
-
-        self.itemLifeTemplate.type = ItemType.Life
-        self.itemLifeTemplate.texture = sdl.IMG_LoadTexture(self.game.getRenderer(),
-                                                            self.game.to_abs_path("assets/image/bonus_life.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.itemLifeTemplate.texture, byref(w), byref(h))
-        self.itemLifeTemplate.width = int(w.value / 4)
-        self.itemLifeTemplate.height = int(h.value / 4)
-
-        self.itemShieldTemplate.type = ItemType.Shield
-        self.itemShieldTemplate.texture = sdl.IMG_LoadTexture(self.game.getRenderer(),
-                                                            self.game.to_abs_path("assets/image/bonus_shield.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.itemShieldTemplate.texture, byref(w), byref(h))
-        self.itemShieldTemplate.width = int(w.value / 4)
-        self.itemShieldTemplate.height = int(h.value / 4)
-
-        self.itemTimeTemplate.type = ItemType.Time
-        self.itemTimeTemplate.texture = sdl.IMG_LoadTexture(self.game.getRenderer(),
-                                                            self.game.to_abs_path("assets/image/bonus_time.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.itemTimeTemplate.texture, byref(w), byref(h))
-        self.itemTimeTemplate.width = int(w.value / 4)
-        self.itemTimeTemplate.height = int(h.value / 4)
-
-        self.ShieldTemplate.texture = sdl.IMG_LoadTexture(self.game.getRenderer(),
-                                                            self.game.to_abs_path("assets/image/shield.png").encode())
-        ok = sdl.SDL_GetTextureSize(self.ShieldTemplate.texture, byref(w), byref(h))
-        self.ShieldTemplate.width = int(w.value / 2)
-        self.ShieldTemplate.height = int(h.value / 2)
+        self.scoreAtlas = self.game.getGlyphAtlas("assets/font/VonwaonBitmap-12px.ttf", 24)
+
+        # 从纹理图集取精灵, 并用实际图片尺寸覆盖模拟层的默认尺寸
+        sim = self.sim
+        self.playerSprite = self.loadSprite("assets/image/SpaceShip.png", sim.player)
+        self.projectilePlayerSprite = self.loadSprite("assets/image/bullet.png", sim.projectilePlayerTemplate)
+        for enemyTemplate, path in zip(sim.enemyTemplates, ("assets/image/insect-1.png", "assets/image/insect-2.png")):
+            self.enemySprites.append(self.loadSprite(path, enemyTemplate))
+        self.projectileEnemySprite = self.loadSprite("assets/image/bullet-1.png", sim.projectileEnemyTemplate)
+
+        self.explosionSprite = self.loadSprite("assets/effect/explosion.png", sim.explosionTemplate)
+        sim.explosionTemplate.totalFrame = (sim.explosionTemplate.width / sim.explosionTemplate.height)
+        sim.explosionTemplate.height = int(sim.explosionTemplate.height * 2)
+        sim.explosionTemplate.width = sim.explosionTemplate.height
+
+        self.itemSprites[ItemType.Life] = self.loadSprite("assets/image/bonus_life.png", sim.itemLifeTemplate)
+        self.itemSprites[ItemType.Shield] = self.loadSprite("assets/image/bonus_shield.png", sim.itemShieldTemplate)
+        self.itemSprites[ItemType.Time] = self.loadSprite("assets/image/bonus_time.png", sim.itemTimeTemplate)
+        self.shieldSprite = self.loadSprite("assets/image/shield.png", sim.ShieldTemplate)
+
+        sim.start()
+        sim.telemetry.beginRun(sim.seed)
+
+        if self.game.recordPath:
+            self.game.recordCount += 1
+            self.recorder = InputRecorder.open(self.game.recordPath, sim.seed, self.game.recordCount)
+
+    def loadSprite(self, path: str, template) -> Optional[AtlasRegion]:
+        atlas = self.game.getSpriteAtlas()
+        sprite = atlas.get(path)
+        if sprite is None:
+            return None
+        scale = self.game.GlobalSettings.spriteScales.get(path, 1)
+        template.width, template.height = atlas.spriteSize(path, sprite, scale)
+        return sprite
 
     def update(self, deltaTime: float) -> None:
-        self.keyboardControl(deltaTime)
-        self.updatePlayerProjectiles(deltaTime)
-        self.updateEnemyProjectiles(deltaTime)
-        self.spawEnemy()
-        self.updateEnemies(deltaTime)
-        self.updatePlayer(deltaTime)
-        self.updateExplosions(deltaTime)
-        self.updateItems(deltaTime)
-        if self.isDead == True:
+        # 暂停时模拟层不推进
+        if self.game.isPause:
+            return
+        if self.replay is not None:
+            # 回放: 输入和 tick 时长都取自录像, 放完后交还给键盘
+            recorded = self.replay.read(self.inputs)
+            if recorded is None:
+                log.info("Replay finished")
+                self.replay = None
+                self.readInput()
+            else:
+                deltaTime = recorded
+        else:
+            self.readInput()
+        if self.recorder is not None:
+            self.recorder.write(self.inputs, deltaTime, self.pausePressed)
+            self.pausePressed = False
+        self.sim.step(deltaTime, self.inputs)
+        self.inputs.useShield = False
+        self.inputs.useInvincible = False
+
+        for event in self.sim.events:
+            if event == SimEvent.PlayerExplode:
+                self.game.setFinalScore(self.sim.score)
+                self.game.setFinalRun(self.sim.time / 1e9, self.sim.kills, self.sim.seed)
+            self.playSoundByName(self.eventSounds[event])
+        # 同一 tick 的同名音效已合并, 这里统一分配声部
+        self.game.getAudio().flush()
+
+        if self.sim.isDead == True:
             self.changeSceneDelayed(deltaTime, 1)
 
+    def readInput(self) -> None:
+        if self.inputDriver is not None:
+            self.inputDriver(self.inputs)
+            return
+        keyboardState = sdl.SDL_GetKeyboardState(None)
+        self.inputs.up = bool(keyboardState[sdl.SDL_SCANCODE_W])
+        self.inputs.down = bool(keyboardState[sdl.SDL_SCANCODE_S])
+        self.inputs.left = bool(keyboardState[sdl.SDL_SCANCODE_A])
+        self.inputs.right = bool(keyboardState[sdl.SDL_SCANCODE_D])
+        self.inputs.shoot = bool(keyboardState[sdl.SDL_SCANCODE_J])
+
     def render(self) -> None:
+        # 精灵统一进批次, 同一纹理连续的绘制合并为一次 SDL_RenderGeometry
+        self.batch.begin()
+        # 移动的实体画在上一 tick 与当前 tick 之间的插值位置
+        self.alpha = self.game.getRenderAlpha()
+        prof = self.game.profiler
+
+        prof.begin("draw.projectiles")
         # 渲染玩家子弹
         self.renderPlayerProjectiles()
         # 渲染敌机子弹
         self.renderEnemyProjectiles()
+        prof.end("draw.projectiles")
 
+        prof.begin("draw.entities")
         # 渲染玩家
         self.renderPlayer()
 
@@ -174,69 +203,34 @@ class SceneMain(Scene):
 
         # 渲染爆炸效果
         self.renderExplosions()
+        prof.end("draw.entities")
 
-        # 渲染UI
+        # 渲染UI(图标与上面的精灵同属一张图集, 在这里一并提交)
+        prof.begin("draw.ui")
         self.renderUI()
+        prof.end("draw.ui")
+        if prof.enabled:
+            prof.count("drawCalls", self.batch.drawCalls)
 
         # 渲染暂停UI
         self.renderPause()
 
     def clean(self) -> None:
-        if self.player.texture is not None:
-            sdl.SDL_DestroyTexture(self.player.texture)
-
-        if self.uiHealth is not None:
-            sdl.SDL_DestroyTexture(self.uiHealth)
-
-        if self.scoreFont is not None:
-            ttf.TTF_CloseFont(self.scoreFont)
-
-        # 清理模板
-        if self.projectilePlayerTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.projectilePlayerTemplate.texture)
-        for enemyTemplate in self.enemyTemplates:
-            if enemyTemplate.texture is not None:
-                sdl.SDL_DestroyTexture(enemyTemplate.texture)
-        if self.projectileEnemyTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.projectileEnemyTemplate.texture)
-        if self.explosionTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.explosionTemplate.texture)
-        if self.itemLifeTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.itemLifeTemplate.texture)
-        if self.itemShieldTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.itemShieldTemplate.texture)
-        if self.itemTimeTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.itemTimeTemplate.texture)
-        if self.ShieldTemplate.texture is not None:
-            sdl.SDL_DestroyTexture(self.ShieldTemplate.texture)
-
-        for projectile in self.projectilesPlayer:
-            if projectile.texture is not None:
-                sdl.SDL_DestroyTexture(projectile.texture)
-        self.projectilesPlayer.clear()
-
-        for enemy in self.enemies:
-            if enemy.texture is not None:
-                sdl.SDL_DestroyTexture(enemy.texture)
-        self.enemies.clear()
-
-        for projectile in self.projectilesEnemy:
-            if projectile.texture is not None:
-                sdl.SDL_DestroyTexture(projectile.texture)
-        self.projectilesEnemy.clear()
-
-        for explosion in self.explosions:
-            if explosion.texture is not None:
-                sdl.SDL_DestroyTexture(explosion.texture)
-        self.explosions.clear()
-
-        for item in self.items:
-            if item.texture is not None:
-                sdl.SDL_DestroyTexture(item.texture)
-        self.items.clear()
-
-        for sound in self.sounds.values():
-            mix.MIX_DestroyAudio(sound)
+        for name, stats in self.sim.poolStats().items():
+            log.debug("Pool {}: {}", name, stats)
+
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+        # 纹理图集与字形图集都归 Game 所有, 场景重启时直接复用
+        self.enemySprites.clear()
+        self.itemSprites.clear()
+        self.scoreAtlas = None
+
+        for name in self.sounds:
+            self.game.getAudio().unregister(name)
+            self.game.getAssets().releaseAudio(SOUND_PATHS[name])
         self.sounds.clear()
 
     def handle_event(self, event: sdl.SDL_Event) -> None:
@@ -246,312 +240,55 @@ class SceneMain(Scene):
                 sceneTitle = SceneTitle(self.game)
                 self.game.changeScene(sceneTitle)
             if event.key.scancode == sdl.SDL_SCANCODE_K:
-                if self.player.currentShield > 0 and not self.player.isShielded:
-                    self.player.isShielded = not self.player.isShielded
-                    self.player.currentShield -= 1
-                    self.renderShields()
+                self.inputs.useShield = True
             if event.key.scancode == sdl.SDL_SCANCODE_L:
-                if self.player.currentInvincible > 0 and not self.player.isInvincible:
-                    self.player.isInvincible = not self.player.isInvincible
-                    self.player.currentInvincible -= 1
-                    sdl.SDL_SetTextureColorMod(self.player.texture, 255, 215, 100)
+                self.inputs.useInvincible = True
 
             if event.key.scancode == sdl.SDL_SCANCODE_TAB:
                 self.game.switchLanguage()
             if event.key.scancode == sdl.SDL_SCANCODE_P:
                 self.game.togglePause()
-
-    # 更新相关
-    def updatePlayer(self, deltaTime: float) -> None:
-        if self.isDead:
-            return
-        if self.player.currentHealth <= 0:
-            # todo Game Over
-            currentTime = sdl.SDL_GetTicksNS()
-            self.isDead = True
-            explosion = Explosion.from_Explosion(self.explosionTemplate)
-            explosion.position.x = (self.player.position.x + self.player.width / 2 - explosion.width / 2)
-            explosion.position.y = (self.player.position.y + self.player.height / 2 - explosion.height / 2)
-            explosion.startTime = currentTime
-            self.explosions.append(explosion)
-            self.playSoundByName("player_explode")
-            self.game.setFinalScore(self.score)
-            return
-
-        # 更新护盾
-        self.updateShield(deltaTime)
-
-        # 更新无敌
-        self.updateInvincible(deltaTime)
-
-        for enemy in self.enemies:
-            enemyRect = sdl.SDL_Rect(int(enemy.position.x), int(enemy.position.y), enemy.width, enemy.height)
-
-            playerRect = sdl.SDL_Rect(int(self.player.position.x),int(self.player.position.y),
-                                      self.player.width,self.player.height)
-            # 碰撞检测成功
-            if sdl.SDL_HasRectIntersection(enemyRect, playerRect):
-                if not self.player.isInvincible:
-                    self.player.currentHealth -= 1
-                enemy.currentHealth = 0
-
-    def updatePlayerProjectiles(self, deltaTime: float) -> None:
-        margin = 32  # 子弹超出屏幕外边界的距离
-        for i in range(len(self.projectilesPlayer) - 1, -1, -1):
-            p = self.projectilesPlayer[i]
-            p.position.y -= p.speed * deltaTime
-            if p.position.y + margin < 0:
-                self.projectilesPlayer.pop(i)
-            else:
-                # 检测与敌机的碰撞
-                for j in range(len(self.enemies) - 1, -1, -1):
-                    enemyRect = sdl.SDL_Rect(int(self.enemies[j].position.x),int(self.enemies[j].position.y),
-                        self.enemies[j].width,self.enemies[j].height)
-
-                    projectileRect = sdl.SDL_Rect(int(p.position.x), int(p.position.y), p.width, p.height)
-                    # 碰撞检测成功
-                    if sdl.SDL_HasRectIntersection(enemyRect, projectileRect):
-                        self.enemies[j].currentHealth -= p.damage
-                        self.projectilesPlayer.pop(i)
-                        self.playSoundByName("hit")
-                        break
-
-    def updateEnemies(self, deltaTime: float) -> None:
-        currentTime = sdl.SDL_GetTicksNS()
-        for i in range(len(self.enemies) - 1, -1, -1):
-            enemy = self.enemies[i]
-            enemy.position.y += enemy.speed * deltaTime
-            if enemy.position.y > self.game.getWindowHeight():
-                self.enemies.pop(i)
-            else:
-                # 敌机射击
-                if (currentTime - enemy.lastShootTime > enemy.coolDown) and (not self.isDead):
-                    self.enemyShoot(enemy)
-                    enemy.lastShootTime = currentTime
-
-                if enemy.currentHealth <= 0:
-                    self.enemyExplode(enemy)
-                    self.enemies.pop(i)
-
-    def updateEnemyProjectiles(self, deltaTime: float) -> None:
-        margin = 32  # 子弹超出屏幕外边界的距离
-        for i in range(len(self.projectilesEnemy) - 1, -1, -1):
-            projectile = self.projectilesEnemy[i]
-            projectile.position.x += (projectile.speed * projectile.direction.x * deltaTime)
-            projectile.position.y += (projectile.speed * projectile.direction.y * deltaTime)
-            if ((projectile.position.x > self.game.getWindowWidth() + margin)
-                or (projectile.position.x < -margin)
-                or (projectile.position.y < -margin)
-                or (projectile.position.x > self.game.getWindowWidth() + margin)):
-                self.projectilesEnemy.pop(i)
-            else:
-                # 检测与玩家护盾的碰撞
-                if self.player.isShielded:
-                    shieldRect = sdl.SDL_Rect(int(self.player.position.x + self.player.width / 2 - self.ShieldTemplate.width / 2),
-                                            int(self.player.position.y - 20 - self.ShieldTemplate.height / 2), 
-                                            self.ShieldTemplate.width, self.ShieldTemplate.height)
-                    projectileRect = sdl.SDL_Rect(int(projectile.position.x),int(projectile.position.y),
-                        projectile.width, projectile.height)
-                    # 碰撞检测成功
-                    if sdl.SDL_HasRectIntersection(shieldRect, projectileRect):
-                        self.projectilesEnemy.pop(i)
-                        self.playSoundByName("hit")
-                        break
-
-                # 检测与玩家的碰撞
-                projectileRect = sdl.SDL_Rect(int(projectile.position.x),int(projectile.position.y),
-                    projectile.width, projectile.height)
-
-                playerRect = sdl.SDL_Rect(int(self.player.position.x),int(self.player.position.y),
-                    self.player.width,self.player.height)
-
-                # 碰撞检测成功
-                if sdl.SDL_HasRectIntersection(projectileRect, playerRect) and not self.player.isInvincible:
-                    self.player.currentHealth -= projectile.damage
-                    self.projectilesEnemy.pop(i)
-                    self.playSoundByName("hit")
-
-    def updateExplosions(self, deltaTime: float) -> None:
-        currentTime = sdl.SDL_GetTicksNS()
-        for i in range(len(self.explosions) - 1, -1, -1):
-            explosion = self.explosions[i]
-            explosion.currentFrame = ((currentTime - explosion.startTime) * explosion.FPS / 1e9)
-            if explosion.currentFrame >= explosion.totalFrame:
-                self.explosions.pop(i)
-
-    def updateItems(self, deltaTime: float) -> None:
-        for i in range(len(self.items) - 1, -1, -1):
-            item = self.items[i]
-            # 更新位置
-            item.position.x += item.speed * item.direction.x * deltaTime
-            item.position.y += item.speed * item.direction.y * deltaTime
-
-            # 处理屏幕边缘反弹
-            if item.position.x < 0 and item.bounceCount > 0:
-                item.direction.x = -item.direction.x
-                item.bounceCount -= 1
-
-            if (item.position.x + item.width > self.game.getWindowWidth()
-                and item.bounceCount > 0):
-                item.direction.x = -item.direction.x
-                item.bounceCount -= 1
-
-            if item.position.y < 0 and item.bounceCount > 0:
-                item.direction.y = -item.direction.y
-                item.bounceCount -= 1
-
-            if (item.position.y + item.height > self.game.getWindowHeight() and item.bounceCount > 0):
-                item.direction.y = -item.direction.y
-                item.bounceCount -= 1
-
-            # 超出屏幕范围则删除
-            if ((item.position.x + item.width < 0)
-                or (item.position.x > self.game.getWindowWidth())
-                or (item.position.y + item.height < 0)
-                or (item.position.y > self.game.getWindowHeight())):
-                self.items.pop(i)
-            else:
-                # 检测与玩家的碰撞
-                itemRect = sdl.SDL_Rect(int(item.position.x), int(item.position.y), item.width, item.height)
-
-                playerRect = sdl.SDL_Rect(int(self.player.position.x),int(self.player.position.y),
-                    self.player.width, self.player.height,)
-
-                # 碰撞检测成功
-                if sdl.SDL_HasRectIntersection(itemRect, playerRect) and (not self.isDead):
-                    self.playerGetItem(item)
-                    self.items.pop(i)
-                    self.playSoundByName("get_item")
-
-    def updateShield(self, deltaTime: float) -> None:
-        if self.player.isShielded:
-            self.player.shieldCurrentTime -= deltaTime * 1e9
-            if self.player.shieldCurrentTime <= 0:
-                self.player.isShielded = False
-                self.player.shieldCurrentTime = self.player.shieldTime
-
-    def updateInvincible(self, deltaTime: float) -> None:
-        if self.player.isInvincible:
-            self.player.invincibleCurrentTime -= deltaTime * 1e9
-            if self.player.invincibleCurrentTime <= 0:
-                self.player.isInvincible = False
-                self.player.invincibleCurrentTime = self.player.invincibleTime
-                sdl.SDL_SetTextureColorMod(self.player.texture, 255, 255, 255)
-
-    def keyboardControl(self, deltaTime: float) -> None:
-        if self.isDead:
-            return
-
-        keyboardState = sdl.SDL_GetKeyboardState(None)
-
-        if keyboardState[sdl.SDL_SCANCODE_W]:
-            self.player.position.y -= deltaTime * self.player.speed
-
-        if keyboardState[sdl.SDL_SCANCODE_S]:
-            self.player.position.y += deltaTime * self.player.speed
-
-        if keyboardState[sdl.SDL_SCANCODE_A]:
-            self.player.position.x -= deltaTime * self.player.speed
-
-        if keyboardState[sdl.SDL_SCANCODE_D]:
-            self.player.position.x += deltaTime * self.player.speed
-
-        # 限制飞机的移动范围
-        if self.player.position.x < 0:
-            self.player.position.x = 0
-
-        if self.player.position.x > self.game.getWindowWidth() - self.player.width:
-            self.player.position.x = self.game.getWindowWidth() - self.player.width
-
-        if self.player.position.y < 0:
-            self.player.position.y = 0
-
-        if self.player.position.y > self.game.getWindowHeight() - self.player.height:
-            self.player.position.y = self.game.getWindowHeight() - self.player.height
-
-        # 控制子弹发射
-        if keyboardState[sdl.SDL_SCANCODE_J]:
-            currentTime = sdl.SDL_GetTicksNS()
-            if currentTime - self.player.lastShootTime > self.player.coolDown:
-                self.playerShoot()
-                self.player.lastShootTime = currentTime
-
-    def spawEnemy(self) -> None:
-        if self.game.isPause:
-            return
-        if self.rng.random() > 1 / self.game.GlobalSettings.SpawnEnemyStep:
-            return
-        # 间隔时间随机生成敌人
-        enemyTemplate = self.enemyTemplates[self.rng.randint(0, len(self.enemyTemplates) - 1)]
-        enemy = Enemy.from_Enemy(enemyTemplate)
-        enemy.position.x = self.rng.random() * (self.game.getWindowWidth() - enemy.width)
-        enemy.position.y = -enemy.height
-        self.enemies.append(enemy)
+                self.pausePressed = True
 
     # 渲染相关
     def renderPlayer(self) -> None:
-        if not self.isDead: 
-            playerRect = sdl.SDL_FRect(self.player.position.x, self.player.position.y,
-                        self.player.width, self.player.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.player.texture, None, playerRect)
+        player = self.sim.player
+        if not self.sim.isDead:
+            color = (1.0, 215 / 255, 100 / 255, 1.0) if player.isInvincible else (1.0, 1.0, 1.0, 1.0)
+            x, y = self.sim.playerRenderPosition(self.alpha)
+            self.drawSprite(self.playerSprite, x, y, player.width, player.height, color=color)
 
     def renderUI(self) -> None:
-        # 渲染血量
+        player = self.sim.player
+        shieldSprite = self.itemSprites[ItemType.Shield]
+        timeSprite = self.itemSprites[ItemType.Time]
+        dim = (100 / 255, 100 / 255, 100 / 255, 1.0)  # 颜色减淡
         x = 10
-        y = 10
         size = 32
         offset = 40
-        sdl.SDL_SetTextureColorMod(self.uiHealth, 100, 100, 100)  # 颜色减淡
-        for i in range(self.player.maxHealth):
-            BackRect = sdl.SDL_FRect(x + i * offset, y, size, size)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.uiHealth, None, BackRect)
-
-        sdl.SDL_SetTextureColorMod(self.uiHealth, 255, 255, 255)  # 当前剩余血量
-        for i in range(self.player.currentHealth):
-            currentRect = sdl.SDL_FRect(x + i * offset, y, size, size)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.uiHealth, None, currentRect)
+        # 渲染血量
+        y = 10
+        self.drawSprite(self.uiHealth, x + np.arange(player.maxHealth) * offset, y, size, size, color=dim)
+        self.drawSprite(self.uiHealth, x + np.arange(player.currentHealth) * offset, y, size, size)  # 当前剩余血量
 
         # 渲染护盾
         y = size + 10
-        size = 32
-        offset = 40
-        sdl.SDL_SetTextureColorMod(self.itemShieldTemplate.texture, 100, 100, 100)  # 颜色减淡
-        for i in range(self.player.maxShield):
-            BackRect = sdl.SDL_FRect(x + i * offset, y, size, size)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.itemShieldTemplate.texture, None, BackRect)
-
-        sdl.SDL_SetTextureColorMod(self.itemShieldTemplate.texture, 255, 255, 255)  # 当前剩余护盾
-        if self.player.currentShield > 0:  
-            for i in range(self.player.currentShield):
-                currentRect = sdl.SDL_FRect(x + i * offset, y, size, size)
-                sdl.SDL_RenderTexture(self.game.getRenderer(), self.itemShieldTemplate.texture, None, currentRect)        
+        self.drawSprite(shieldSprite, x + np.arange(player.maxShield) * offset, y, size, size, color=dim)
+        self.drawSprite(shieldSprite, x + np.arange(player.currentShield) * offset, y, size, size)  # 当前剩余护盾
 
         # 渲染无敌时间
         y = (size + 10) * 2
-        size = 32
-        sdl.SDL_SetTextureColorMod(self.itemTimeTemplate.texture, 100, 100, 100)  # 颜色减淡
-        BackRect = sdl.SDL_FRect(x, y, size, size)
-        sdl.SDL_RenderTexture(self.game.getRenderer(), self.itemTimeTemplate.texture, None, BackRect)
-
-        sdl.SDL_SetTextureColorMod(self.itemTimeTemplate.texture, 255, 255, 255)  # 当前无敌时间
-        if self.player.currentInvincible > 0:
-            currentRect = sdl.SDL_FRect(x, y, size, size)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.itemTimeTemplate.texture, None, currentRect)
-
-        # 渲染分数
-        text = self.game.localizer("score") + str(self.score)
-        scoreColor = sdl.SDL_Color(255, 255, 255, 255)
-        surface = ttf.TTF_RenderText_Solid(
-            self.scoreFont, text.encode("utf-8"), len(text.encode("utf-8")), scoreColor
-        )
-        surfaceRect = sdl.SDL_Rect()
-        sdl.SDL_GetSurfaceClipRect(surface, surfaceRect)
-        scoreTexture = sdl.SDL_CreateTextureFromSurface(self.game.getRenderer(), surface)
-        scoreRect = sdl.SDL_FRect(self.game.getWindowWidth() - 10 - surfaceRect.w,10,
-            surfaceRect.w, surfaceRect.h)
-        sdl.SDL_RenderTexture(self.game.getRenderer(), scoreTexture, None, scoreRect)
-        sdl.SDL_DestroySurface(surface)
-        sdl.SDL_DestroyTexture(scoreTexture)
+        self.drawSprite(timeSprite, x, y, size, size, color=dim)
+        if player.currentInvincible > 0:
+            self.drawSprite(timeSprite, x, y, size, size)  # 当前无敌时间
+
+        self.batch.flush()
+
+        # 渲染分数(字形图集, 不再每帧光栅化整串文字)
+        text = self.game.localizeFormat("score", self.sim.score)
+        if self.scoreAtlas is not None:
+            w, _ = self.scoreAtlas.measure(text)
+            self.scoreAtlas.draw(text, self.game.getWindowWidth() - 10 - w, 10)
 
     def renderPause(self) -> None:
         if self.game.isPause:
@@ -568,161 +305,86 @@ class SceneMain(Scene):
             self.game.renderTextCentered(self.game.localizer("pausePause"), 0.7, False)
             self.game.renderTextCentered(self.game.localizer("fullScreen"), 0.8, False)
 
+    def drawSprite(self, sprite, xs, ys, ws, hs, angles=None, color=(1.0, 1.0, 1.0, 1.0)) -> None:
+        if sprite is not None:
+            self.batch.draw(sprite.texture, xs, ys, ws, hs, src=sprite.src, angles=angles, color=color)
+
     def renderExplosions(self) -> None:
-        for explosion in self.explosions:
-            srcRect = sdl.SDL_FRect(int(explosion.currentFrame) * explosion.width / 2, 0,
-                explosion.width / 2, explosion.height / 2) # 原始范围扩大了 这里要还原
-            destRect = sdl.SDL_FRect(int(explosion.position.x),int(explosion.position.y),
-                explosion.width, explosion.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(),explosion.texture,srcRect,destRect)
+        ex = self.sim.explosions
+        n = ex.count
+        sprite = self.explosionSprite
+        if sprite is None:
+            return
+        w = ex.width[:n]
+        h = ex.height[:n]
+        # 原始范围扩大了 这里要还原; 帧沿图集子矩形横向排列
+        src = (sprite.x + ex.frame[:n].astype(np.int32) * w / 2, sprite.y, w / 2, h / 2)
+        self.batch.draw(sprite.texture, ex.posX[:n], ex.posY[:n], w, h, src=src)
 
     def renderPlayerProjectiles(self) -> None:
-        for projectile in self.projectilesPlayer:
-            projectileRect = sdl.SDL_FRect(int(projectile.position.x),int(projectile.position.y),
-                projectile.width,projectile.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), projectile.texture, None, projectileRect)
+        p = self.sim.projectilesPlayer
+        n = p.count
+        xs, ys = p.interpolate(self.alpha)
+        self.drawSprite(self.projectilePlayerSprite, xs, ys, p.width[:n], p.height[:n])
 
     def renderEnemyProjectiles(self) -> None:
-        for projectile in self.projectilesEnemy:
-            projectileRect = sdl.SDL_FRect(int(projectile.position.x),int(projectile.position.y),
-                projectile.width,projectile.height)
-            angle = (math.degrees(math.atan2(projectile.direction.y, projectile.direction.x)) - 90)
-            sdl.SDL_RenderTextureRotated( self.game.getRenderer(),projectile.texture,None,projectileRect,angle, None,False)
+        p = self.sim.projectilesEnemy
+        n = p.count
+        angles = np.degrees(np.arctan2(p.dirY[:n], p.dirX[:n])) - 90
+        xs, ys = p.interpolate(self.alpha)
+        self.drawSprite(self.projectileEnemySprite, xs, ys, p.width[:n], p.height[:n], angles=angles)
 
     def renderEnemies(self) -> None:
-        for enemy in self.enemies:
-            enemyRect = sdl.SDL_FRect(int(enemy.position.x), int(enemy.position.y), enemy.width, enemy.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), enemy.texture, None, enemyRect)
+        e = self.sim.enemies
+        n = e.count
+        types = e.type[:n]
+        xs, ys = e.interpolate(self.alpha)
+        for t, sprite in enumerate(self.enemySprites):
+            mask = types == t
+            self.drawSprite(sprite, xs[mask], ys[mask], e.width[:n][mask], e.height[:n][mask])
 
     def renderItems(self) -> None:
-        for item in self.items:
-            itemRect = sdl.SDL_FRect(int(item.position.x), int(item.position.y), item.width, item.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), item.texture, None, itemRect)
+        it = self.sim.items
+        n = it.count
+        types = it.type[:n]
+        xs, ys = it.interpolate(self.alpha)
+        for itemType, sprite in self.itemSprites.items():
+            mask = types == itemType.value
+            self.drawSprite(sprite, xs[mask], ys[mask], it.width[:n][mask], it.height[:n][mask])
 
     def renderShields(self) -> None:
-        if self.player.isShielded:
-            sdl.SDL_SetTextureColorMod(self.ShieldTemplate.texture, 255, 255, 255)
+        player = self.sim.player
+        shield = self.sim.ShieldTemplate
+        if player.isShielded:
             # 生成护盾在玩家正前方
-            shieldRect = sdl.SDL_FRect(self.player.position.x + self.player.width / 2 - self.ShieldTemplate.width / 2,
-                                    self.player.position.y - 20 - self.ShieldTemplate.height / 2, 
-                                    self.ShieldTemplate.width, self.ShieldTemplate.height)
-            sdl.SDL_RenderTexture(self.game.getRenderer(), self.ShieldTemplate.texture, None, shieldRect)
+            x, y = self.sim.playerRenderPosition(self.alpha)
+            self.drawSprite(self.shieldSprite, x + player.width / 2 - shield.width / 2,
+                            y - 20 - shield.height / 2, shield.width, shield.height)
 
     # 其他
-    def playerShoot(self) -> None:
-        # 发射子弹
-        projectile = ProjectilePlayer.from_ProjectilePlayer(self.projectilePlayerTemplate)
-        projectile.position.x = self.player.position.x + self.player.width / 2 - projectile.width / 2
-        projectile.position.y = self.player.position.y
-        self.projectilesPlayer.append(projectile)
-        self.playSoundByName("player_shoot")
-
-    def enemyShoot(self, enemy: Enemy) -> None:
-        projectile = ProjectileEnemy.from_ProjectileEnemy(self.projectileEnemyTemplate)
-        projectile.position.x = enemy.position.x + enemy.width / 2 - projectile.width / 2
-        projectile.position.y = enemy.position.y + enemy.height / 2 - projectile.height / 2
-        projectile.direction = self.getDirection(enemy)
-        self.projectilesEnemy.append(projectile)
-        self.playSoundByName("enemy_shoot")
-
-    def getDirection(self, enemy: Enemy) -> sdl.SDL_FPoint:
-        x = (self.player.position.x + self.player.width / 2) - (enemy.position.x + enemy.width / 2)
-        y = (self.player.position.y + self.player.height / 2) - (enemy.position.y + enemy.height / 2)
-        length = math.sqrt(x * x + y * y)
-        x /= length
-        y /= length
-        return sdl.SDL_FPoint(x, y)
-
-    def enemyExplode(self, enemy: Enemy) -> None:
-        currentTime = sdl.SDL_GetTicksNS()
-        explosion = Explosion.from_Explosion(self.explosionTemplate)
-        explosion.position.x = enemy.position.x + enemy.width / 2 - explosion.width / 2
-        explosion.position.y = (enemy.position.y + enemy.height / 2 - explosion.height / 2)
-        explosion.startTime = currentTime
-        self.explosions.append(explosion)
-
-        self.score += 10
-
-        self.playSoundByName("enemy_explode")
-
-        # 判断是否需要生成物品
-        if self.rng.random() < self.game.GlobalSettings.DropItemRate:
-            self.dropItem(enemy)
-
-    def dropItem(self, enemy: Enemy) -> None:
-        item = None
-        if self.rng.random() < self.game.GlobalSettings.timeItemRate:
-            item = Item.from_Item(self.itemTimeTemplate)
-        elif self.rng.random() < self.game.GlobalSettings.shieldItemRate:
-            item = Item.from_Item(self.itemShieldTemplate)
-        else:
-            item = Item.from_Item(self.itemLifeTemplate)
-
-        item.position.x = enemy.position.x + enemy.width / 2 - item.width / 2
-        item.position.y = enemy.position.y + enemy.height / 2 - item.height / 2
-        angle = self.rng.random() * 2.0 * math.pi
-        item.direction.x = math.cos(angle)
-        item.direction.y = math.sin(angle)
-        self.items.append(item)
-
-    def playerGetItem(self, item: Item) -> None:
-        self.score += 5
-        if item.type == ItemType.Life:
-            self.player.currentHealth += 1
-            if self.player.currentHealth > self.player.maxHealth:
-                self.player.currentHealth = self.player.maxHealth
-        elif item.type == ItemType.Shield:
-            self.player.currentShield += 1
-        elif item.type == ItemType.Time:
-            self.player.currentInvincible += 1
-
-    def playerUseShield(self) -> None:
-        if self.player.currentShield > 0:
-            self.player.currentShield -= 1
-            self.player.isShielded = True
-            self.playSoundByName("hit")
-
     def initMusic(self) -> None:
-        self.sounds["bgm"] = sdl.MIX_LoadAudio(self.game.getMixer(), 
-                                                self.game.to_abs_path("assets/music/03_Racing_Through_Asteroids_Loop.ogg").encode(), False)
-        self.sounds["player_shoot"] = sdl.MIX_LoadAudio(self.game.getMixer(), 
-                                                self.game.to_abs_path("assets/sound/laser_shoot4.wav").encode(), False)
-        self.sounds["enemy_shoot"] = sdl.MIX_LoadAudio(self.game.getMixer(), 
-                                                self.game.to_abs_path("assets/sound/xs_laser.wav").encode(), False)
-        self.sounds["player_explode"] = sdl.MIX_LoadAudio(self.game.getMixer(),
-                                                self.game.to_abs_path("assets/sound/explosion1.wav").encode(), False)
-        self.sounds["enemy_explode"] = sdl.MIX_LoadAudio(self.game.getMixer(),
-                                                self.game.to_abs_path("assets/sound/explosion3.wav").encode(), False)
-        self.sounds["hit"] = sdl.MIX_LoadAudio(self.game.getMixer(), 
-                                                self.game.to_abs_path("assets/sound/eff11.wav").encode(), False)
-        self.sounds["get_item"] = sdl.MIX_LoadAudio(self.game.getMixer(), 
-                                                self.game.to_abs_path("assets/sound/eff5.wav").encode(), False)
+        # 音频常驻在 AssetManager 中, 重新开始游戏时不再重复解码
+        # 音效预先解码, 播放时不再在混音线程里解码; 背景音乐流式解码
+        audio = self.game.getAudio()
+        for name, path in SOUND_PATHS.items():
+            self.sounds[name] = self.game.getAssets().acquireAudio(path, True, predecode=name != "bgm")
+            if name in SOUND_VOICES and self.sounds[name]:
+                audio.register(name, self.sounds[name], *SOUND_VOICES[name])
 
     def playSoundByName(self, name: str) -> None:
         if name not in self.sounds:
-            log.error("Sound {} not found!", name)
+            audioLog.error("Sound {} not found!", name)
             return
 
         if self.game.isPause:
             return
 
-        sound = self.sounds[name]
         if name == "bgm":
-            props = sdl.SDL_CreateProperties()
-            ok = sdl.SDL_SetNumberProperty(props, mix.MIX_PROP_PLAY_LOOPS_NUMBER, -1) # 无限循环
-            if not ok:
-                log.error("Failed to set property for sound {}: {}", name, sdl.SDL_GetError())
-
-            mix.MIX_SetTrackAudio(self.game.getBGMTrack(), sound)
-            isPlayBack = sdl.MIX_PlayTrack(self.game.getBGMTrack(), props)
+            isPlayBack = self.game.getAudio().playLoop(self.game.getBGMTrack(), self.sounds[name])  # 无限循环
             if not isPlayBack:
-                log.error("Failed to play sound {}: {}", name, sdl.SDL_GetError())
-
+                audioLog.error("Failed to play sound {}: {}", name, sdl.SDL_GetError())
         else:
-            mix.MIX_SetTrackAudio(self.game.getMusicTrack(), sound)
-            isPlayBack = sdl.MIX_PlayTrack(self.game.getMusicTrack(), 0)
-            if not isPlayBack:
-                log.error("Failed to play sound {}: {}", name, sdl.SDL_GetError())
+            self.game.getAudio().play(name)
 
     def changeSceneDelayed(self, deltaTime: float, delay: float) -> None:
         self.timerEnd += deltaTime
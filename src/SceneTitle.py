@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 import sdl3 as sdl
-from sdl3 import SDL_mixer as mix
 from ctypes import byref
 
 from Logger import GameLogger as log
@@ -12,6 +11,8 @@ if TYPE_CHECKING:
     # 避免循环导入
     from Game import Game
 
+TITLE_BGM = "assets/music/06_Battle_in_Space_Intro.ogg"
+
 class SceneTitle(Scene):
     def __init__(self, game: Game) -> None:
         super().__init__(game)
@@ -20,14 +21,8 @@ class SceneTitle(Scene):
 
     def init(self) -> None:
         # 载入并播放背景音乐
-        self.bgm = sdl.MIX_LoadAudio(self.game.getMixer(), self.game.to_abs_path("assets/music/06_Battle_in_Space_Intro.ogg").encode(), False)
-        props = sdl.SDL_CreateProperties()
-        ok = sdl.SDL_SetNumberProperty(props, mix.MIX_PROP_PLAY_LOOPS_NUMBER, -1) # 无限循环
-        if not ok:
-            log.error("Failed to set property for sound TitleBGM: {}", sdl.SDL_GetError())
-
-        mix.MIX_SetTrackAudio(self.game.getBGMTrack(), self.bgm)
-        isPlayBack = sdl.MIX_PlayTrack(self.game.getBGMTrack(), props)
+        self.bgm = self.game.getAssets().acquireAudio(TITLE_BGM, True)
+        isPlayBack = self.game.getAudio().playLoop(self.game.getBGMTrack(), self.bgm)  # 无限循环
         if not isPlayBack:
             log.error("Failed to play sound TitleBGM: {}", sdl.SDL_GetError())
 
@@ -48,16 +43,22 @@ class SceneTitle(Scene):
             changeLang = self.game.localizer("titleChangeLang")
             self.game.renderTextCentered(changeLang, 0.7, False) 
 
-        versionText = self.game.localizer("version") + self.game.Version
+        versionText = self.game.localizeFormat("version", self.game.Version)
         self.game.renderTextAtPercent(versionText,0.5, 0.01, 0.95, True)
 
+        # 利用标题界面的空闲时间推进后台预加载; 放在 render 里保证每个渲染帧只推进一次,
+        # 与本帧模拟了几个 tick 无关
+        self.game.getPreloader().pump(self.game.GlobalSettings.preloadSliceNs)
+
     def clean(self) -> None:
         if self.bgm is not None:
-            mix.MIX_DestroyAudio(self.bgm)
+            self.game.getAssets().releaseAudio(TITLE_BGM)
+            self.bgm = None
 
     def handle_event(self, event : sdl.SDL_Event) -> None:
         if event.type == sdl.SDL_EVENT_KEY_DOWN:
             if event.key.scancode == sdl.SDL_SCANCODE_SPACE:
+                self.game.getPreloader().reportReady()
                 sceneMain = SceneMain(self.game)
                 self.game.changeScene(sceneMain)
             if event.key.scancode == sdl.SDL_SCANCODE_TAB:
@@ -0,0 +1,185 @@
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from Logger import GameLogger as log
+from LeaderBoard import LeaderBoard
+
+ioLog = log.category("io")
+
+# 历史成绩库: 每一局都存进 SQLite(WAL 模式), 排行榜只是它前 K 名的内存缓存
+#   store = ScoreStore(path, capacity=8)
+#   store.open(legacyPath)             # 第一次打开时导入旧的 save.dat
+#   store.addRun(score, name, duration, kills, seed)   # 立即返回, 后台线程写库
+#   for score, name in store.board: ...                # 前 K 名, 渲染时 O(K)
+#   store.best("abc")                  # 该名字的最好成绩
+#   store.recent(10)                   # 最近的几局
+#   store.close()
+# 数据库连接只在唯一的工作线程里使用, 读写按提交顺序执行, 读到的总是已经写入的数据;
+# best/recent 的结果缓存在内存里, 插入新成绩时清空
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    duration REAL,
+    kills INTEGER,
+    seed INTEGER,
+    createdAt REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_score ON runs (score DESC, id);
+CREATE INDEX IF NOT EXISTS runs_name_score ON runs (name, score DESC);
+CREATE INDEX IF NOT EXISTS runs_created ON runs (createdAt DESC);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+Run = Tuple[int, str, Optional[float], Optional[int], Optional[int], float]  # score, name, duration, kills, seed, createdAt
+
+
+def toSigned(seed: Optional[int]) -> Optional[int]:
+    # 种子是 64 位无符号数, SQLite INTEGER 是有符号 64 位, 高位为 1 的按补码存
+    if seed is not None and seed >= 1 << 63:
+        return seed - (1 << 64)
+    return seed
+
+
+def fromSigned(seed: Optional[int]) -> Optional[int]:
+    if seed is not None and seed < 0:
+        return seed + (1 << 64)
+    return seed
+
+
+def unpackRun(row: tuple) -> Run:
+    score, name, duration, kills, seed, createdAt = row
+    return score, name, duration, kills, fromSigned(seed), createdAt
+
+
+class ScoreStore:
+    def __init__(self, path: Path, capacity: int = 8):
+        self.path = Path(path)
+        self.board = LeaderBoard(capacity)  # 全局前 K 名
+        self.cache = {}  # 查询 -> 结果, 插入新成绩时清空
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scores")
+        self.db: Optional[sqlite3.Connection] = None
+
+    def open(self, legacyPath: Optional[Path] = None) -> None:
+        try:
+            top = self.executor.submit(self.connect, legacyPath).result()
+        except (sqlite3.Error, OSError) as e:
+            ioLog.error("[loadData] Failed to open score database {}: {}", self.path, e)
+            return
+        self.board.clear()
+        for score, name in top:
+            self.board.insert(score, name)
+
+    def connect(self, legacyPath: Optional[Path]) -> List[Tuple[int, str]]:
+        # 工作线程中执行
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # WAL 下提交不再 fsync, 崩溃最多丢最后几局
+        self.db.executescript(SCHEMA)
+        if legacyPath is not None:
+            self.importLegacy(legacyPath)
+        return self.db.execute("SELECT score, name FROM runs ORDER BY score DESC, id LIMIT ?",
+                               (self.board.capacity,)).fetchall()
+
+    def importLegacy(self, legacyPath: Path) -> None:
+        # 旧版只存前 8 名的文本存档, 只导入一次; 原文件保留不动
+        if self.db.execute("SELECT 1 FROM meta WHERE key = 'legacyImported'").fetchone():
+            return
+        rows = []
+        if legacyPath.is_file():
+            legacy = LeaderBoard(1 << 30)
+            try:
+                with legacyPath.open("r", encoding="utf-8") as f:
+                    legacy.loadLines(f)
+            except OSError as e:
+                # 可能只是暂时读不到, 不标记为已导入, 下次启动再试
+                ioLog.error("[loadData] Failed to read {}: {}", legacyPath, e)
+                return
+            except ValueError as e:
+                # 编码不对, 再试也一样: 跳过导入
+                ioLog.error("[loadData] Failed to decode {}, skipping import: {}", legacyPath, e)
+                legacy.clear()
+            now = time.time()
+            rows = [(score, name, now) for score, name in legacy]
+        with self.db:
+            self.db.executemany("INSERT INTO runs (score, name, createdAt) VALUES (?, ?, ?)", rows)
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('legacyImported', ?)", (str(len(rows)),))
+        if rows:
+            ioLog.info("Imported {} scores from {}", len(rows), legacyPath)
+
+    def addRun(self, score: int, name: str, duration: Optional[float] = None, kills: Optional[int] = None,
+               seed: Optional[int] = None) -> Optional[int]:
+        # 返回在前 K 名中的名次(从 0 开始), 没进榜返回 None
+        self.cache.clear()
+        future = self.executor.submit(self.insert, (score, name, duration, kills, toSigned(seed), time.time()))
+        future.add_done_callback(self.checkWrite)
+        return self.board.insert(score, name)
+
+    def checkWrite(self, future) -> None:
+        # insert 之外的异常也不能悄悄丢在 future 里
+        e = future.exception()
+        if e is not None:
+            ioLog.error("[saveData] Failed to save run: {!r}", e)
+
+    def insert(self, run: Run) -> None:
+        if self.db is None:
+            return
+        try:
+            with self.db:
+                self.db.execute("INSERT INTO runs (score, name, duration, kills, seed, createdAt) "
+                                "VALUES (?, ?, ?, ?, ?, ?)", run)
+        except sqlite3.Error as e:
+            ioLog.error("[saveData] Failed to save run: {}", e)
+
+    def query(self, sql: str, args: tuple) -> list:
+        key = (sql, args)
+        rows = self.cache.get(key)
+        if rows is None:
+            rows = self.executor.submit(self.fetch, sql, args).result()
+            self.cache[key] = rows
+        return rows
+
+    def fetch(self, sql: str, args: tuple) -> list:
+        if self.db is None:
+            return []
+        try:
+            return self.db.execute(sql, args).fetchall()
+        except sqlite3.Error as e:
+            ioLog.error("Score query failed: {}", e)
+            return []
+
+    def top(self, k: int) -> List[Tuple[int, str]]:
+        if k <= self.board.capacity:
+            return list(self.board)[:k]
+        return self.query("SELECT score, name FROM runs ORDER BY score DESC, id LIMIT ?", (k,))
+
+    def best(self, name: str) -> Optional[Run]:
+        rows = self.query("SELECT score, name, duration, kills, seed, createdAt FROM runs "
+                          "WHERE name = ? ORDER BY score DESC LIMIT 1", (name,))
+        return unpackRun(rows[0]) if rows else None
+
+    def recent(self, n: int) -> List[Run]:
+        rows = self.query("SELECT score, name, duration, kills, seed, createdAt FROM runs "
+                          "ORDER BY createdAt DESC LIMIT ?", (n,))
+        return [unpackRun(row) for row in rows]
+
+    def count(self) -> int:
+        return self.query("SELECT COUNT(*) FROM runs", ())[0][0]
+
+    def close(self) -> None:
+        # 等待排队中的写入完成
+        if self.executor is None:
+            return
+        self.executor.submit(self.disconnect).result()
+        self.executor.shutdown(wait=True)
+        self.executor = None
+
+    def disconnect(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
@@ -0,0 +1,541 @@
+from __future__ import annotations
+from enum import Enum, auto
+from typing import Optional
+import random
+import secrets  # 用于获取高质量随机种子
+import math
+
+import numpy as np
+
+from Collision import overlapsRect, overlapPairs, firstHitsOfPairs
+from EntityStore import EntityStore
+from Profiler import Profiler
+from SpatialHash import SpatialHash
+from Telemetry import (Telemetry, EVENT_SPAWN, EVENT_PLAYER_SHOOT, EVENT_ENEMY_SHOOT, EVENT_HIT, EVENT_KILL,
+                       EVENT_ITEM_DROP, EVENT_ITEM_PICKUP, EVENT_DAMAGE, EVENT_SHIELD_BLOCK, EVENT_PLAYER_DEATH)
+from Object import GlobalObject, Player, ProjectilePlayer, Enemy, ProjectileEnemy, Explosion, ItemType, Item, Shield
+
+# 纯逻辑层: 不持有任何 SDL 句柄(窗口/渲染器/纹理/混音器),
+# 时间与输入都由调用方显式传入, 可以在无显示设备的环境下以任意速度步进
+#   sim = Simulation(GlobalObject(), seed=1234)
+#   sim.start()
+#   for _ in range(10000):
+#       sim.step(1 / 60, SimInput())
+
+
+class SimEvent(Enum):
+    PlayerShoot = auto()
+    EnemyShoot = auto()
+    Hit = auto()
+    EnemyExplode = auto()
+    PlayerExplode = auto()
+    GetItem = auto()
+
+
+class SimInput:
+    def __init__(self):
+        # 持续按键
+        self.up = False
+        self.down = False
+        self.left = False
+        self.right = False
+        self.shoot = False
+        # 单次触发(按下时置位, 下一次 step 消费)
+        self.useShield = False
+        self.useInvincible = False
+
+
+class Simulation:
+    def __init__(self, settings: GlobalObject, seed: Optional[int] = None) -> None:
+        self.settings = settings
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self.rng = random.Random(self.seed)
+        self.width = settings.windowWidth
+        self.height = settings.windowHeight
+        self.time = 0.0  # 模拟时间 ns
+        self.tick = 0
+        self.playerPrevX = 0.0  # 上一 tick 的玩家位置, 用于渲染插值
+        self.playerPrevY = 0.0
+        self.score = 0
+        self.kills = 0  # 击毁的敌机数
+        self.player = Player()
+        self.isDead = False
+        self.projectilePlayerTemplate = ProjectilePlayer()
+        self.projectileEnemyTemplate = ProjectileEnemy()
+        self.enemyTemplates = []
+        self.explosionTemplate = Explosion()
+        self.itemLifeTemplate = Item()
+        self.itemShieldTemplate = Item()
+        self.itemTimeTemplate = Item()
+        self.ShieldTemplate = Shield()
+        capacity = settings.poolCapacity
+        self.projectilesPlayer = EntityStore(capacity["projectilesPlayer"])
+        self.enemies = EntityStore(capacity["enemies"])
+        self.projectilesEnemy = EntityStore(capacity["projectilesEnemy"])
+        self.explosions = EntityStore(capacity["explosions"])
+        self.items = EntityStore(capacity["items"])
+        cellSize = settings.collisionCellSize
+        minCount = settings.collisionGridMinCount
+        self.enemyGrid = SpatialHash(self.width, self.height, cellSize, minCount)
+        self.projectileEnemyGrid = SpatialHash(self.width, self.height, cellSize, minCount)
+        self.itemGrid = SpatialHash(self.width, self.height, cellSize, minCount)
+        self.events = []  # 本次 step 产生的事件, 由表现层消费(音效等)
+        self.profiler = Profiler()  # 默认关闭; SceneMain 换成 Game 的 profiler
+        self.telemetry = Telemetry()  # 同上, 默认关闭
+        self.initTemplates()
+
+    def initTemplates(self) -> None:
+        # 默认尺寸与 assets 中的贴图一致, 有渲染器时由 SceneMain 按实际纹理尺寸覆盖
+        self.player.width = 48
+        self.player.height = 37
+        self.projectilePlayerTemplate.width = 40
+        self.projectilePlayerTemplate.height = 63
+
+        for i, (w, h) in enumerate(((27, 24), (45, 40))):
+            enemyTemplate = Enemy()
+            enemyTemplate.type = i
+            enemyTemplate.width = w
+            enemyTemplate.height = h
+            self.enemyTemplates.append(enemyTemplate)
+
+        self.projectileEnemyTemplate.width = 7
+        self.projectileEnemyTemplate.height = 21
+
+        self.explosionTemplate.width = 64
+        self.explosionTemplate.height = 64
+        self.explosionTemplate.totalFrame = 9
+
+        self.itemLifeTemplate.type = ItemType.Life
+        self.itemShieldTemplate.type = ItemType.Shield
+        self.itemTimeTemplate.type = ItemType.Time
+        for itemTemplate in (self.itemLifeTemplate, self.itemShieldTemplate, self.itemTimeTemplate):
+            itemTemplate.width = 21
+            itemTemplate.height = 21
+
+        self.ShieldTemplate.width = 161
+        self.ShieldTemplate.height = 90
+
+    def start(self) -> None:
+        # 模版尺寸确定后调用: 玩家出生在屏幕底部中央, 开局即可射击
+        self.player.position.x = self.width / 2 - self.player.width / 2
+        self.player.position.y = self.height - self.player.height
+        self.player.lastShootTime = self.time - self.player.coolDown - 1
+        self.playerPrevX = self.player.position.x
+        self.playerPrevY = self.player.position.y
+
+    def step(self, deltaTime: float, inputs: SimInput) -> None:
+        # 记下上一 tick 的位置, 供渲染插值
+        self.playerPrevX = self.player.position.x
+        self.playerPrevY = self.player.position.y
+        for store in (self.projectilesPlayer, self.enemies, self.projectilesEnemy, self.explosions, self.items):
+            store.snapshot()
+
+        self.events.clear()
+        self.tick += 1
+        self.time += deltaTime * 1e9
+        self.telemetry.tick = self.tick & 0xFFFFFFFF
+        prof = self.profiler
+        prof.begin("sim.input")
+        self.applyInput(deltaTime, inputs)
+        prof.end("sim.input")
+        prof.begin("sim.playerProjectiles")
+        self.updatePlayerProjectiles(deltaTime)
+        prof.end("sim.playerProjectiles")
+        prof.begin("sim.enemyProjectiles")
+        self.updateEnemyProjectiles(deltaTime)
+        prof.end("sim.enemyProjectiles")
+        prof.begin("sim.enemies")
+        self.spawEnemy(deltaTime)
+        self.updateEnemies(deltaTime)
+        self.resolveEnemyDeaths()
+        prof.end("sim.enemies")
+        prof.begin("sim.player")
+        self.updatePlayer(deltaTime)
+        prof.end("sim.player")
+        prof.begin("sim.explosions")
+        self.updateExplosions(deltaTime)
+        prof.end("sim.explosions")
+        prof.begin("sim.items")
+        self.updateItems(deltaTime)
+        prof.end("sim.items")
+        prof.begin("sim.compact")
+        self.compact()
+        prof.end("sim.compact")
+        if prof.enabled:
+            prof.count("projectilesPlayer", self.projectilesPlayer.count)
+            prof.count("enemies", self.enemies.count)
+            prof.count("projectilesEnemy", self.projectilesEnemy.count)
+            prof.count("explosions", self.explosions.count)
+            prof.count("items", self.items.count)
+
+    def playerRenderPosition(self, alpha: float):
+        x = self.playerPrevX + (self.player.position.x - self.playerPrevX) * alpha
+        y = self.playerPrevY + (self.player.position.y - self.playerPrevY) * alpha
+        return x, y
+
+    def compact(self) -> None:
+        # 每帧一次: 统一回收本帧所有被 release 的实体
+        for store in (self.projectilesPlayer, self.enemies, self.projectilesEnemy, self.explosions, self.items):
+            store.compact()
+
+    def playerRect(self):
+        return (int(self.player.position.x), int(self.player.position.y), self.player.width, self.player.height)
+
+    def shieldRect(self):
+        return (int(self.player.position.x + self.player.width / 2 - self.ShieldTemplate.width / 2),
+                int(self.player.position.y - 20 - self.ShieldTemplate.height / 2),
+                self.ShieldTemplate.width, self.ShieldTemplate.height)
+
+    # 更新相关
+    def applyInput(self, deltaTime: float, inputs: SimInput) -> None:
+        if self.isDead:
+            return
+
+        if inputs.useShield:
+            self.playerUseShield()
+        if inputs.useInvincible:
+            self.playerUseInvincible()
+
+        if inputs.up:
+            self.player.position.y -= deltaTime * self.player.speed
+
+        if inputs.down:
+            self.player.position.y += deltaTime * self.player.speed
+
+        if inputs.left:
+            self.player.position.x -= deltaTime * self.player.speed
+
+        if inputs.right:
+            self.player.position.x += deltaTime * self.player.speed
+
+        # 限制飞机的移动范围
+        if self.player.position.x < 0:
+            self.player.position.x = 0
+
+        if self.player.position.x > self.width - self.player.width:
+            self.player.position.x = self.width - self.player.width
+
+        if self.player.position.y < 0:
+            self.player.position.y = 0
+
+        if self.player.position.y > self.height - self.player.height:
+            self.player.position.y = self.height - self.player.height
+
+        # 控制子弹发射
+        if inputs.shoot:
+            if self.time - self.player.lastShootTime > self.player.coolDown:
+                self.playerShoot()
+                self.player.lastShootTime = self.time
+
+    def updatePlayer(self, deltaTime: float) -> None:
+        if self.isDead:
+            return
+        if self.player.currentHealth <= 0:
+            self.isDead = True
+            self.spawnExplosion(self.player.position.x + self.player.width / 2,
+                                self.player.position.y + self.player.height / 2)
+            self.events.append(SimEvent.PlayerExplode)
+            self.telemetry.record(EVENT_PLAYER_DEATH, self.player.position.x, self.player.position.y, 0.0, 1, 0)
+            return
+
+        # 更新护盾
+        self.updateShield(deltaTime)
+
+        # 更新无敌
+        self.updateInvincible(deltaTime)
+
+        # 敌机已在 updateEnemies 中移动过, 重建网格后只检测玩家附近的敌机
+        e = self.enemies
+        n = e.count
+        live = e.liveMask()
+        self.enemyGrid.build(e.posX[:n], e.posY[:n], e.width[:n], e.height[:n])
+        cand = self.enemyGrid.query(*self.playerRect())
+        cand = cand[live[cand]]
+        hits = cand[overlapsRect(e.posX[cand], e.posY[cand], e.width[cand], e.height[cand], *self.playerRect())]
+        # 碰撞检测成功
+        if not self.player.isInvincible and hits.size:
+            self.player.currentHealth -= int(hits.size)
+            self.telemetry.record(EVENT_DAMAGE, self.player.position.x, self.player.position.y,
+                                  hits.size, hits.size, 1)
+        e.health[hits] = 0
+
+    def updatePlayerProjectiles(self, deltaTime: float) -> None:
+        margin = 32  # 子弹超出屏幕外边界的距离
+        p = self.projectilesPlayer
+        n = p.count
+        p.posY[:n] -= p.speed[:n] * deltaTime
+        p.release(np.flatnonzero(p.posY[:n] + margin < 0))
+
+        # 检测与敌机的碰撞: 网格粗筛出候选对, 再批量精确检测
+        e = self.enemies
+        m = e.count
+        self.enemyGrid.build(e.posX[:m], e.posY[:m], e.width[:m], e.height[:m])
+        a, b = self.enemyGrid.queryMany(p.posX[:n], p.posY[:n], p.width[:n], p.height[:n])
+        live = p.liveMask()[a] & e.liveMask()[b]
+        a = a[live]
+        b = b[live]
+        hit = overlapPairs(p.posX[a], p.posY[a], p.width[a], p.height[a],
+                           e.posX[b], e.posY[b], e.width[b], e.height[b])
+        hitP, hitE = firstHitsOfPairs(a[hit], b[hit])
+        if hitP.size:
+            np.subtract.at(e.health, hitE, p.damage[hitP])
+            p.release(hitP)
+            self.events.extend([SimEvent.Hit] * int(hitP.size))
+            self.telemetry.record(EVENT_HIT, 0.0, 0.0, 0.0, hitP.size, 0)
+
+    def updateEnemies(self, deltaTime: float) -> None:
+        e = self.enemies
+        n = e.count
+        e.posY[:n] += e.speed[:n] * deltaTime
+        live = e.liveMask()
+        onScreen = live & (e.posY[:n] <= self.height)
+
+        # 敌机射击
+        if not self.isDead:
+            shooters = np.flatnonzero(onScreen & (self.time - e.timer[:n] > e.coolDown[:n]))
+            if shooters.size:
+                self.enemyShoot(shooters)
+                e.timer[shooters] = self.time
+
+        e.release(np.flatnonzero(live & ~onScreen))
+        e.release(np.flatnonzero(onScreen & (e.health[:n] <= 0)))
+
+    def resolveEnemyDeaths(self) -> None:
+        # 消费本帧被击毁的敌机: 爆炸、加分、掉落
+        # 本帧 release 的还包括飞出屏幕的, 只有仍在屏幕内且生命耗尽的才算击毁
+        # 按下标倒序处理, 与原先倒序遍历时随机数的消耗顺序一致
+        e = self.enemies
+        dead = e.deadThisFrame()
+        destroyed = dead[(e.health[dead] <= 0) & (e.posY[dead] <= self.height)]
+        for i in np.sort(destroyed)[::-1].tolist():
+            self.enemyExplode(i)
+
+    def updateEnemyProjectiles(self, deltaTime: float) -> None:
+        margin = 32  # 子弹超出屏幕外边界的距离
+        p = self.projectilesEnemy
+        n = p.count
+        x = p.posX[:n]
+        y = p.posY[:n]
+        x += p.speed[:n] * p.dirX[:n] * deltaTime
+        y += p.speed[:n] * p.dirY[:n] * deltaTime
+        inside = (x <= self.width + margin) & (x >= -margin) & (y >= -margin) & (y <= self.height + margin)
+        p.release(np.flatnonzero(~inside))
+
+        grid = self.projectileEnemyGrid
+        grid.build(x, y, p.width[:n], p.height[:n])
+
+        # 检测与玩家护盾的碰撞
+        if self.player.isShielded:
+            cand = grid.query(*self.shieldRect())
+            cand = cand[p.liveMask()[cand]]
+            blocked = cand[overlapsRect(x[cand], y[cand], p.width[cand], p.height[cand], *self.shieldRect())]
+            p.release(blocked)
+            self.events.extend([SimEvent.Hit] * int(blocked.size))
+            if blocked.size:
+                self.telemetry.record(EVENT_SHIELD_BLOCK, 0.0, 0.0, 0.0, blocked.size, 0)
+
+        # 检测与玩家的碰撞
+        if not self.player.isInvincible:
+            cand = grid.query(*self.playerRect())
+            cand = cand[p.liveMask()[cand]]
+            hits = cand[overlapsRect(x[cand], y[cand], p.width[cand], p.height[cand], *self.playerRect())]
+            if hits.size:
+                damage = int(p.damage[hits].sum())
+                self.player.currentHealth -= damage
+                p.release(hits)
+                self.events.extend([SimEvent.Hit] * int(hits.size))
+                self.telemetry.record(EVENT_DAMAGE, self.player.position.x, self.player.position.y,
+                                      damage, hits.size, 0)
+
+    def updateExplosions(self, deltaTime: float) -> None:
+        ex = self.explosions
+        n = ex.count
+        ex.frame[:n] = (self.time - ex.timer[:n]) * self.explosionTemplate.FPS / 1e9
+        ex.release(np.flatnonzero(ex.frame[:n] >= self.explosionTemplate.totalFrame))
+
+    def updateItems(self, deltaTime: float) -> None:
+        it = self.items
+        n = it.count
+        x = it.posX[:n]
+        y = it.posY[:n]
+        dx = it.dirX[:n]
+        dy = it.dirY[:n]
+        bounce = it.bounce[:n]
+        x += it.speed[:n] * dx * deltaTime
+        y += it.speed[:n] * dy * deltaTime
+
+        # 处理屏幕边缘反弹, 四条边依次判断, 每次反弹消耗一次次数
+        for hit, d in ((x < 0, dx),
+                       (x + it.width[:n] > self.width, dx),
+                       (y < 0, dy),
+                       (y + it.height[:n] > self.height, dy)):
+            m = hit & (bounce > 0)
+            d[m] = -d[m]
+            bounce[m] -= 1
+
+        # 超出屏幕范围则删除
+        inside = ((x + it.width[:n] >= 0) & (x <= self.width)
+                  & (y + it.height[:n] >= 0) & (y <= self.height))
+        it.release(np.flatnonzero(~inside))
+
+        # 检测与玩家的碰撞
+        if not self.isDead:
+            self.itemGrid.build(x, y, it.width[:n], it.height[:n])
+            cand = self.itemGrid.query(*self.playerRect())
+            cand = cand[it.liveMask()[cand]]
+            picked = cand[overlapsRect(x[cand], y[cand], it.width[cand], it.height[cand], *self.playerRect())]
+            for i in picked[::-1].tolist():
+                self.playerGetItem(ItemType(int(it.type[i])))
+                self.events.append(SimEvent.GetItem)
+            it.release(picked)
+
+    def updateShield(self, deltaTime: float) -> None:
+        if self.player.isShielded:
+            self.player.shieldCurrentTime -= deltaTime * 1e9
+            if self.player.shieldCurrentTime <= 0:
+                self.player.isShielded = False
+                self.player.shieldCurrentTime = self.player.shieldTime
+
+    def updateInvincible(self, deltaTime: float) -> None:
+        if self.player.isInvincible:
+            self.player.invincibleCurrentTime -= deltaTime * 1e9
+            if self.player.invincibleCurrentTime <= 0:
+                self.player.isInvincible = False
+                self.player.invincibleCurrentTime = self.player.invincibleTime
+
+    def spawEnemy(self, deltaTime: float) -> None:
+        # SpawnEnemyStep 是以 FPS 帧为单位的平均生成间隔, 按 tick 时长换算成本 tick 的生成概率
+        if self.rng.random() > deltaTime * self.settings.FPS / self.settings.SpawnEnemyStep:
+            return
+        # 间隔时间随机生成敌人
+        t = self.enemyTemplates[self.rng.randint(0, len(self.enemyTemplates) - 1)]
+        e = self.enemies
+        i = e.acquire()
+        e.posX[i] = self.rng.random() * (self.width - t.width)
+        e.posY[i] = -t.height
+        e.width[i] = t.width
+        e.height[i] = t.height
+        e.speed[i] = t.speed
+        e.health[i] = t.currentHealth
+        e.coolDown[i] = t.coolDown
+        e.type[i] = t.type
+        e.timer[i] = self.time - t.coolDown - 1  # 出场即可射击
+        self.telemetry.record(EVENT_SPAWN, e.posX[i], e.posY[i], 0.0, 1, t.type)
+
+    def spawnExplosion(self, centerX: float, centerY: float) -> None:
+        t = self.explosionTemplate
+        ex = self.explosions
+        i = ex.acquire()
+        ex.posX[i] = centerX - t.width / 2
+        ex.posY[i] = centerY - t.height / 2
+        ex.width[i] = t.width
+        ex.height[i] = t.height
+        ex.frame[i] = 0
+        ex.timer[i] = self.time
+
+    # 其他
+    def playerShoot(self) -> None:
+        # 发射子弹
+        t = self.projectilePlayerTemplate
+        p = self.projectilesPlayer
+        i = p.acquire()
+        p.posX[i] = self.player.position.x + self.player.width / 2 - t.width / 2
+        p.posY[i] = self.player.position.y
+        p.width[i] = t.width
+        p.height[i] = t.height
+        p.speed[i] = t.speed
+        p.damage[i] = t.damage
+        self.events.append(SimEvent.PlayerShoot)
+        self.telemetry.record(EVENT_PLAYER_SHOOT, self.player.position.x, self.player.position.y, 0.0, 1, 0)
+
+    def enemyShoot(self, shooters: np.ndarray) -> None:
+        # shooters: 本帧开火的敌机下标, 每架敌机朝玩家中心发射一发子弹
+        e = self.enemies
+        t = self.projectileEnemyTemplate
+        centerX = e.posX[shooters] + e.width[shooters] / 2
+        centerY = e.posY[shooters] + e.height[shooters] / 2
+        dirX, dirY = self.getDirection(centerX, centerY)
+        self.projectilesEnemy.spawnMany(shooters.size, posX=centerX - t.width / 2, posY=centerY - t.height / 2,
+                                        dirX=dirX, dirY=dirY, width=t.width, height=t.height,
+                                        speed=t.speed, damage=t.damage)
+        self.events.extend([SimEvent.EnemyShoot] * int(shooters.size))
+        self.telemetry.record(EVENT_ENEMY_SHOOT, 0.0, 0.0, 0.0, shooters.size, 0)
+
+    def getDirection(self, fromX: np.ndarray, fromY: np.ndarray):
+        x = (self.player.position.x + self.player.width / 2) - fromX
+        y = (self.player.position.y + self.player.height / 2) - fromY
+        length = np.sqrt(x * x + y * y)
+        zero = length == 0
+        length[zero] = 1.0
+        x = x / length
+        y = np.where(zero, 1.0, y / length)
+        return x, y
+
+    def enemyExplode(self, i: int) -> None:
+        e = self.enemies
+        centerX = float(e.posX[i] + e.width[i] / 2)
+        centerY = float(e.posY[i] + e.height[i] / 2)
+        self.spawnExplosion(centerX, centerY)
+
+        self.score += 10
+        self.kills += 1
+
+        self.events.append(SimEvent.EnemyExplode)
+        self.telemetry.record(EVENT_KILL, centerX, centerY, self.score, 1, 0)
+
+        # 判断是否需要生成物品
+        if self.rng.random() < self.settings.DropItemRate:
+            self.dropItem(centerX, centerY)
+
+    def dropItem(self, centerX: float, centerY: float) -> None:
+        t = None
+        if self.rng.random() < self.settings.timeItemRate:
+            t = self.itemTimeTemplate
+        elif self.rng.random() < self.settings.shieldItemRate:
+            t = self.itemShieldTemplate
+        else:
+            t = self.itemLifeTemplate
+
+        angle = self.rng.random() * 2.0 * math.pi
+        it = self.items
+        i = it.acquire()
+        it.posX[i] = centerX - t.width / 2
+        it.posY[i] = centerY - t.height / 2
+        it.dirX[i] = math.cos(angle)
+        it.dirY[i] = math.sin(angle)
+        it.width[i] = t.width
+        it.height[i] = t.height
+        it.speed[i] = t.speed
+        it.bounce[i] = t.bounceCount
+        it.type[i] = t.type.value
+        self.telemetry.record(EVENT_ITEM_DROP, centerX, centerY, 0.0, 1, t.type.value)
+
+    def playerGetItem(self, itemType: ItemType) -> None:
+        self.score += 5
+        self.telemetry.record(EVENT_ITEM_PICKUP, self.player.position.x, self.player.position.y, 0.0, 1,
+                              itemType.value)
+        if itemType == ItemType.Life:
+            self.player.currentHealth += 1
+            if self.player.currentHealth > self.player.maxHealth:
+                self.player.currentHealth = self.player.maxHealth
+        elif itemType == ItemType.Shield:
+            self.player.currentShield += 1
+        elif itemType == ItemType.Time:
+            self.player.currentInvincible += 1
+
+    def poolStats(self) -> dict:
+        return {"projectilesPlayer": self.projectilesPlayer.stats(),
+                "enemies": self.enemies.stats(),
+                "projectilesEnemy": self.projectilesEnemy.stats(),
+                "explosions": self.explosions.stats(),
+                "items": self.items.stats()}
+
+    def playerUseShield(self) -> None:
+        if self.player.currentShield > 0 and not self.player.isShielded:
+            self.player.isShielded = True
+            self.player.currentShield -= 1
+
+    def playerUseInvincible(self) -> None:
+        if self.player.currentInvincible > 0 and not self.player.isInvincible:
+            self.player.isInvincible = True
+            self.player.currentInvincible -= 1
@@ -0,0 +1,107 @@
+import math
+
+import numpy as np
+
+# 均匀网格空间哈希(碰撞粗筛): 把游戏区域划分为 cellSize x cellSize 的格子,
+# 每个实体登记到它覆盖的所有格子里, 查询时只返回与查询矩形共享格子的实体
+#   grid = SpatialHash(600, 800, 64)
+#   grid.build(xs, ys, ws, hs)            # 每帧实体移动后重建
+#   ids = grid.query(x, y, w, h)          # 单个矩形的候选实体下标
+#   a, b = grid.queryMany(xs2, ys2, ...)  # 一组矩形的候选对
+# 坐标与 Collision 一致先截断为整数; 场外的实体被钳制到边缘格子, 候选集仍然完整
+# 实体数少于 minCount 时建网格得不偿失, 直接把全部实体作为候选
+
+
+class SpatialHash:
+    def __init__(self, width: int, height: int, cellSize: int = 64, minCount: int = 0):
+        self.cellSize = max(1, int(cellSize))
+        self.minCount = minCount
+        self.cols = max(1, math.ceil(width / self.cellSize))
+        self.rows = max(1, math.ceil(height / self.cellSize))
+        self.count = 0  # 最近一次 build 登记的实体数
+        self.keys = np.zeros(0, np.int64)  # 按格子编号排序
+        self.ids = np.zeros(0, np.intp)
+
+    def cellRanges(self, xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray):
+        # 每个矩形覆盖的格子范围 [x0, x1] x [y0, y1]
+        x = xs.astype(np.int64)
+        y = ys.astype(np.int64)
+        w = np.maximum(ws.astype(np.int64), 1)
+        h = np.maximum(hs.astype(np.int64), 1)
+        # np.clip 对小数组的固定开销偏大, 这里直接用 minimum/maximum
+        x0 = np.minimum(np.maximum(x // self.cellSize, 0), self.cols - 1)
+        x1 = np.minimum(np.maximum((x + w - 1) // self.cellSize, 0), self.cols - 1)
+        y0 = np.minimum(np.maximum(y // self.cellSize, 0), self.rows - 1)
+        y1 = np.minimum(np.maximum((y + h - 1) // self.cellSize, 0), self.rows - 1)
+        return x0, x1, y0, y1
+
+    def expand(self, xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray):
+        # 展开为 (格子编号, 实体下标) 对
+        x0, x1, y0, y1 = self.cellRanges(xs, ys, ws, hs)
+        nx = x1 - x0 + 1
+        cells = nx * (y1 - y0 + 1)
+        ids = np.repeat(np.arange(len(xs)), cells)
+        # 每个实体内部的格子序号 k -> (k % nx, k // nx)
+        k = np.arange(ids.size) - np.repeat(np.cumsum(cells) - cells, cells)
+        nxr = nx[ids]
+        keys = (y0[ids] + k // nxr) * self.cols + (x0[ids] + k % nxr)
+        return keys, ids
+
+    def build(self, xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray) -> None:
+        self.count = len(xs)
+        if self.count < self.minCount:
+            return
+        if self.count == 0:
+            self.keys = np.zeros(0, np.int64)
+            self.ids = np.zeros(0, np.intp)
+            return
+        keys, ids = self.expand(xs, ys, ws, hs)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.ids = ids[order]
+
+    def query(self, x: int, y: int, w: int, h: int) -> np.ndarray:
+        # 与矩形共享格子的实体下标(升序, 去重)
+        if self.count < self.minCount:
+            return np.arange(self.count)
+        if self.count == 0:
+            return np.zeros(0, np.intp)
+        size = self.cellSize
+        x0 = min(max(int(x) // size, 0), self.cols - 1)
+        x1 = min(max((int(x) + max(w, 1) - 1) // size, 0), self.cols - 1)
+        y0 = min(max(int(y) // size, 0), self.rows - 1)
+        y1 = min(max((int(y) + max(h, 1) - 1) // size, 0), self.rows - 1)
+        keys = [cy * self.cols + cx for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+        lo = np.searchsorted(self.keys, keys, side="left").tolist()
+        hi = np.searchsorted(self.keys, keys, side="right").tolist()
+        found = [self.ids[l:h] for l, h in zip(lo, hi) if h > l]
+        if not found:
+            return np.zeros(0, np.intp)
+        if len(found) == 1:
+            return found[0]
+        ids = np.sort(np.concatenate(found))
+        return ids[np.concatenate(([True], ids[1:] != ids[:-1]))]
+
+    def queryMany(self, xs: np.ndarray, ys: np.ndarray, ws: np.ndarray, hs: np.ndarray):
+        # 一组查询矩形的候选对 (查询下标, 实体下标), 去重后按查询下标、实体下标升序排列
+        if self.count == 0 or len(xs) == 0:
+            empty = np.zeros(0, np.intp)
+            return empty, empty
+        if self.count < self.minCount:
+            return np.repeat(np.arange(len(xs)), self.count), np.tile(np.arange(self.count), len(xs))
+        keys, queries = self.expand(xs, ys, ws, hs)
+        lo = np.searchsorted(self.keys, keys, side="left")
+        hi = np.searchsorted(self.keys, keys, side="right")
+        found = hi - lo
+        total = int(found.sum())
+        if total == 0:
+            empty = np.zeros(0, np.intp)
+            return empty, empty
+        a = np.repeat(queries, found)
+        b = self.ids[np.repeat(lo, found) + np.arange(total) - np.repeat(np.cumsum(found) - found, found)]
+        # 同一对可能在多个格子里各出现一次
+        # 排序后去掉相邻重复; np.unique 在新版 NumPy 里走哈希路径, 对这种规模反而更慢
+        pairs = np.sort(a.astype(np.int64) * self.count + b)
+        if pairs.size > 1:
+            pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        return (pairs // self.count).astype(np.intp), (pairs % self.count).astype(np.intp)
@@ -0,0 +1,128 @@
+import ctypes
+from ctypes import c_float, byref
+
+import numpy as np
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+
+renderLog = log.category("render")
+
+# 批量精灵提交: 同一纹理的一组四边形写进复用的顶点缓冲, 一次 SDL_RenderGeometry 画完
+# 连续提交的同一纹理会合并, 纹理切换或 flush() 时才真正发出绘制调用,
+# 因此每帧的绘制调用数只取决于纹理切换次数, 与实体数量无关
+#   batch = SpriteBatch(renderer)
+#   batch.draw(texture, xs, ys, ws, hs)                       # 整张纹理
+#   batch.draw(texture, xs, ys, ws, hs, src=(sx, sy, sw, sh))  # 纹理内的子矩形(像素)
+#   batch.draw(texture, xs, ys, ws, hs, angles=degrees)       # 绕中心顺时针旋转
+#   batch.flush()
+# 顶点布局与 SDL_Vertex 一致: position(x, y), color(r, g, b, a), tex_coord(u, v), 共 8 个 float32
+
+_VERTEX_FLOATS = 8
+
+
+class SpriteBatch:
+    def __init__(self, renderer: sdl.SDL_Renderer, capacity: int = 256):
+        self.renderer = renderer
+        self.texture = None  # 当前待提交的纹理
+        self.count = 0       # 当前待提交的四边形数
+        self.capacity = 0
+        self.vertices = np.zeros((0, _VERTEX_FLOATS), np.float32)
+        self.indices = np.zeros(0, np.int32)
+        self.reserve(capacity)
+        self.textureSizes = {}  # 纹理地址 -> (w, h)
+        self.drawCalls = 0   # 本帧发出的 SDL_RenderGeometry 次数
+        self.sprites = 0     # 本帧提交的四边形数
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity:
+            return
+        vertices = np.zeros((capacity * 4, _VERTEX_FLOATS), np.float32)
+        vertices[:self.count * 4] = self.vertices[:self.count * 4]
+        self.vertices = vertices
+        # 每个四边形两个三角形: (0, 1, 2) (0, 2, 3)
+        base = (np.arange(capacity, dtype=np.int32) * 4)[:, None]
+        self.indices = (base + np.array([0, 1, 2, 0, 2, 3], np.int32)).ravel()
+        self.capacity = capacity
+
+    def textureSize(self, texture):
+        key = ctypes.addressof(texture.contents)
+        size = self.textureSizes.get(key)
+        if size is None:
+            w = c_float()
+            h = c_float()
+            sdl.SDL_GetTextureSize(texture, byref(w), byref(h))
+            size = (w.value, h.value)
+            self.textureSizes[key] = size
+        return size
+
+    def isCurrent(self, texture) -> bool:
+        if self.texture is None:
+            return False
+        return texture is self.texture or ctypes.addressof(texture.contents) == ctypes.addressof(self.texture.contents)
+
+    def begin(self) -> None:
+        self.texture = None
+        self.count = 0
+        self.drawCalls = 0
+        self.sprites = 0
+
+    def draw(self, texture, xs, ys, ws, hs, src=None, angles=None, color=(1.0, 1.0, 1.0, 1.0)) -> None:
+        # xs, ys, ws, hs 可以是标量或等长数组; 位置与原先的 SDL_FRect(int(x), int(y), w, h) 一样截断为整数
+        xs = np.atleast_1d(np.asarray(xs)).astype(np.int32).astype(np.float32)
+        n = len(xs)
+        if n == 0 or texture is None:
+            return
+        ys = np.broadcast_to(np.asarray(ys).astype(np.int32), n).astype(np.float32)
+        hw = np.broadcast_to(np.asarray(ws, np.float32), n) * 0.5
+        hh = np.broadcast_to(np.asarray(hs, np.float32), n) * 0.5
+
+        if not self.isCurrent(texture):
+            self.flush()
+            self.texture = texture
+        if self.count + n > self.capacity:
+            self.reserve(max(self.capacity * 2, self.count + n))
+
+        # 以矩形中心为原点的四个角: 左上 右上 右下 左下
+        cx = xs + hw
+        cy = ys + hh
+        dx = np.stack((-hw, hw, hw, -hw), axis=1)
+        dy = np.stack((-hh, -hh, hh, hh), axis=1)
+        if angles is not None:
+            # 与 SDL_RenderTextureRotated 相同: 角度制, 屏幕坐标下顺时针
+            rad = np.radians(np.broadcast_to(np.asarray(angles, np.float32), n))[:, None]
+            c = np.cos(rad)
+            s = np.sin(rad)
+            dx, dy = dx * c - dy * s, dx * s + dy * c
+
+        if src is None:
+            u0 = v0 = np.zeros(n, np.float32)
+            u1 = v1 = np.ones(n, np.float32)
+        else:
+            tw, th = self.textureSize(texture)
+            sx, sy, sw, sh = (np.broadcast_to(np.asarray(v, np.float32), n) for v in src)
+            u0 = sx / tw
+            v0 = sy / th
+            u1 = (sx + sw) / tw
+            v1 = (sy + sh) / th
+
+        v = self.vertices[self.count * 4:(self.count + n) * 4].reshape(n, 4, _VERTEX_FLOATS)
+        v[:, :, 0] = cx[:, None] + dx
+        v[:, :, 1] = cy[:, None] + dy
+        v[:, :, 2:6] = color
+        v[:, :, 6] = np.stack((u0, u1, u1, u0), axis=1)
+        v[:, :, 7] = np.stack((v0, v0, v1, v1), axis=1)
+        self.count += n
+
+    def flush(self) -> None:
+        if self.count == 0 or self.texture is None:
+            self.count = 0
+            return
+        ok = sdl.SDL_RenderGeometry(self.renderer, self.texture,
+                                    self.vertices.ctypes.data_as(ctypes.POINTER(sdl.SDL_Vertex)), self.count * 4,
+                                    self.indices.ctypes.data_as(ctypes.POINTER(ctypes.c_int)), self.count * 6)
+        if not ok:
+            renderLog.error("SDL_RenderGeometry failed: {}", sdl.SDL_GetError())
+        self.drawCalls += 1
+        self.sprites += self.count
+        self.count = 0
@@ -0,0 +1,108 @@
+import math
+from typing import List, Optional
+from ctypes import c_float, byref
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+from AssetManager import AssetManager
+from Object import Background
+
+# 视差滚动背景: 每层把贴图按窗口宽度平铺, 预先合成到一张渲染目标纹理(高度取贴图高度的整数倍,
+# 不小于窗口高度), 之后每帧每层只画一到两次: 源矩形按滚动偏移回绕, 上下两段拼成整屏
+#   starfield = Starfield(renderer, assets, 600, 800, settings.backgroundLayers)
+#   starfield.update(deltaTime)
+#   starfield.render(advance)    # advance: 当前 tick 之后又经过的时间(秒), 用于插值
+# 图层配置按从远到近排列: {"image": 路径, "speed": 像素/秒, "scale": 贴图缩放}
+# 渲染器不支持渲染目标时退回 SDL_RenderTextureTiled, 每层仍只有一次调用
+# 设备重置导致渲染目标内容丢失时调用 rebuild()
+
+
+class Starfield:
+    def __init__(self, renderer: sdl.SDL_Renderer, assets: AssetManager, width: int, height: int,
+                 layers: List[dict]):
+        self.renderer = renderer
+        self.assets = assets
+        self.width = width
+        self.height = height
+        self.layers: List[Background] = []
+        for config in layers:
+            layer = self.loadLayer(config)
+            if layer is not None:
+                self.layers.append(layer)
+
+    def loadLayer(self, config: dict) -> Optional[Background]:
+        texture = self.assets.acquireTexture(config["image"], True)
+        if texture is None:
+            return None
+        w = c_float()
+        h = c_float()
+        sdl.SDL_GetTextureSize(texture, byref(w), byref(h))
+        layer = Background()
+        layer.path = config["image"]
+        layer.texture = texture
+        layer.scale = config.get("scale", 1.0)
+        layer.width = max(1, int(w.value * layer.scale))
+        layer.height = max(1, int(h.value * layer.scale))
+        layer.speed = config.get("speed", 100)
+        # 合成高度是贴图高度的整数倍, 回绕处正好接上
+        layer.targetHeight = layer.height * math.ceil(self.height / layer.height)
+        self.compose(layer)
+        return layer
+
+    def compose(self, layer: Background) -> None:
+        if layer.target is None:
+            layer.target = sdl.SDL_CreateTexture(self.renderer, sdl.SDL_PIXELFORMAT_RGBA32,
+                                                 sdl.SDL_TEXTUREACCESS_TARGET, self.width, layer.targetHeight)
+            if not layer.target:
+                log.warning("Background render target unavailable, tiling per frame: {}", sdl.SDL_GetError())
+                layer.target = None
+                return
+            sdl.SDL_SetTextureBlendMode(layer.target, sdl.SDL_BLENDMODE_BLEND)
+
+        previous = sdl.SDL_GetRenderTarget(self.renderer)
+        sdl.SDL_SetRenderTarget(self.renderer, layer.target)
+        sdl.SDL_SetRenderDrawColor(self.renderer, 0, 0, 0, 0)
+        sdl.SDL_RenderClear(self.renderer)
+        # 贴图之间不重叠, 直接拷贝像素(含透明度), 显示时再按透明度混合
+        sdl.SDL_SetTextureBlendMode(layer.texture, sdl.SDL_BLENDMODE_NONE)
+        sdl.SDL_RenderTextureTiled(self.renderer, layer.texture, None, layer.scale,
+                                   sdl.SDL_FRect(0, 0, self.width, layer.targetHeight))
+        sdl.SDL_SetTextureBlendMode(layer.texture, sdl.SDL_BLENDMODE_BLEND)
+        sdl.SDL_SetRenderTarget(self.renderer, previous)
+
+    def rebuild(self) -> None:
+        for layer in self.layers:
+            self.compose(layer)
+
+    def update(self, deltaTime: float) -> None:
+        for layer in self.layers:
+            layer.offset = (layer.offset + layer.speed * deltaTime) % layer.targetHeight
+
+    def render(self, advance: float = 0.0) -> None:
+        for layer in self.layers:
+            offset = (layer.offset + layer.speed * advance) % layer.targetHeight
+            if layer.target is None:
+                # 没有渲染目标: 从贴图高度以内的起点向下平铺
+                y = offset % layer.height - layer.height
+                sdl.SDL_RenderTextureTiled(self.renderer, layer.texture, None, layer.scale,
+                                           sdl.SDL_FRect(0, y, self.width, self.height - y))
+                continue
+            # 屏幕第 y 行对应合成纹理的第 (y - offset) mod H 行: 上段取纹理底部, 下段取纹理顶部
+            top = min(offset, self.height)
+            if top > 0:
+                sdl.SDL_RenderTexture(self.renderer, layer.target,
+                                      sdl.SDL_FRect(0, layer.targetHeight - offset, self.width, top),
+                                      sdl.SDL_FRect(0, 0, self.width, top))
+            if offset < self.height:
+                rest = self.height - offset
+                sdl.SDL_RenderTexture(self.renderer, layer.target,
+                                      sdl.SDL_FRect(0, 0, self.width, rest),
+                                      sdl.SDL_FRect(0, offset, self.width, rest))
+
+    def clean(self) -> None:
+        for layer in self.layers:
+            if layer.target is not None:
+                sdl.SDL_DestroyTexture(layer.target)
+                layer.target = None
+            self.assets.releaseTexture(layer.path)
+        self.layers.clear()
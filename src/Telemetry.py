@@ -0,0 +1,253 @@
+import struct
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from Logger import GameLogger as log
+
+ioLog = log.category("io")
+
+# 游戏事件遥测: 生成/射击/命中/击毁/掉落/拾取/受伤/帧耗时, 每条事件一条定长二进制记录
+#   telemetry = Telemetry(capacity=65536, enabled=True)
+#   telemetry.open(Path("telemetry"), maxBytes, maxFiles)   # 启动后台写线程
+#   telemetry.beginRun(seed)                # 新的一局写进新文件
+#   telemetry.tick = sim.tick
+#   telemetry.record(EVENT_KILL, x, y, score, 1, 0)  # 热路径上用整数常量、位置参数
+#   telemetry.close()                       # 写完剩余记录
+# 记录先写进预分配的环形缓冲(单生产者/单消费者, 不加锁): 主线程只推进 head, 写线程只推进 tail,
+# 缓冲满时丢弃新记录并计数, 从不阻塞游戏循环; 写线程定期把 [tail, head) 整段写进文件
+# 文件: 头部 HEADER 之后紧跟若干条 RECORD, 超过 maxBytes 换新文件, 目录中最多保留 maxFiles 个
+# 用 readFile / tools/read_telemetry.py 读回为按列的 numpy 数组
+# 不依赖 SDL, 模拟层与 tools/ 下的脚本也可以使用
+
+MAGIC = b"SPTELEM1"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQ")  # magic, 版本, 记录长度, 分卷号, 种子
+RECORD = struct.Struct("<IBBHfff")  # tick, 事件, 参数, 数量, x, y, 数值
+RECORD_DTYPE = np.dtype([("tick", "<u4"), ("kind", "u1"), ("arg", "u1"), ("count", "<u2"),
+                         ("x", "<f4"), ("y", "<f4"), ("value", "<f4")])
+assert RECORD_DTYPE.itemsize == RECORD.size
+
+
+class TelemetryEvent(IntEnum):
+    Spawn = 1          # arg: 敌机类型
+    PlayerShoot = 2
+    EnemyShoot = 3     # count: 本 tick 开火的敌机数
+    Hit = 4            # 玩家子弹命中敌机, count: 命中数
+    Kill = 5           # value: 击毁后的分数
+    ItemDrop = 6       # arg: 物品类型
+    ItemPickup = 7     # arg: 物品类型
+    Damage = 8         # value: 扣除的生命, count: 命中数, arg: 0 子弹 1 撞机
+    ShieldBlock = 9    # count: 被护盾挡下的子弹数
+    PlayerDeath = 10
+    Frame = 11         # value: 帧耗时(ms), count: 本帧模拟的 tick 数
+
+
+# 与 TelemetryEvent 相同的值, 普通 int: 调用处省掉一次枚举属性查找
+EVENT_SPAWN = int(TelemetryEvent.Spawn)
+EVENT_PLAYER_SHOOT = int(TelemetryEvent.PlayerShoot)
+EVENT_ENEMY_SHOOT = int(TelemetryEvent.EnemyShoot)
+EVENT_HIT = int(TelemetryEvent.Hit)
+EVENT_KILL = int(TelemetryEvent.Kill)
+EVENT_ITEM_DROP = int(TelemetryEvent.ItemDrop)
+EVENT_ITEM_PICKUP = int(TelemetryEvent.ItemPickup)
+EVENT_DAMAGE = int(TelemetryEvent.Damage)
+EVENT_SHIELD_BLOCK = int(TelemetryEvent.ShieldBlock)
+EVENT_PLAYER_DEATH = int(TelemetryEvent.PlayerDeath)
+EVENT_FRAME = int(TelemetryEvent.Frame)
+
+
+class Telemetry:
+    def __init__(self, capacity: int = 65536, enabled: bool = False, flushInterval: float = 0.25):
+        # 容量取 2 的幂, 下标用位与代替取模
+        capacity = 1 << max(capacity - 1, 1).bit_length()
+        self.enabled = enabled
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.buffer = bytearray(capacity * RECORD.size)
+        self.pack = RECORD.pack_into
+        self.recordSize = RECORD.size
+        self.head = 0  # 已写入的记录总数, 只由主线程修改
+        self.tail = 0  # 已落盘的记录总数, 只由写线程修改
+        self.tick = 0  # 当前模拟 tick, 由 Simulation 每个 step 更新
+        self.dropped = 0  # 缓冲满被丢弃的记录(主线程计数)
+        self.lost = 0  # 写文件失败丢掉的记录(写线程计数)
+        self.flushInterval = flushInterval
+        self.runs = deque()  # (起始记录位置, 种子), beginRun 登记, 写线程在该位置换文件
+        self.directory: Optional[Path] = None
+        self.maxBytes = 0
+        self.maxFiles = 0
+        self.file = None
+        self.fileBytes = 0
+        self.seed = 0
+        self.part = 0
+        self.files = 0
+        self.written = 0
+        self.thread: Optional[threading.Thread] = None
+        self.stopping = threading.Event()
+
+    def record(self, kind: int, x: float = 0.0, y: float = 0.0, value: float = 0.0, count: int = 1,
+               arg: int = 0) -> None:
+        if not self.enabled:
+            return
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return
+        # count 为 u16, arg 为 u8: 超出范围的截断, 不让 struct.error 打断游戏循环
+        if count > 0xFFFF:
+            count = 0xFFFF
+        try:
+            self.pack(self.buffer, (head & self.mask) * self.recordSize, self.tick, kind, arg & 0xFF, count,
+                      x, y, value)
+        except (struct.error, OverflowError, TypeError):
+            self.dropped += 1
+            return
+        self.head = head + 1
+
+    def open(self, directory: Path, maxBytes: int = 16 << 20, maxFiles: int = 16) -> None:
+        if not self.enabled or self.thread is not None:
+            return
+        self.directory = Path(directory)
+        self.maxBytes = maxBytes
+        self.maxFiles = maxFiles
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            ioLog.error("Failed to create telemetry directory {}: {}", self.directory, e)
+            self.enabled = False
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.writerLoop, name="telemetry", daemon=True)
+        self.thread.start()
+
+    def beginRun(self, seed: int) -> None:
+        # 之后的记录写进新文件, 文件头带上这一局的种子
+        if self.enabled:
+            self.runs.append((self.head, seed))
+
+    def close(self) -> None:
+        if self.thread is None:
+            return
+        self.stopping.set()
+        self.thread.join()
+        self.thread = None
+        ioLog.info("Telemetry: {} records in {} files, {} dropped, {} lost", self.written, self.files,
+                   self.dropped, self.lost)
+
+    # —— 以下在写线程中执行 ——
+    def writerLoop(self) -> None:
+        while not self.stopping.wait(self.flushInterval):
+            self.drain()
+        self.drain()
+        self.closeFile()
+
+    def drain(self) -> None:
+        head = self.head
+        tail = self.tail
+        while True:
+            if self.runs and self.runs[0][0] <= tail:
+                _, seed = self.runs.popleft()
+                self.closeFile()
+                self.seed = seed
+                self.part = 0
+                continue
+            if tail >= head:
+                break
+            end = head if not self.runs else min(head, self.runs[0][0])
+            if not self.writeRange(tail, end):
+                # 写失败: 丢掉这段, 不让缓冲一直满着
+                self.lost += end - tail
+            tail = end
+            self.tail = tail
+
+    def writeRange(self, start: int, end: int) -> bool:
+        if self.file is None or self.fileBytes >= self.maxBytes:
+            self.closeFile()
+            if not self.openFile():
+                return False
+        view = memoryview(self.buffer)
+        first = start & self.mask
+        last = first + (end - start)
+        try:
+            if last <= self.capacity:
+                self.file.write(view[first * RECORD.size:last * RECORD.size])
+            else:
+                self.file.write(view[first * RECORD.size:])
+                self.file.write(view[:(last - self.capacity) * RECORD.size])
+        except OSError as e:
+            ioLog.error("Failed to write telemetry: {}", e)
+            self.closeFile()
+            return False
+        finally:
+            view.release()
+        self.fileBytes += (end - start) * RECORD.size
+        self.written += end - start
+        return True
+
+    def openFile(self) -> bool:
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.files:04d}.tel"
+        path = self.directory / name
+        try:
+            self.file = path.open("wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size, self.part, self.seed))
+        except OSError as e:
+            ioLog.error("Failed to open telemetry file {}: {}", path, e)
+            self.file = None
+            return False
+        self.fileBytes = HEADER.size
+        self.part += 1
+        self.files += 1
+        self.pruneFiles()
+        return True
+
+    def closeFile(self) -> None:
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError as e:
+                ioLog.error("Failed to close telemetry file: {}", e)
+            self.file = None
+
+    def pruneFiles(self) -> None:
+        # 文件名以时间开头, 按名字排序即按时间排序
+        files = sorted(self.directory.glob("*.tel"))
+        for path in files[:max(len(files) - self.maxFiles, 0)]:
+            try:
+                path.unlink()
+            except OSError as e:
+                ioLog.warning("Failed to remove old telemetry file {}: {}", path, e)
+
+
+def readFile(path: Path) -> Tuple[dict, np.ndarray]:
+    # 返回 (文件头, 记录数组); 末尾不完整的记录(写到一半时崩溃)被忽略
+    data = Path(path).read_bytes()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path}: file too short")
+    magic, version, recordSize, part, seed = HEADER.unpack_from(data)
+    if magic != MAGIC or recordSize != RECORD.size:
+        raise ValueError(f"{path}: not a telemetry file")
+    count = (len(data) - HEADER.size) // RECORD.size
+    records = np.frombuffer(data, RECORD_DTYPE, count, HEADER.size)
+    return {"version": version, "part": part, "seed": seed}, records
+
+
+def readColumns(paths: List[Path]) -> dict:
+    # 多个文件合并为按列的数组, 另附每条记录所属的文件下标与种子
+    headers = []
+    chunks = []
+    for path in paths:
+        header, records = readFile(path)
+        headers.append(header)
+        chunks.append(records)
+    records = np.concatenate(chunks) if chunks else np.zeros(0, RECORD_DTYPE)
+    sizes = [len(chunk) for chunk in chunks]
+    columns = {name: np.ascontiguousarray(records[name]) for name in RECORD_DTYPE.names}
+    columns["fileIndex"] = np.repeat(np.arange(len(sizes), dtype=np.uint32), sizes)
+    columns["seed"] = np.repeat(np.array([h["seed"] for h in headers], np.uint64), sizes)
+    return columns
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+import sdl3 as sdl
+from sdl3 import SDL_ttf as ttf
+
+from Logger import GameLogger as log
+from Localizer import LocalizedText
+
+renderLog = log.category("render")
+
+# 文字纹理 LRU 缓存: 标题、暂停菜单、排行榜等不常变化的整行文字只光栅化一次,
+# 之后每帧直接复用纹理; 超出容量时淘汰最久未使用的纹理
+# 键为 (字体路径, 字号, 文本, 颜色), 调用方传入对应的已打开字体
+#   cache = TextCache(renderer, 64)
+#   texture, w, h = cache.get(font, ("assets/font/xx.ttf", 32), "Pause")
+
+
+class TextCache:
+    def __init__(self, renderer: sdl.SDL_Renderer, capacity: int = 64):
+        self.renderer = renderer
+        self.capacity = max(1, int(capacity))
+        self.entries = OrderedDict()  # 键 -> (texture, w, h), 末尾为最近使用
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, font: ttf.TTF_Font, fontKey: tuple, text: str,
+            color: Tuple[int, int, int, int] = (255, 255, 255, 255)) -> Optional[tuple]:
+        key = (fontKey, text, color)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        if isinstance(text, LocalizedText):
+            b, size = text.encoded, text.size  # 本地化文本载入时已编码
+        else:
+            b = text.encode("utf-8")
+            size = len(b)
+        surface = ttf.TTF_RenderText_Solid(font, b, size, sdl.SDL_Color(*color))
+        if not surface:
+            renderLog.error("Failed to render text {!r}: {}", text, sdl.SDL_GetError())
+            return None
+        w = surface.contents.w
+        h = surface.contents.h
+        texture = sdl.SDL_CreateTextureFromSurface(self.renderer, surface)
+        sdl.SDL_DestroySurface(surface)
+        if texture is None:
+            renderLog.error("Failed to create text texture {!r}: {}", text, sdl.SDL_GetError())
+            return None
+
+        entry = (texture, w, h)
+        self.entries[key] = entry
+        while len(self.entries) > self.capacity:
+            _, (old, _, _) = self.entries.popitem(last=False)
+            sdl.SDL_DestroyTexture(old)
+            self.evictions += 1
+        return entry
+
+    def hitRate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {"size": len(self.entries), "capacity": self.capacity, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions, "hitRate": round(self.hitRate(), 3)}
+
+    def clean(self) -> None:
+        for texture, _, _ in self.entries.values():
+            sdl.SDL_DestroyTexture(texture)
+        self.entries.clear()
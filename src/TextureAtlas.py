@@ -0,0 +1,191 @@
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import sdl3 as sdl
+
+from Logger import GameLogger as log
+
+# 启动时把 assets/image、assets/effect 下的小图打包进一张(或几张)大纹理
+# 模版只引用图集中的子矩形, 整个场景的精灵共用同一张纹理, 批量绘制时不再切换纹理
+#   atlas = TextureAtlas(renderer, game.to_abs_path)
+#   atlas.build(["assets/image", "assets/effect"])
+#   region = atlas.get("assets/image/SpaceShip.png")
+#   batch.draw(region.texture, x, y, w, h, src=region.src)
+# 存在预烘焙资源包(见 AssetBundle)时改用 loadBundle, 跳过解码与装箱
+# 边长超过页面一半的大图(星空背景等需要平铺)不打包, 仍按原方式单独加载
+
+
+class AtlasRegion:
+    def __init__(self, texture, x: int, y: int, width: int, height: int):
+        self.texture = texture
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def src(self) -> Tuple[int, int, int, int]:
+        return self.x, self.y, self.width, self.height
+
+
+def packShelves(sizes: List[Tuple[int, int]], pageWidth: int, pageHeight: int, padding: int = 2):
+    # 货架式装箱: 按高度从大到小逐行摆放, 一行放不下换行, 一页放不下换页
+    # 返回每个矩形的 (页号, x, y), 以及每页实际用到的高度
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    places: List[Optional[Tuple[int, int, int]]] = [None] * len(sizes)
+    pageHeights = []
+    page = -1
+    x = y = shelfHeight = 0
+    for i in order:
+        w, h = sizes[i]
+        if w + padding > pageWidth or h + padding > pageHeight:
+            continue  # 单张就超出页面, 调用方应事先过滤
+        if page < 0 or x + w + padding > pageWidth:
+            # 换行
+            x = 0
+            y += shelfHeight
+            shelfHeight = 0
+        if page < 0 or y + h + padding > pageHeight:
+            # 换页
+            page += 1
+            pageHeights.append(0)
+            x = y = shelfHeight = 0
+        places[i] = (page, x + padding, y + padding)
+        x += w + padding
+        shelfHeight = max(shelfHeight, h + padding)
+        pageHeights[page] = max(pageHeights[page], y + shelfHeight + padding)
+    return places, pageHeights
+
+
+class TextureAtlas:
+    def __init__(self, renderer: sdl.SDL_Renderer, resolvePath: Callable[[str], str],
+                 pageSize: int = 1024, padding: int = 2):
+        self.renderer = renderer
+        self.resolvePath = resolvePath
+        self.pageSize = pageSize
+        self.padding = padding
+        self.pages = []    # 图集纹理
+        self.regions: Dict[str, AtlasRegion] = {}  # 相对路径 -> 子矩形
+        self.sizes: Dict[str, Tuple[int, int]] = {}  # 相对路径 -> 资源包中预先算好的模版尺寸
+        # 分步构建的中间状态
+        self.pending = []
+        self.places = []
+        self.pageSurfaces = []
+        self.placed = []
+        self.cursor = 0
+
+    def scan(self, directories: List[str]) -> List[Tuple[str, str]]:
+        # 待打包的图片: (相对路径, 绝对路径), 按路径排序保证每次打包结果一致
+        files = []
+        for directory in directories:
+            for path in sorted(Path(self.resolvePath(directory)).glob("*.png")):
+                files.append((f"{directory}/{path.name}", str(path)))
+        return files
+
+    @staticmethod
+    def loadSurface(path: str):
+        # 只解码到 CPU 内存, 不碰渲染器, 可以在工作线程中调用
+        surface = sdl.IMG_Load(path.encode())
+        if not surface:
+            log.error("Failed to load atlas image {}: {}", path, sdl.SDL_GetError())
+            return None
+        return surface
+
+    def begin(self, images: List[Tuple[str, object]]) -> None:
+        # images: (相对路径, surface); 装箱并创建空白页面, 之后用 blitNext 分批拷贝
+        self.pending = []
+        for name, surface in images:
+            if not surface:
+                continue
+            if surface.contents.w > self.pageSize // 2 or surface.contents.h > self.pageSize // 2:
+                sdl.SDL_DestroySurface(surface)
+                continue
+            self.pending.append((name, surface))
+
+        sizes = [(s.contents.w, s.contents.h) for _, s in self.pending]
+        self.places, pageHeights = packShelves(sizes, self.pageSize, self.pageSize, self.padding)
+        self.pageSurfaces = []
+        for height in pageHeights:
+            page = sdl.SDL_CreateSurface(self.pageSize, height, sdl.SDL_PIXELFORMAT_RGBA32)
+            sdl.SDL_FillSurfaceRect(page, None, 0)
+            self.pageSurfaces.append(page)
+        self.placed = []
+        self.cursor = 0
+
+    def blitNext(self, count: int = 1) -> bool:
+        # 拷贝接下来的 count 张图片, 全部完成时返回 True
+        end = min(len(self.pending), self.cursor + count)
+        for i in range(self.cursor, end):
+            name, surface = self.pending[i]
+            pageIndex, x, y = self.places[i]
+            w = surface.contents.w
+            h = surface.contents.h
+            # 直接拷贝像素(含 alpha), 不与透明底色混合
+            sdl.SDL_SetSurfaceBlendMode(surface, sdl.SDL_BLENDMODE_NONE)
+            sdl.SDL_BlitSurface(surface, None, self.pageSurfaces[pageIndex], sdl.SDL_Rect(x, y, w, h))
+            sdl.SDL_DestroySurface(surface)
+            self.placed.append((name, pageIndex, x, y, w, h))
+        self.cursor = end
+        return self.cursor >= len(self.pending)
+
+    def upload(self) -> None:
+        # 创建纹理必须在渲染线程
+        for page in self.pageSurfaces:
+            texture = sdl.SDL_CreateTextureFromSurface(self.renderer, page)
+            if texture is None:
+                log.error("Failed to create atlas texture: {}", sdl.SDL_GetError())
+            self.pages.append(texture)
+            sdl.SDL_DestroySurface(page)
+        self.pageSurfaces = []
+
+        for name, pageIndex, x, y, w, h in self.placed:
+            self.regions[name] = AtlasRegion(self.pages[pageIndex], x, y, w, h)
+        self.pending = []
+        self.placed = []
+
+        log.info("Texture atlas: {} sprites packed into {} page(s)", len(self.regions), len(self.pages))
+
+    def build(self, directories: List[str]) -> None:
+        # 同步构建: 解码、装箱、拷贝、上传一次完成
+        self.begin([(name, self.loadSurface(path)) for name, path in self.scan(directories)])
+        self.blitNext(len(self.pending))
+        self.upload()
+
+    def loadBundle(self, bundle) -> None:
+        # 从预烘焙资源包创建图集: 页面像素已打包好, 直接由映射内存创建纹理
+        atlas = bundle.index["atlas"]
+        for entry in atlas["pages"]:
+            texture = bundle.createTextureFrom(self.renderer, entry)
+            if texture is None:
+                log.error("Failed to create atlas texture from bundle: {}", sdl.SDL_GetError())
+            self.pages.append(texture)
+        for name, (pageIndex, x, y, w, h) in atlas["regions"].items():
+            self.regions[name] = AtlasRegion(self.pages[pageIndex], x, y, w, h)
+        self.sizes = {name: (w, h) for name, (w, h) in bundle.index.get("sprites", {}).items()}
+        log.info("Texture atlas: {} sprites loaded from bundle", len(self.regions))
+
+    def get(self, name: str) -> Optional[AtlasRegion]:
+        region = self.regions.get(name)
+        if region is None:
+            log.error("Sprite {} is not in the texture atlas", name)
+        return region
+
+    def spriteSize(self, name: str, region: AtlasRegion, scale: int) -> Tuple[int, int]:
+        # 模版尺寸: 优先用资源包里烘焙好的, 没有资源包(或旧资源包)时按缩小倍数现算
+        size = self.sizes.get(name)
+        if size is None:
+            size = (int(region.width / scale), int(region.height / scale))
+        return size
+
+    def clean(self) -> None:
+        for _, surface in self.pending[self.cursor:]:
+            sdl.SDL_DestroySurface(surface)
+        for page in self.pageSurfaces:
+            sdl.SDL_DestroySurface(page)
+        self.pending = []
+        self.pageSurfaces = []
+        for texture in self.pages:
+            if texture is not None:
+                sdl.SDL_DestroyTexture(texture)
+        self.pages.clear()
+        self.regions.clear()
+        self.sizes.clear()
@@ -1,6 +1,22 @@
+import argparse
+
 from Game import Game
+from FramePacer import MODES
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pacing", choices=MODES, help="frame pacing mode, overrides GlobalObject.framePacing")
+    parser.add_argument("--record", metavar="FILE", help="record seed and per-tick input of each game to FILE-001, FILE-002, ...")
+    parser.add_argument("--replay", metavar="FILE", help="replay a recording made with --record")
+    parser.add_argument("--telemetry", action="store_true", help="write per-event telemetry to the save directory")
+    args = parser.parse_args()
+
     game = Game()
+    if args.pacing:
+        game.pacing = args.pacing
+    game.recordPath = args.record
+    game.replayPath = args.replay
+    if args.telemetry:
+        game.telemetry.enabled = True
     game.init()
     game.run()
@@ -0,0 +1,220 @@
+# 游戏主循环压力基准: 在 SDL 的 offscreen 视频驱动 + 软件渲染器下, 用固定种子跑一组场景,
+# 统计每帧 update / render 耗时、Python 内存分配与实体数量
+# 用法:
+#   python tools/bench_gameplay.py                          # 跑全部场景, 与基线对比
+#   python tools/bench_gameplay.py --scenario enemies-500   # 只跑指定场景(可重复)
+#   python tools/bench_gameplay.py --save-baseline          # 把本次结果写为基线
+# 基线默认存放在 bench_baseline.json(与机器相关, 不纳入版本库);
+# update/render 平均耗时比基线慢超过 --threshold 时标记为回归, 退出码为 1
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+# 必须在 SDL 初始化之前设置
+os.environ.setdefault("SDL_VIDEO_DRIVER", "offscreen")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+os.environ.setdefault("SDL_AUDIO_DRIVER", "dummy")
+
+from Game import Game  # noqa: E402
+from Object import ItemType  # noqa: E402
+from Profiler import Profiler  # noqa: E402
+from SceneMain import SceneMain  # noqa: E402
+
+STORES = ("projectilesPlayer", "enemies", "projectilesEnemy", "explosions", "items")
+METRICS = ("updateMean", "renderMean")
+
+
+class Scenario:
+    def __init__(self, name: str, enemies: int = 0, enemyCoolDown: float = None, items: int = 0,
+                 explosions: int = 0):
+        self.name = name
+        self.enemies = enemies              # 每个 tick 补足到该数量的敌机
+        self.enemyCoolDown = enemyCoolDown  # 覆盖敌机射击间隔(ns), None 表示使用模版的值
+        self.items = items                  # 每个 tick 补足到该数量的道具
+        self.explosions = explosions        # 每个 tick 补足到该数量的爆炸
+
+    def topUp(self, sim, rng: np.random.Generator) -> None:
+        # 把各类实体补足到目标数量, 新实体随机分布在屏幕内
+        # step 结束时已经 compact 过, count 就是存活数量
+        e = sim.enemies
+        n = self.enemies - e.count
+        if n > 0:
+            types = rng.integers(0, len(sim.enemyTemplates), n)
+            templates = [sim.enemyTemplates[t] for t in types]
+            width = np.array([t.width for t in templates])
+            height = np.array([t.height for t in templates])
+            coolDown = np.array([t.coolDown for t in templates], np.float64)
+            if self.enemyCoolDown is not None:
+                coolDown[:] = self.enemyCoolDown
+            e.spawnMany(n, posX=rng.uniform(0, sim.width - width), posY=rng.uniform(-height, sim.height * 0.6),
+                        width=width, height=height, speed=[t.speed for t in templates],
+                        health=[t.currentHealth for t in templates], coolDown=coolDown, type=types,
+                        timer=sim.time - rng.uniform(0, coolDown))
+
+        it = sim.items
+        n = self.items - it.count
+        if n > 0:
+            t = sim.itemLifeTemplate
+            angle = rng.uniform(0, 2 * np.pi, n)
+            it.spawnMany(n, posX=rng.uniform(0, sim.width - t.width, n), posY=rng.uniform(0, sim.height - t.height, n),
+                         dirX=np.cos(angle), dirY=np.sin(angle), width=t.width, height=t.height, speed=t.speed,
+                         bounce=1000, type=rng.choice([t.value for t in ItemType], n))
+
+        ex = sim.explosions
+        n = self.explosions - ex.count
+        if n > 0:
+            t = sim.explosionTemplate
+            ex.spawnMany(n, posX=rng.uniform(0, sim.width - t.width, n), posY=rng.uniform(0, sim.height - t.height, n),
+                         width=t.width, height=t.height, timer=sim.time - rng.uniform(0, 0.5e9, n))
+
+
+SCENARIOS = [
+    Scenario("enemies-50", enemies=50),
+    Scenario("enemies-500", enemies=500),
+    Scenario("enemies-5000", enemies=5000),
+    Scenario("enemy-fire", enemies=100, enemyCoolDown=0.05e9),
+    Scenario("item-storm", enemies=20, items=1000),
+    Scenario("explosion-chain", enemies=200, explosions=500),
+]
+
+
+def holdFire(inputs) -> None:
+    # 玩家一直射击, 其余按键不动
+    inputs.shoot = True
+
+
+def runScenario(game: Game, scenario: Scenario, seed: int, warmup: int, frames: int, allocFrames: int) -> dict:
+    scene = SceneMain(game, seed)
+    game.changeScene(scene)
+    scene.inputDriver = holdFire
+    sim = scene.sim
+    profiler = Profiler(frames, True)
+    scene.sim.profiler = profiler
+    game.profiler = profiler
+    rng = np.random.default_rng(seed)
+
+    def frame() -> tuple:
+        # 玩家保持无敌, 场景不会因为死亡提前结束
+        sim.player.isInvincible = True
+        sim.player.invincibleCurrentTime = sim.player.invincibleTime
+        scenario.topUp(sim, rng)
+        start = time.perf_counter_ns()
+        game.update(game.tickTime)
+        mid = time.perf_counter_ns()
+        game.render()
+        end = time.perf_counter_ns()
+        return mid - start, end - mid
+
+    profiler.enabled = False
+    for _ in range(warmup):
+        frame()
+
+    profiler.enabled = True
+    update = np.zeros(frames)
+    render = np.zeros(frames)
+    counts = np.zeros((frames, len(STORES)))
+    for i in range(frames):
+        update[i], render[i] = frame()
+        counts[i] = [getattr(sim, name).count for name in STORES]
+        profiler.endFrame()
+    phases = {name: round(value, 4) for name, value in profiler.summary(frames).items()
+              if name not in profiler.counters}
+
+    # 单独跑一段统计分配, tracemalloc 本身开销很大, 不计入耗时
+    profiler.enabled = False
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    for _ in range(allocFrames):
+        frame()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    update /= 1e6
+    render /= 1e6
+    return {"updateMean": round(float(update.mean()), 4), "updateP99": round(float(np.percentile(update, 99)), 4),
+            "renderMean": round(float(render.mean()), 4), "renderP99": round(float(np.percentile(render, 99)), 4),
+            "allocPeakKiB": round((peak - base) / 1024, 1), "allocNetKiB": round((current - base) / 1024, 1),
+            "entities": {name: round(float(counts[:, i].mean()), 1) for i, name in enumerate(STORES)},
+            "drawCalls": scene.batch.drawCalls, "phases": phases}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in METRICS:
+            if base[metric] > 0 and result[metric] > base[metric] * (1 + threshold):
+                regressions.append((name, metric, base[metric], result[metric]))
+    return regressions
+
+
+def main() -> int:
+    names = [s.name for s in SCENARIOS]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scenario", action="append", choices=names, help="scenario to run, repeatable")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--alloc-frames", type=int, default=30)
+    parser.add_argument("--baseline", default=str(ROOT / "bench_baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging, 0.10 = 10%%")
+    parser.add_argument("--output", help="also write the full results as JSON")
+    args = parser.parse_args()
+
+    game = Game()
+    game.init()
+    if not game.isRunning:
+        print("SDL initialization failed", file=sys.stderr)
+        return 2
+
+    results = {}
+    print(f"{'scenario':<16} {'update ms':>10} {'p99':>8} {'render ms':>10} {'p99':>8} {'alloc KiB':>10} "
+          f"{'enemies':>8} {'bullets':>8} {'items':>6} {'fx':>6}")
+    for scenario in SCENARIOS:
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        r = runScenario(game, scenario, args.seed, args.warmup, args.frames, args.alloc_frames)
+        results[scenario.name] = r
+        n = r["entities"]
+        print(f"{scenario.name:<16} {r['updateMean']:>10.3f} {r['updateP99']:>8.3f} {r['renderMean']:>10.3f} "
+              f"{r['renderP99']:>8.3f} {r['allocPeakKiB']:>10.1f} {n['enemies']:>8.0f} "
+              f"{n['projectilesEnemy'] + n['projectilesPlayer']:>8.0f} {n['items']:>6.0f} {n['explosions']:>6.0f}")
+    game.changeScene(None)
+    game.clean()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baselinePath = Path(args.baseline)
+    if args.save_baseline:
+        baseline = json.loads(baselinePath.read_text(encoding="utf-8")) if baselinePath.is_file() else {}
+        baseline.update(results)
+        baselinePath.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+        print(f"baseline written to {baselinePath}")
+        return 0
+    if not baselinePath.is_file():
+        print(f"no baseline at {baselinePath}, run with --save-baseline first")
+        return 0
+
+    regressions = compare(results, json.loads(baselinePath.read_text(encoding="utf-8")), args.threshold)
+    for name, metric, before, after in regressions:
+        print(f"REGRESSION {name} {metric}: {before:.3f} -> {after:.3f} ms (+{(after / before - 1) * 100:.0f}%)")
+    if not regressions:
+        print(f"no regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
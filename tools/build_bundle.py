@@ -0,0 +1,115 @@
+# 离线生成预烘焙资源包(assets.bundle), 格式见 src/AssetBundle.py
+# 用法: python tools/build_bundle.py [--output assets.bundle]
+# 图片用 SDL_image 解码并转成 RGBA32; 小图按运行时相同的参数打包成图集页面, 大图单独存放
+# WAV 用标准库 wave 拆成原始 PCM, 其余音频(ogg)原样存入, 运行时流式解码
+# 修改 assets/ 下的资源后需要重新生成, 否则游戏会继续使用旧的资源包
+import argparse
+import ctypes
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+import sdl3 as sdl  # noqa: E402
+
+from AssetBundle import BundleWriter  # noqa: E402
+from Object import GlobalObject  # noqa: E402
+from TextureAtlas import packShelves  # noqa: E402
+
+AUDIO_DIRECTORIES = ["assets/sound", "assets/music"]
+ATLAS_PADDING = 2
+
+# WAV 采样位宽 -> SDL_AudioFormat
+_WAV_FORMATS = {1: sdl.SDL_AUDIO_U8, 2: sdl.SDL_AUDIO_S16LE, 4: sdl.SDL_AUDIO_S32LE}
+
+
+def decodeImage(path: Path) -> np.ndarray:
+    # 返回 [h, w, 4] 的 RGBA 像素
+    surface = sdl.IMG_Load(str(path).encode())
+    if not surface:
+        raise RuntimeError(f"IMG_Load failed for {path}: {sdl.SDL_GetError()}")
+    rgba = sdl.SDL_ConvertSurface(surface, sdl.SDL_PIXELFORMAT_RGBA32)
+    sdl.SDL_DestroySurface(surface)
+    if not rgba:
+        raise RuntimeError(f"SDL_ConvertSurface failed for {path}: {sdl.SDL_GetError()}")
+    w, h, pitch = rgba.contents.w, rgba.contents.h, rgba.contents.pitch
+    raw = np.frombuffer(ctypes.string_at(rgba.contents.pixels, pitch * h), np.uint8).reshape(h, pitch)
+    pixels = raw[:, :w * 4].reshape(h, w, 4).copy()
+    sdl.SDL_DestroySurface(rgba)
+    return pixels
+
+
+def imageEntry(writer: BundleWriter, pixels: np.ndarray) -> dict:
+    h, w = pixels.shape[:2]
+    return {"offset": writer.addBlob(pixels.tobytes()), "width": w, "height": h, "pitch": w * 4}
+
+
+def audioEntry(writer: BundleWriter, path: Path) -> dict:
+    if path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path), "rb") as f:
+                fmt = _WAV_FORMATS.get(f.getsampwidth())
+                if fmt is not None:
+                    data = f.readframes(f.getnframes())
+                    return {"offset": writer.addBlob(data), "size": len(data), "pcm": True,
+                            "format": fmt, "channels": f.getnchannels(), "freq": f.getframerate()}
+        except wave.Error:
+            pass  # 非整数 PCM(如浮点 WAV), 按原始文件存入
+    data = path.read_bytes()
+    return {"offset": writer.addBlob(data), "size": len(data), "pcm": False}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output", default=str(ROOT / GlobalObject().bundlePath))
+    args = parser.parse_args()
+
+    settings = GlobalObject()
+    pageSize = settings.atlasPageSize
+    writer = BundleWriter(args.output)
+    index = {"atlas": {"pageSize": pageSize, "padding": ATLAS_PADDING, "pages": [], "regions": {}},
+             "images": {}, "sprites": {}, "audio": {}}
+
+    # 图片: 与 TextureAtlas 相同的规则, 边长超过页面一半的不进图集
+    sprites = []
+    for directory in settings.atlasDirectories:
+        for path in sorted((ROOT / directory).glob("*.png")):
+            name = f"{directory}/{path.name}"
+            pixels = decodeImage(path)
+            h, w = pixels.shape[:2]
+            if w > pageSize // 2 or h > pageSize // 2:
+                index["images"][name] = imageEntry(writer, pixels)
+            else:
+                sprites.append((name, pixels))
+
+    sizes = [(p.shape[1], p.shape[0]) for _, p in sprites]
+    places, pageHeights = packShelves(sizes, pageSize, pageSize, ATLAS_PADDING)
+    pages = [np.zeros((height, pageSize, 4), np.uint8) for height in pageHeights]
+    for (name, pixels), (w, h), (page, x, y) in zip(sprites, sizes, places):
+        pages[page][y:y + h, x:x + w] = pixels
+        index["atlas"]["regions"][name] = [page, x, y, w, h]
+    index["atlas"]["pages"] = [imageEntry(writer, page) for page in pages]
+    # 模版尺寸在这里算好, 运行时不再按缩小倍数换算
+    for (name, _), (w, h) in zip(sprites, sizes):
+        scale = settings.spriteScales.get(name)
+        if scale is not None:
+            index["sprites"][name] = [int(w / scale), int(h / scale)]
+
+    for directory in AUDIO_DIRECTORIES:
+        for path in sorted((ROOT / directory).iterdir()):
+            if path.is_file():
+                index["audio"][f"{directory}/{path.name}"] = audioEntry(writer, path)
+
+    writer.close(index)
+    print(f"{args.output}: {len(sprites)} sprites in {len(pages)} atlas page(s), "
+          f"{len(index['images'])} images, {len(index['audio'])} audio, "
+          f"{Path(args.output).stat().st_size / 1024 / 1024:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
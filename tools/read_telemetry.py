@@ -0,0 +1,75 @@
+# 读取遥测文件(main.py --telemetry 生成), 转成按列的 numpy 数组用于分析
+# 用法: python tools/read_telemetry.py <文件或目录>... [--npz out.npz]
+# 默认打印每个种子(每局)的事件计数、受伤/击毁统计与帧耗时分布;
+# --npz 把所有记录按列(tick, kind, arg, count, x, y, value, fileIndex, seed)存成 .npz,
+# 之后 np.load("out.npz")["value"][kind == ...] 即可直接分析
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from Telemetry import TelemetryEvent, readColumns  # noqa: E402
+
+
+def collect(paths) -> list:
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.tel")))
+        else:
+            files.append(path)
+    return files
+
+
+def summarize(columns: dict) -> None:
+    kind = columns["kind"]
+    count = columns["count"].astype(np.int64)
+    for seed in np.unique(columns["seed"]):
+        run = columns["seed"] == seed
+        ticks = columns["tick"][run & (kind != TelemetryEvent.Frame)]
+        span = f"ticks {ticks.min()}-{ticks.max()}" if ticks.size else "no gameplay events"
+        print(f"seed {seed}: {int(run.sum())} records, {span}")
+        for event in TelemetryEvent:
+            mask = run & (kind == event)
+            if mask.any():
+                print(f"  {event.name:<12}{int(mask.sum()):>8} records{int(count[mask].sum()):>8} total")
+        damage = run & (kind == TelemetryEvent.Damage)
+        if damage.any():
+            print(f"  damage taken {columns['value'][damage].sum():.0f}")
+        kills = run & (kind == TelemetryEvent.Kill)
+        if kills.any():
+            print(f"  final score {columns['value'][kills].max():.0f}")
+        frames = columns["value"][run & (kind == TelemetryEvent.Frame)]
+        if frames.size:
+            p50, p99 = np.percentile(frames, [50, 99])
+            print(f"  frame ms p50 {p50:.3f} p99 {p99:.3f} max {frames.max():.3f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", help="telemetry files or directories")
+    parser.add_argument("--npz", metavar="FILE", help="save all records as columnar arrays")
+    args = parser.parse_args()
+
+    files = collect(args.paths)
+    if not files:
+        print("no telemetry files found")
+        return 1
+    try:
+        columns = readColumns(files)
+    except (OSError, ValueError) as e:
+        print(f"failed to read telemetry: {e}")
+        return 2
+    print(f"{len(files)} files, {len(columns['kind'])} records")
+    summarize(columns)
+    if args.npz:
+        np.savez_compressed(args.npz, **columns)
+        print(f"saved columns to {args.npz}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# 无窗口回放输入录像(main.py --record 生成), 以最快速度步进模拟层, 用作可重复的性能负载
+# 用法: python tools/replay_input.py session-001.rec [--repeat N] [--top N]
+# 输出每个 tick 的耗时分布和最慢的几个 tick(录像中的序号), 用来复现卡顿;
+# 多次重复时检查每次的最终分数一致, 不一致说明模拟层引入了非确定性
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from InputRecorder import InputReplay  # noqa: E402
+from Object import GlobalObject  # noqa: E402
+from Simulation import Simulation, SimInput  # noqa: E402
+
+
+def replayOnce(replay: InputReplay) -> tuple:
+    replay.cursor = 0
+    sim = Simulation(GlobalObject(), replay.seed)
+    sim.start()
+    inputs = SimInput()
+    ticks = np.zeros(len(replay))
+    simulated = 0.0
+    for i in range(len(replay)):
+        deltaTime = replay.read(inputs)
+        start = time.perf_counter_ns()
+        sim.step(deltaTime, inputs)
+        ticks[i] = time.perf_counter_ns() - start
+        simulated += deltaTime
+    return ticks / 1e6, simulated, (sim.score, sim.tick, sim.isDead, sim.player.currentHealth)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recording")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--top", type=int, default=5, help="number of slowest ticks to list")
+    args = parser.parse_args()
+
+    replay = InputReplay.open(args.recording)
+    if replay is None:
+        return 2
+    if len(replay) == 0:
+        print("recording is empty")
+        return 0
+
+    outcomes = set()
+    for run in range(args.repeat):
+        ticks, simulated, outcome = replayOnce(replay)
+        outcomes.add(outcome)
+        wall = ticks.sum() / 1e3
+        p50, p99 = np.percentile(ticks, [50, 99])
+        print(f"run {run}: {len(ticks)} ticks, {simulated:.1f} s simulated in {wall:.2f} s "
+              f"({simulated / wall:.0f}x real time), tick p50 {p50:.3f} ms p99 {p99:.3f} ms max {ticks.max():.3f} ms, "
+              f"score {outcome[0]}")
+        slowest = np.argsort(ticks)[::-1][:args.top]
+        print("  slowest ticks: " + ", ".join(f"#{i} {ticks[i]:.3f} ms" for i in slowest))
+
+    if len(outcomes) > 1:
+        print(f"NON-DETERMINISTIC: runs ended differently {sorted(outcomes)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())